@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the cached derived properties of the class model.
+
+Builds a synthetic model (see benchmarks.model_memory) and times the Python side of
+mapping and emission: TypeMapper over every method, and the template contexts built by
+build_template_context() and ClassInfo.to_dict() for each class. Each pass runs once with
+the cached properties and once with them swapped for plain (recomputing) properties;
+every run starts from cold caches, as a generator run does.
+
+Usage (from the repository root):
+  python -m benchmarks.derived_properties --headers 200 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from benchmarks.model_memory import build_current, synthetic_records
+from gdextension_binding_generator import models
+from gdextension_binding_generator.models import ClassInfo, MethodInfo, ParameterInfo, build_template_context
+from gdextension_binding_generator.type_mapping import default_occt_mapper, supported_mapped_methods
+
+_MODEL_CLASSES = (ParameterInfo, MethodInfo, ClassInfo)
+
+
+@contextmanager
+def uncached() -> Iterator[None]:
+    """
+    Temporarily replace every cached derived property with a plain property.
+    """
+    saved = []
+    for cls in _MODEL_CLASSES:
+        for d in cls._derived_props:
+            name = d.fn.__name__
+            saved.append((cls, name, d))
+            setattr(cls, name, property(d.fn))
+    try:
+        yield
+    finally:
+        for cls, name, d in saved:
+            setattr(cls, name, d)
+
+
+def invalidate_all(classes: Sequence[ClassInfo]) -> None:
+    for ci in classes:
+        ci.invalidate()
+        for m in ci.methods:
+            m.invalidate()
+            for p in m.parameters:
+                p.invalidate()
+
+
+def mapping_pass(classes: Sequence[ClassInfo]) -> int:
+    mapper = default_occt_mapper(classes, prefix="B_")
+    return sum(len(supported_mapped_methods(mapper, ci)) for ci in classes)
+
+
+def emission_pass(classes: Sequence[ClassInfo]) -> int:
+    context = build_template_context("B_", classes)
+    return len(context["classes"]) + sum(len(ci.to_dict()["methods"]) for ci in classes)
+
+
+def timed_run(classes: Sequence[ClassInfo], repeat: int) -> Tuple[float, float]:
+    """
+    Best (mapping, emission) times over `repeat` runs, each starting from cold caches.
+    """
+    best_map = best_emit = float("inf")
+    for _ in range(repeat):
+        invalidate_all(classes)
+        start = time.perf_counter()
+        mapping_pass(classes)
+        mid = time.perf_counter()
+        emission_pass(classes)
+        end = time.perf_counter()
+        best_map = min(best_map, mid - start)
+        best_emit = min(best_emit, end - mid)
+    return best_map, best_emit
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Time mapping and emission with and without cached derived properties.")
+    p.add_argument("--headers", type=int, default=200)
+    p.add_argument("--classes-per-header", type=int, default=4)
+    p.add_argument("--methods-per-class", type=int, default=25)
+    p.add_argument("--repeat", type=int, default=3)
+    ns = p.parse_args(argv)
+
+    classes = build_current(synthetic_records(ns.headers, ns.classes_per_header, ns.methods_per_class))
+    print(f"Model: {len(classes)} class(es), {sum(len(ci.methods) for ci in classes)} method(s)")
+    with uncached():
+        plain = timed_run(classes, ns.repeat)
+    cached = timed_run(classes, ns.repeat)
+
+    print(f"{'pass':<10} {'uncached s':>11} {'cached s':>9} {'speedup':>8}")
+    for label, p_s, c_s in (("mapping", plain[0], cached[0]), ("emission", plain[1], cached[1]), ("total", sum(plain), sum(cached))):
+        print(f"{label:<10} {p_s:>11.3f} {c_s:>9.3f} {p_s / c_s:>7.2f}x")
+    print(f"({models.interned_type_count()} interned type(s))")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
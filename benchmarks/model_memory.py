@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for the parsed class model.
+
+Generates a synthetic OpenCASCADE-style header corpus, parses it once with libclang and
+flattens the result into raw records (fresh string objects, like the ones ctypes hands
+back). The model is then rebuilt twice from the same records under tracemalloc:
+- legacy: plain dataclasses with a per-instance __dict__ and one string/CppType object per
+  occurrence, i.e. the model before slots and type interning
+- current: the slotted models, with CppType.from_spelling and sys.intern used the way the
+  parser uses them
+
+Usage (from the repository root):
+  python -m benchmarks.model_memory --headers 400 --classes-per-header 4 --methods-per-class 25
+  python -m benchmarks.model_memory --no-parse   # synthesize records without libclang
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import logging
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple
+
+from gdextension_binding_generator import models
+from gdextension_binding_generator.models import BaseClassRef, ClassInfo, CppType, MethodInfo, MethodKind, ParameterInfo
+
+# (name, spelling) pairs used for synthetic parameters and return types
+_PARAM_TYPES = [
+    ("theValue", "Standard_Real"),
+    ("theIndex", "Standard_Integer"),
+    ("theFlag", "Standard_Boolean"),
+    ("thePnt", "const gp_Pnt &"),
+    ("theDir", "const gp_Dir &"),
+    ("theName", "const TCollection_AsciiString &"),
+    ("theShape", "const TopoDS_Shape &"),
+    ("theTol", "const Standard_Real"),
+    ("theData", "Standard_Address"),
+    ("theText", "const char *"),
+]
+_RETURN_TYPES = ["void", "Standard_Real", "Standard_Integer", "Standard_Boolean", "gp_Pnt", "const TopoDS_Shape &", "Standard_Transient *"]
+
+_PRELUDE = """#pragma once
+typedef double Standard_Real;
+typedef int Standard_Integer;
+typedef bool Standard_Boolean;
+typedef void* Standard_Address;
+class Standard_Transient { public: virtual ~Standard_Transient() {} };
+class gp_Pnt { public: gp_Pnt() {} Standard_Real X() const { return 0; } };
+class gp_Dir { public: gp_Dir() {} };
+class TCollection_AsciiString { public: TCollection_AsciiString() {} };
+class TopoDS_Shape { public: TopoDS_Shape() {} };
+"""
+
+
+# --------------------------
+# Legacy model mirror (no slots, no interning)
+# --------------------------
+
+@dataclass(frozen=True)
+class LegacyCppType:
+    spelling: str
+    is_const: bool = False
+    is_pointer: bool = False
+    is_reference: bool = False
+
+
+@dataclass
+class LegacyParameterInfo:
+    name: str
+    cpp_type: LegacyCppType
+    default_value: Optional[str] = None
+    is_variadic: bool = False
+
+
+@dataclass
+class LegacyMethodInfo:
+    name: str
+    return_type: LegacyCppType
+    parameters: List[LegacyParameterInfo] = field(default_factory=list)
+    is_const: bool = False
+    is_virtual: bool = False
+    is_pure_virtual: bool = False
+    is_explicit: bool = False
+    is_noexcept: bool = False
+    kind: MethodKind = MethodKind.INSTANCE
+    qualified_name: str = ""
+    usr: str = ""
+    overload_index: Optional[int] = None
+    _explicit_exposed_name: Optional[str] = None
+
+
+@dataclass
+class LegacyBaseClassRef:
+    qualified_name: str
+    is_virtual: bool = False
+    access: str = "public"
+
+
+@dataclass
+class LegacyClassInfo:
+    name: str
+    namespaces: List[str] = field(default_factory=list)
+    header: str = ""
+    cursor_usr: str = ""
+    wrapper_prefix: str = ""
+    bases: List[LegacyBaseClassRef] = field(default_factory=list)
+    methods: List[LegacyMethodInfo] = field(default_factory=list)
+
+
+def _legacy_type(spelling: str) -> LegacyCppType:
+    return LegacyCppType(spelling, "const" in spelling, "*" in spelling, "&" in spelling)
+
+
+# --------------------------
+# Corpus and records
+# --------------------------
+
+def _fresh(s: str) -> str:
+    # A new string object with the same value, as every libclang call returns one
+    return (s + "\0")[:-1]
+
+
+def write_corpus(root: Path, headers: int, classes_per_header: int, methods_per_class: int, seed: int = 0) -> List[Path]:
+    rng = random.Random(seed)
+    (root / "Bench_Prelude.hxx").write_text(_PRELUDE, encoding="utf-8")
+    paths: List[Path] = []
+    for h in range(headers):
+        lines = ["#pragma once", '#include "Bench_Prelude.hxx"']
+        for c in range(classes_per_header):
+            lines.append(f"class Bench{h}_Class{c} : public Standard_Transient {{\npublic:")
+            lines.append(f"  Bench{h}_Class{c}();")
+            for m in range(methods_per_class):
+                ret = rng.choice(_RETURN_TYPES)
+                params = ", ".join(f"{t} {n}{i}" for i, (n, t) in enumerate(rng.sample(_PARAM_TYPES, rng.randint(0, 4))))
+                const = " const" if rng.random() < 0.4 else ""
+                lines.append(f"  {ret} Method{m}({params}){const};")
+            lines.append("};")
+        path = root / f"Bench{h}.hxx"
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def records_from_classes(classes: List[ClassInfo]) -> List[Tuple[Any, ...]]:
+    return [
+        (
+            _fresh(ci.name), [_fresh(n) for n in ci.namespaces], _fresh(ci.header), _fresh(ci.cursor_usr), _fresh(ci.wrapper_prefix),
+            [(_fresh(b.qualified_name), b.is_virtual, _fresh(b.access)) for b in ci.bases],
+            [
+                (
+                    _fresh(m.name), m.kind, _fresh(m.return_type.spelling), m.is_const, m.is_virtual, _fresh(m.qualified_name), _fresh(m.usr),
+                    [(_fresh(p.name), _fresh(p.cpp_type.spelling)) for p in m.parameters],
+                )
+                for m in ci.methods
+            ],
+        )
+        for ci in classes
+    ]
+
+
+def synthetic_records(headers: int, classes_per_header: int, methods_per_class: int, seed: int = 0) -> List[Tuple[Any, ...]]:
+    rng = random.Random(seed)
+    records = []
+    for h in range(headers):
+        for c in range(classes_per_header):
+            name = f"Bench{h}_Class{c}"
+            methods = []
+            for m in range(methods_per_class):
+                params = [(_fresh(f"{n}{i}"), _fresh(t)) for i, (n, t) in enumerate(rng.sample(_PARAM_TYPES, rng.randint(0, 4)))]
+                methods.append((
+                    _fresh(f"Method{m}"), MethodKind.INSTANCE, _fresh(rng.choice(_RETURN_TYPES)), rng.random() < 0.4, False,
+                    _fresh(f"{name}::Method{m}"), _fresh(f"c:@S@{name}@F@Method{m}#"), params,
+                ))
+            records.append((
+                _fresh(name), [], _fresh(f"/corpus/Bench{h}.hxx"), _fresh(f"c:@S@{name}"), _fresh("B_"),
+                [(_fresh("Standard_Transient"), False, _fresh("public"))], methods,
+            ))
+    return records
+
+
+# --------------------------
+# Builders
+# --------------------------
+
+def build_legacy(records: List[Tuple[Any, ...]]) -> List[LegacyClassInfo]:
+    out = []
+    for name, namespaces, header, usr, prefix, bases, methods in records:
+        out.append(LegacyClassInfo(
+            name=name, namespaces=list(namespaces), header=header, cursor_usr=usr, wrapper_prefix=prefix,
+            bases=[LegacyBaseClassRef(qn, v, a) for qn, v, a in bases],
+            methods=[
+                LegacyMethodInfo(
+                    name=mname, return_type=_legacy_type(ret), kind=kind, is_const=is_const, is_virtual=is_virtual,
+                    qualified_name=qn, usr=musr,
+                    parameters=[LegacyParameterInfo(pname, _legacy_type(pt)) for pname, pt in params],
+                )
+                for mname, kind, ret, is_const, is_virtual, qn, musr, params in methods
+            ],
+        ))
+    return out
+
+
+def build_current(records: List[Tuple[Any, ...]]) -> List[ClassInfo]:
+    out = []
+    for name, namespaces, header, usr, prefix, bases, methods in records:
+        out.append(ClassInfo(
+            name=name, namespaces=list(namespaces), header=header, cursor_usr=usr, wrapper_prefix=prefix,
+            bases=[BaseClassRef(qn, v, a) for qn, v, a in bases],
+            methods=[
+                MethodInfo(
+                    name=sys.intern(mname), return_type=CppType.from_spelling(ret), kind=kind, is_const=is_const, is_virtual=is_virtual,
+                    qualified_name=qn, usr=musr,
+                    parameters=[ParameterInfo(sys.intern(pname), CppType.from_spelling(pt)) for pname, pt in params],
+                )
+                for mname, kind, ret, is_const, is_virtual, qn, musr, params in methods
+            ],
+        ))
+    return out
+
+
+def measure(build: Callable[[List[Tuple[Any, ...]]], List[Any]], records: List[Tuple[Any, ...]]) -> Tuple[int, int, float]:
+    """
+    Build the model under tracemalloc; returns (peak bytes, retained bytes, seconds).
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build(records)
+    elapsed = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak, retained, elapsed
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Compare peak memory of the legacy and current class models.")
+    p.add_argument("--headers", type=int, default=400)
+    p.add_argument("--classes-per-header", type=int, default=4)
+    p.add_argument("--methods-per-class", type=int, default=25)
+    p.add_argument("--jobs", type=int, default=1, help="Parse jobs for the corpus.")
+    p.add_argument("--no-parse", action="store_true", help="Synthesize records instead of parsing a corpus with libclang.")
+    ns = p.parse_args(argv)
+    logging.basicConfig(level=logging.ERROR)
+
+    if ns.no_parse:
+        records = synthetic_records(ns.headers, ns.classes_per_header, ns.methods_per_class)
+    else:
+        from gdextension_binding_generator.parsing.clang_parser import collect_classes_from_headers
+
+        with tempfile.TemporaryDirectory(prefix="gdextension-bench-") as tmp:
+            root = Path(tmp)
+            headers = write_corpus(root, ns.headers, ns.classes_per_header, ns.methods_per_class)
+            start = time.perf_counter()
+            classes = collect_classes_from_headers(
+                headers, ["-xc++", "-std=c++17", f"-I{root}"], include_filters=[str(root)], prefix="B_", emit_diagnostics=False, jobs=ns.jobs,
+            )
+            print(f"Parsed {len(headers)} header(s) into {len(classes)} class(es) in {time.perf_counter() - start:.2f}s")
+            records = records_from_classes(classes)
+            del classes
+    # Start the current model from an empty intern table, as a fresh run would
+    models._TYPE_TABLE.clear()
+    models._SPELLING_TABLE.clear()
+    gc.collect()
+
+    methods = sum(len(r[6]) for r in records)
+    params = sum(len(m[7]) for r in records for m in r[6])
+    print(f"Model: {len(records)} class(es), {methods} method(s), {params} parameter(s)")
+
+    legacy_peak, legacy_kept, legacy_s = measure(build_legacy, records)
+    current_peak, current_kept, current_s = measure(build_current, records)
+    mib = float(1 << 20)
+    print(f"{'model':<8} {'peak MiB':>10} {'retained MiB':>13} {'build s':>8}")
+    print(f"{'legacy':<8} {legacy_peak / mib:>10.2f} {legacy_kept / mib:>13.2f} {legacy_s:>8.2f}")
+    print(f"{'current':<8} {current_peak / mib:>10.2f} {current_kept / mib:>13.2f} {current_s:>8.2f}")
+    print(f"Peak memory drop: {100.0 * (1 - current_peak / legacy_peak):.1f}% ({models.interned_type_count()} interned type(s))")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark for identifier sanitization.
+
+Compares the previous utils.sanitize_identifier (reserved words rebuilt as a list on
+every call, character-by-character snake_case conversion) with naming.sanitize_identifier,
+both without its LRU cache and with it. The workload is the stream of names a generator
+run sanitizes: every method and parameter name of a synthetic model (see
+benchmarks.model_memory), once for the model, once for the emitter and once more for the
+`sanitize` template filter. Results of both implementations are checked to be identical.
+
+Usage (from the repository root):
+  python -m benchmarks.naming --headers 400 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from typing import Callable, List, Optional
+
+from benchmarks.model_memory import synthetic_records
+from gdextension_binding_generator.naming import clear_naming_cache, naming_cache_info, sanitize_identifier
+
+_LEGACY_GODOT_RESERVED = {
+    "class", "enum", "struct", "union", "template", "operator", "signal", "var", "const", "static",
+    "void", "int", "float", "bool", "true", "false", "self", "super", "_init", "_ready", "_process",
+    "_physics_process", "throw",
+}
+
+
+def legacy_camel_to_snake(name: str) -> str:
+    out: List[str] = []
+    prev_lower = False
+    prev_char = ""
+    for ch in name:
+        if ch.isupper() and (prev_lower or (prev_char and prev_char.isalpha() and prev_char != "_")):
+            out.append("_")
+        out.append(ch.lower())
+        prev_lower = ch.islower()
+        prev_char = ch
+    return "".join(out)
+
+
+def legacy_sanitize_identifier(name: str) -> str:
+    snake = legacy_camel_to_snake(name or "identifier")
+    ident = "".join(ch if ch.isalnum() or ch == "_" else "_" for ch in snake) or "_"
+    if ident[0].isdigit():
+        ident = f"_{ident}"
+    cpp_reserved = [
+        "alignas", "alignof", "and", "and_eq", "asm", "auto", "bitand", "bitor", "bool", "break", "case",
+        "catch", "char", "char8_t", "char16_t", "char32_t", "class", "compl", "const", "consteval",
+        "constexpr", "constinit", "const_cast", "continue", "co_await", "co_return", "co_yield",
+        "decltype", "default", "delete", "do", "double", "dynamic_cast", "else", "enum", "explicit",
+        "export", "extern", "false", "float", "for", "friend", "goto", "if", "inline", "int", "long",
+        "mutable", "namespace", "new", "noexcept", "not", "not_eq", "nullptr", "operator", "or", "or_eq",
+        "private", "protected", "public", "register", "reinterpret_cast", "return", "short", "signed",
+        "sizeof", "static", "static_assert", "static_cast", "struct", "switch", "template", "this",
+        "thread_local", "throw", "true", "try", "typedef", "typeid", "typename", "union", "unsigned",
+        "using", "virtual", "void", "volatile", "wchar_t", "while", "xor", "xor_eq",
+        "signal", "var", "self", "super", "_init", "_ready", "_process", "_physics_process",
+    ] + list(_LEGACY_GODOT_RESERVED)
+    if ident in cpp_reserved:
+        ident = f"{ident}_"
+    return ident
+
+
+def workload(headers: int, classes_per_header: int, methods_per_class: int) -> List[str]:
+    names: List[str] = []
+    for record in synthetic_records(headers, classes_per_header, methods_per_class):
+        for method in record[6]:
+            names.append(method[0])
+            names.extend(pname for pname, _ in method[7])
+    # Model (exposed names, D_METHOD args), emitter and template filter each sanitize them
+    return names * 3
+
+
+def best_of(repeat: int, fn: Callable[[str], str], names: List[str], reset: Optional[Callable[[], None]] = None) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        if reset is not None:
+            reset()
+        start = time.perf_counter()
+        for n in names:
+            fn(n)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Compare the legacy and cached identifier sanitizers.")
+    p.add_argument("--headers", type=int, default=400)
+    p.add_argument("--classes-per-header", type=int, default=4)
+    p.add_argument("--methods-per-class", type=int, default=25)
+    p.add_argument("--repeat", type=int, default=3)
+    ns = p.parse_args(argv)
+
+    names = workload(ns.headers, ns.classes_per_header, ns.methods_per_class)
+    mismatches = [n for n in set(names) if legacy_sanitize_identifier(n) != sanitize_identifier(n)]
+    if mismatches:
+        print(f"Implementations disagree on {len(mismatches)} name(s), e.g. {mismatches[:5]}")
+        return 1
+    print(f"Workload: {len(names)} call(s), {len(set(names))} distinct name(s)")
+
+    legacy = best_of(ns.repeat, legacy_sanitize_identifier, names)
+    uncached = best_of(ns.repeat, sanitize_identifier.__wrapped__, names)
+    cached = best_of(ns.repeat, sanitize_identifier, names, reset=clear_naming_cache)
+    info = naming_cache_info()
+
+    print(f"{'implementation':<16} {'seconds':>8} {'speedup':>8}")
+    for label, seconds in (("legacy", legacy), ("naming, no cache", uncached), ("naming, cached", cached)):
+        print(f"{label:<16} {seconds:>8.3f} {legacy / seconds:>7.1f}x")
+    print(f"Cache: {info['hits']} hit(s), {info['misses']} miss(es) in the last run")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Index of the class wrappers emitted into an output directory, for incremental emission.
+
+For every class the index records a fingerprint of everything that shapes its wrapper,
+and the files written for it. The fingerprint combines the class's structural digest
+(fingerprint.class_fingerprint) with the wrapped classes its mapping depends on
+(TypeMapper.wrapped_dependency_key). Everything shared by all classes of a run forms the
+settings key of the index: emitter and mapping configs, prefix, the sources of all
+templates and the generator (fingerprint.generator_fingerprint). When the settings key
+changes, every class is emitted again; otherwise a class whose fingerprint matches its
+entry, and whose files still exist, is neither mapped nor rendered.
+
+Entries are keyed by class identity (see class_identity), not by wrapper name: distinct
+classes can map to the same wrapper name, e.g. nested E1::Iterator and E2::Iterator. Such
+classes write the same files, whose final contents come from the last of them, so the
+emitter never reuses them (see GodotVariantEmitter).
+
+The index is stored as JSON in <output_dir>/.gdext-emit-index.json. It is removed when
+loaded and written again, atomically, once the run's classes have been emitted, with the
+entries of those classes only; an interrupted run therefore leaves no index behind and
+the next run emits everything.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+import logging
+
+from .fingerprint import fingerprint_parts, fingerprint_text, generator_fingerprint
+from .models import ClassInfo
+from .utils import atomic_write_bytes
+
+logger = logging.getLogger(__name__)
+
+# Bump when the layout of the index or the meaning of its fingerprints changes
+EMIT_INDEX_FORMAT_VERSION = 2
+
+EMIT_INDEX_FILENAME = ".gdext-emit-index.json"
+
+
+def emit_settings_key(settings: Mapping[str, Any]) -> str:
+    """
+    Settings key of an emission run: a digest of `settings` (values are compared by
+    their str()), the index format and the generator fingerprint.
+    """
+    payload = dict(settings)
+    payload["format"] = EMIT_INDEX_FORMAT_VERSION
+    payload["generator"] = generator_fingerprint()
+    return fingerprint_text(json.dumps(payload, sort_keys=True, default=str))
+
+
+def class_identity(ci: ClassInfo) -> str:
+    """
+    Key of a class in the index: its USR, or its qualified name when it has none.
+    """
+    return ci.cursor_usr or ci.qualified_name
+
+
+class EmitIndex:
+    """
+    Per-class fingerprints and output files of the previous run in `output_dir`.
+
+    Usage:
+        index = EmitIndex.open(output_dir, settings_key)
+        if not index.reuse(class_identity(ci), fingerprint):
+            index.record(class_identity(ci), fingerprint, emit(ci))
+        index.save()
+    """
+
+    def __init__(self, output_dir: Path, settings: str, previous: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+        self.output_dir = Path(output_dir)
+        self.path = self.output_dir / EMIT_INDEX_FILENAME
+        self.settings = settings
+        self._previous: Dict[str, Dict[str, Any]] = previous or {}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self.reused = 0
+        self.emitted = 0
+
+    @classmethod
+    def open(cls, output_dir: Path, settings: str) -> "EmitIndex":
+        """
+        Load (and remove) the index in `output_dir`. A missing, unreadable or outdated
+        index, or one written with different settings, yields an empty one.
+        """
+        index = cls(output_dir, settings)
+        try:
+            with open(index.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            index.path.unlink()
+        except FileNotFoundError:
+            return index
+        except Exception as ex:
+            logger.debug("Ignoring unreadable emit index %s: %s", index.path, ex)
+            return index
+        if not isinstance(data, dict) or data.get("format") != EMIT_INDEX_FORMAT_VERSION:
+            return index
+        if data.get("settings") != settings:
+            logger.info("Templates, mapping settings or generator changed; emitting all classes")
+            return index
+        classes = data.get("classes")
+        index._previous = classes if isinstance(classes, dict) else {}
+        return index
+
+    @staticmethod
+    def class_key(class_fingerprint: str, dependency_key: str) -> str:
+        return fingerprint_parts((class_fingerprint, dependency_key))
+
+    def reuse(self, ident: str, fingerprint: str) -> bool:
+        """
+        Keep the previous entry of class `ident` if its fingerprint matches and all of its files
+        still exist; returns whether the class can be skipped.
+        """
+        entry = self._previous.get(ident)
+        if entry is None or entry.get("fingerprint") != fingerprint:
+            return False
+        if not all((self.output_dir / f).is_file() for f in entry.get("files", [])):
+            return False
+        self._entries[ident] = entry
+        self.reused += 1
+        return True
+
+    def files(self, ident: str) -> List[Path]:
+        """
+        Files of the current entry of class `ident`.
+        """
+        entry = self._entries.get(ident) or {}
+        return [self.output_dir / f for f in entry.get("files", [])]
+
+    def record(self, ident: str, fingerprint: str, files: Iterable[Path]) -> None:
+        """
+        Record the files just written for class `ident` (an empty list when no wrapper
+        was emitted).
+        """
+        self._entries[ident] = {
+            "fingerprint": fingerprint,
+            "files": [Path(f).relative_to(self.output_dir).as_posix() for f in files],
+        }
+        self.emitted += 1
+
+    def save(self) -> None:
+        data = {"format": EMIT_INDEX_FORMAT_VERSION, "settings": self.settings, "classes": self._entries}
+        try:
+            atomic_write_bytes(self.path, json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+        except Exception as ex:
+            logger.warning("Failed to write emit index %s: %s", self.path, ex)
+
+
+__all__ = [
+    "EMIT_INDEX_FILENAME",
+    "EMIT_INDEX_FORMAT_VERSION",
+    "EmitIndex",
+    "class_identity",
+    "emit_settings_key",
+]
@@ -14,23 +14,50 @@ Outputs:
 - <output_dir>/register_types.cpp (using existing template)
 - <output_dir>/classes/<WrapperName>.h (mapped signatures)
 - <output_dir>/classes/<WrapperName>.cpp (mapped implementations and conversions)
+
+With jobs > 1, class wrappers are rendered and written on a process pool. Workers get
+the generation context, emitter config and mapper settings once, then one chunk of
+ClassInfo objects per task; their log records are replayed in class order, so the log
+and the outputs are the same as in a serial run. Classes that share a wrapper name with
+another class (and thus its files) are emitted by the parent after the pool, in class
+order, so their log messages come last. The class templates are compiled once
+by the parent into the renderer's bytecode cache (or a temporary one), which the workers
+load instead of compiling them again.
+
+With incremental=True, an EmitIndex in the output directory records a fingerprint of each
+class's inputs (class model, wrapped classes it refers to, configs, templates, generator
+version); classes whose fingerprint is unchanged and whose files exist are skipped
+without mapping or rendering. Classes sharing a wrapper name are always emitted.
+
+Files are written through an OutputWriter (see utils.py); workers write with their own
+copy of its index and hand their index entries and pending syncs back with each chunk.
 """
 
 from __future__ import annotations
 
+from collections import Counter, deque
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import List, Optional, Sequence, Tuple
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Tuple
+import contextlib
 import logging
+import multiprocessing
 import re
+import tempfile
 
-from ..models import ClassInfo, MethodInfo, MethodKind, build_template_context
-from ..utils import TemplateRenderer, ensure_dir, write_text, sanitize_identifier
+from ..emit_index import EmitIndex, class_identity, emit_settings_key
+from ..fingerprint import class_fingerprint
+from ..models import ClassInfo, ClassView, GenerationContext, MethodInfo, build_template_context
+from ..utils import OutputIndex, OutputWriter, SyncPolicy, TemplateRenderer, ensure_dir, sanitize_identifier
 from ..type_mapping import (
     TypeMapper,
     default_occt_mapper,
     MappedKind,
     MappedMethod,
     MappedParameter,
+    MappingConfig,
+    MappingStats,
 )
 
 logger = logging.getLogger(__name__)
@@ -64,8 +91,15 @@ class GodotVariantEmitter:
     Emit Godot GDExtension wrapper code using TypeMapper to ensure Variant-compatible API.
 
     Usage:
-        emitter = GodotVariantEmitter(ctx, renderer, config=config, mapper=mapper)
+        emitter = GodotVariantEmitter(ctx, renderer, config=config, mapper=mapper, jobs=4)
         emitter.emit(all_classes)
+
+    With jobs > 1, worker processes build their own TemplateRenderer from the renderer's
+    templates_dir and a plain TypeMapper from the mapper's known wrapped classes and
+    config. With incremental=True, classes unchanged since the previous run into the same
+    output directory are skipped (see emit_index.py). Files go through `writer` (default:
+    a plain OutputWriter without index or syncs), which emit() closes at the end, pruning
+    stale outputs according to the writer's prune mode.
     """
 
     def __init__(
@@ -74,11 +108,17 @@ class GodotVariantEmitter:
         renderer: TemplateRenderer,
         config: Optional[VariantEmitterConfig] = None,
         mapper: Optional[TypeMapper] = None,
+        jobs: int = 1,
+        incremental: bool = False,
+        writer: Optional[OutputWriter] = None,
     ) -> None:
         self.ctx = ctx
         self.renderer = renderer
         self.config = config or VariantEmitterConfig()
         self._mapper = mapper  # Can be None; if so, built in emit()
+        self.jobs = max(1, jobs)
+        self.incremental = incremental
+        self.writer = writer or OutputWriter()
 
     # ---- Public API ----
 
@@ -95,14 +135,35 @@ class GodotVariantEmitter:
         # Emit register_types using existing templates (class list unaffected by mapping)
         self._emit_register_types(classes)
 
-        # Emit class wrappers
-        for ci in classes:
-            self._emit_class(ci, mapper)
-
+        # Emit class wrappers, mapped a batch at a time so a lazy class sequence
+        # (ClassRows) is never loaded whole
+        index = self._open_index(mapper) if self.incremental and not self.ctx.dry_run else None
+        shared = _shared_wrapper_names(classes)
+        if self.jobs > 1 and len(classes) > 1:
+            self._emit_classes_parallel(classes, mapper, index, shared)
+        else:
+            self._emit_in_process(_pending_classes(classes, mapper, index, shared, self.writer), mapper, index)
+        if not self.ctx.dry_run:
+            self.writer.close()
+        if index is not None:
+            index.save()
+            logger.info("Incremental emission: %d class(es) emitted, %d unchanged", index.emitted, index.reused)
+
+        logger.info("Type mapping: %s", mapper.stats.summary())
+        mapper.log_rule_hits(partial=index is not None and index.reused > 0)
         logger.info("Variant-aware generation complete under: %s", self.ctx.output_dir)
 
     # ---- Internals ----
 
+    def _open_index(self, mapper: TypeMapper) -> EmitIndex:
+        settings = emit_settings_key({
+            "emitter": repr(self.config),
+            "mapping": repr(mapper.config),
+            "prefix": self.ctx.prefix,
+            "templates": self.renderer.template_digest(_CLASS_TEMPLATES),
+        })
+        return EmitIndex.open(self.ctx.output_dir, settings)
+
     def _emit_register_types(self, classes: Sequence[ClassInfo]) -> None:
         """
         Render and write register_types.h/.cpp using the configured templates.
@@ -111,27 +172,100 @@ class GodotVariantEmitter:
         header_content = self.renderer.render(self.config.register_types_header_template, context)
         source_content = self.renderer.render(self.config.register_types_source_template, context)
 
-        write_text(self.ctx.output_dir / "register_types.h", header_content, dry_run=self.ctx.dry_run)
-        write_text(self.ctx.output_dir / "register_types.cpp", source_content, dry_run=self.ctx.dry_run)
+        self.writer.write_text(self.ctx.output_dir / "register_types.h", header_content, dry_run=self.ctx.dry_run)
+        self.writer.write_text(self.ctx.output_dir / "register_types.cpp", source_content, dry_run=self.ctx.dry_run)
+
+    def _emit_classes_parallel(
+        self,
+        classes: Sequence[ClassInfo],
+        mapper: TypeMapper,
+        index: Optional[EmitIndex] = None,
+        shared: FrozenSet[str] = frozenset(),
+    ) -> None:
+        """
+        Emit class wrappers on a process pool, replaying worker logs in class order and
+        adding the workers' mapping statistics and rule hits to `mapper`. With an index,
+        unchanged classes are filtered out in the parent and never sent to a worker.
 
-    def _emit_class(self, ci: ClassInfo, mapper: TypeMapper) -> None:
+        Classes whose wrapper name is in `shared` write the same files as another class;
+        the parent emits them itself after the pool, in class order, so the last of them
+        wins as in a serial run.
         """
-        Generate mapped header and source for a single class.
+        workers = min(self.jobs, len(classes))
+        # Small chunks keep the pool balanced while amortizing IPC per class
+        chunksize = max(1, min(_EMIT_MAX_CHUNK, len(classes) // (workers * 8)))
+        level = logging.getLogger(_PACKAGE_LOGGER).getEffectiveLevel()
+        with contextlib.ExitStack() as stack:
+            # Compile the class templates once; workers load the cached bytecode
+            cache_dir = self.renderer.bytecode_cache_dir
+            if cache_dir is not None:
+                self.renderer.precompile(_CLASS_TEMPLATES)
+            else:
+                cache_dir = Path(stack.enter_context(tempfile.TemporaryDirectory(prefix="gdext-templates-")))
+                TemplateRenderer(self.renderer.templates_dir, bytecode_cache_dir=cache_dir).precompile(_CLASS_TEMPLATES)
+            ex = stack.enter_context(ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context(),
+                initializer=_init_emit_worker,
+                initargs=(
+                    self.ctx, self.config, dict(mapper.known_wrapped), mapper.config, level, self.renderer.templates_dir, cache_dir,
+                    self.writer.index.entries if self.writer.index is not None else None, self.writer.fsync, self.writer.dir_sync,
+                ),
+            ))
+            held: List[Tuple[ClassInfo, Optional[str]]] = []
+
+            def pooled() -> Iterator[Tuple[ClassInfo, Optional[str]]]:
+                for item in _pending_classes(classes, mapper, index, shared, self.writer):
+                    if item[0].wrapper_name in shared:
+                        held.append(item)
+                    else:
+                        yield item
+
+            results = _ordered_results(ex, _emit_chunk_in_worker, _chunks(pooled(), chunksize), window=workers * 4)
+            for records, stats, hits, outputs, written in results:
+                for record in records:
+                    logging.getLogger(record.name).handle(record)
+                mapper.stats.add(stats)
+                mapper.rules.add_hits(hits)
+                self.writer.merge(*written)
+                if index is not None:
+                    for ident, key, files in outputs:
+                        index.record(ident, key, files)
+        self._emit_in_process(held, mapper, index)
+        logger.debug("Emitted %d class(es) on %d worker process(es)", len(classes), workers)
+
+    def _emit_in_process(
+        self,
+        items: Iterable[Tuple[ClassInfo, Optional[str]]],
+        mapper: TypeMapper,
+        index: Optional[EmitIndex],
+    ) -> None:
         """
-        # Filter and map methods
+        Map and emit (class, fingerprint) items in this process, a batch at a time.
+        """
+        for batch in _chunks(items, _MAP_BATCH_SIZE):
+            for (ci, key), mapped in zip(batch, mapper.map_classes([ci for ci, _ in batch])):
+                files = self._emit_class(ci, mapper, mapped)
+                if index is not None:
+                    index.record(class_identity(ci), key, files)
+
+    def _emit_class(self, ci: ClassInfo, mapper: TypeMapper, mapped: List[MappedMethod]) -> List[Path]:
+        """
+        Generate mapped header and source for a single class; `mapped` is
+        mapper.map_class(ci). Returns the paths written (none when the class is skipped).
+        """
+        # Filter mapped methods
         mapped_instance: List[MappedMethod] = []
         mapped_static: List[MappedMethod] = []
 
-        for m in ci.methods:
-            if m.kind in (MethodKind.CONSTRUCTOR, MethodKind.DESTRUCTOR):
-                continue
-            mm = mapper.map_method(ci, m)
+        for mm in mapped:
             if not mm.supported:
-                logger.debug("Skipping unsupported method: %s::%s (%s)", ci.qualified_name, m.name, mm.reason or "")
+                logger.debug("Skipping unsupported method: %s::%s (%s)", ci.qualified_name, mm.method_name, mm.reason or "")
                 continue
-            if m.kind == MethodKind.STATIC and self.config.emit_static_methods:
-                mapped_static.append(mm)
-            elif m.kind in (MethodKind.INSTANCE, MethodKind.OPERATOR):
+            if mm.is_static:
+                if self.config.emit_static_methods:
+                    mapped_static.append(mm)
+            else:
                 mapped_instance.append(mm)
 
         # Constructors: map parameters only and emit construct wrappers if enabled
@@ -146,7 +280,7 @@ class GodotVariantEmitter:
 
         if not mapped_instance and not mapped_static and not mapped_ctors and not self.config.emit_empty_classes:
             logger.info("No supported methods for %s; skipping wrapper generation", ci.qualified_name)
-            return
+            return []
 
         # Build variant mapping structure for templates
         variant = {
@@ -226,14 +360,16 @@ class GodotVariantEmitter:
                 "call_expr": None,
             })
 
-        context = {"cls": ci.to_dict(), "prefix": self.ctx.prefix, "variant": variant}
-        header_text = self.renderer.render("variant_class_header.h.j2", context)
-        source_text = self.renderer.render("variant_class_source.cpp.j2", context)
-
+        context = {"cls": ClassView(ci), "prefix": self.ctx.prefix, "variant": variant}
+        header_template, source_template = _CLASS_TEMPLATES
+        header_text = self.renderer.render(header_template, context)
+        source_text = self.renderer.render(source_template, context)
 
-
-        write_text(self.ctx.classes_dir / f"{ci.wrapper_name}.h", header_text, dry_run=self.ctx.dry_run)
-        write_text(self.ctx.classes_dir / f"{ci.wrapper_name}.cpp", source_text, dry_run=self.ctx.dry_run)
+        header_path = self.ctx.classes_dir / f"{ci.wrapper_name}.h"
+        source_path = self.ctx.classes_dir / f"{ci.wrapper_name}.cpp"
+        self.writer.write_text(header_path, header_text, dry_run=self.ctx.dry_run)
+        self.writer.write_text(source_path, source_text, dry_run=self.ctx.dry_run)
+        return [header_path, source_path]
 
     # ---- Parameter mapping helpers ----
 
@@ -277,6 +413,159 @@ class GodotVariantEmitter:
 
         return params_sig, pre_lines, arg_exprs, d_method_args
 
+# Classes mapped per TypeMapper.map_classes() call
+_MAP_BATCH_SIZE = 64
+
+
+def _chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    chunk: List[Any] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# --------------------------
+# Parallel emission
+# --------------------------
+
+_PACKAGE_LOGGER = "gdextension_binding_generator"
+
+# Per-class header and source templates
+_CLASS_TEMPLATES: Tuple[str, str] = ("variant_class_header.h.j2", "variant_class_source.cpp.j2")
+
+# Upper bound on the classes sent to a worker per task
+_EMIT_MAX_CHUNK = 16
+
+# Emitter and log capture of a worker process (set by _init_emit_worker)
+_WORKER_EMITTER: Optional[GodotVariantEmitter] = None
+_WORKER_LOG: Optional["_LogCapture"] = None
+
+
+class _LogCapture(logging.Handler):
+    """
+    Keeps a worker's log records for the parent to replay. Messages are formatted in the
+    worker, since their arguments are not necessarily picklable.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: List[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        self.records.append(record)
+
+    def drain(self) -> List[logging.LogRecord]:
+        records, self.records = self.records, []
+        return records
+
+
+def _init_emit_worker(
+    ctx: GenerationContext,
+    config: VariantEmitterConfig,
+    known_wrapped: Dict[str, str],
+    mapping_config: MappingConfig,
+    log_level: int,
+    templates_dir: Optional[Path],
+    bytecode_cache_dir: Optional[Path],
+    output_index: Optional[Dict[str, Tuple[int, int, str]]],
+    fsync: SyncPolicy,
+    dir_sync: SyncPolicy,
+) -> None:
+    """
+    ProcessPoolExecutor initializer: build the worker's emitter and route the package's
+    log records into a capture handler instead of the inherited console handlers.
+    """
+    global _WORKER_EMITTER, _WORKER_LOG
+    _WORKER_LOG = _LogCapture()
+    pkg_logger = logging.getLogger(_PACKAGE_LOGGER)
+    for h in list(pkg_logger.handlers):
+        pkg_logger.removeHandler(h)
+    pkg_logger.addHandler(_WORKER_LOG)
+    pkg_logger.setLevel(log_level)
+    pkg_logger.propagate = False
+    mapper = TypeMapper(known_wrapped, config=mapping_config)
+    renderer = TemplateRenderer(templates_dir, bytecode_cache_dir=bytecode_cache_dir)
+    index = OutputIndex(ctx.output_dir, output_index) if output_index is not None else None
+    writer = OutputWriter(index, fsync=fsync, dir_sync=dir_sync)
+    _WORKER_EMITTER = GodotVariantEmitter(ctx, renderer, config=config, mapper=mapper, writer=writer)
+
+
+def _emit_chunk_in_worker(
+    chunk: List[Tuple[ClassInfo, Optional[str]]],
+) -> Tuple[List[logging.LogRecord], MappingStats, Dict[str, int], List[Tuple[str, Optional[str], List[Path]]], Tuple[Any, ...]]:
+    """
+    Emit a chunk of (class, fingerprint) items; returns the captured log records, the
+    mapping statistics and rule hits accumulated since the previous chunk, the
+    (identity, fingerprint, files) of each class and what the worker's OutputWriter
+    drained (index entries, pending syncs, produced files).
+    """
+    emitter = _WORKER_EMITTER
+    mapper = emitter._mapper
+    mapped_classes = mapper.map_classes([ci for ci, _ in chunk])
+    outputs = [(class_identity(ci), key, emitter._emit_class(ci, mapper, mapped)) for (ci, key), mapped in zip(chunk, mapped_classes)]
+    stats, mapper.stats = mapper.stats, MappingStats()
+    hits, mapper.rules.hits = mapper.rules.hits, dict.fromkeys(mapper.rules.hits, 0)
+    return _WORKER_LOG.drain(), stats, hits, outputs, emitter.writer.drain()
+
+
+def _shared_wrapper_names(classes: Sequence[ClassInfo]) -> FrozenSet[str]:
+    """
+    Wrapper names that more than one of `classes` maps to. Index-backed class lists
+    provide the names without loading every class.
+    """
+    wrapper_names = getattr(classes, "wrapper_names", None)
+    counts = Counter(wrapper_names() if wrapper_names else (ci.wrapper_name for ci in classes))
+    return frozenset(name for name, n in counts.items() if n > 1)
+
+
+def _pending_classes(
+    classes: Iterable[ClassInfo],
+    mapper: TypeMapper,
+    index: Optional[EmitIndex],
+    shared: FrozenSet[str],
+    writer: OutputWriter,
+) -> Iterator[Tuple[ClassInfo, Optional[str]]]:
+    """
+    Yield (class, fingerprint) for the classes to emit: all of them without an index
+    (fingerprint None), otherwise those the index cannot reuse. The files of reused
+    classes are kept in `writer`. Classes with a shared wrapper name are never reused,
+    since their files also depend on the other classes of that name.
+    """
+    for ci in classes:
+        if index is None:
+            yield ci, None
+            continue
+        key = EmitIndex.class_key(class_fingerprint(ci), mapper.wrapped_dependency_key(ci))
+        ident = class_identity(ci)
+        if ci.wrapper_name not in shared and index.reuse(ident, key):
+            writer.keep(index.files(ident))
+        else:
+            yield ci, key
+
+
+def _ordered_results(ex: Executor, fn: Callable[[Any], Any], items: Iterable[Any], window: int) -> Iterator[Any]:
+    """
+    Like Executor.map, but with at most `window` tasks in flight, so lazily loaded class
+    sequences are not materialized all at once.
+    """
+    pending: Deque[Any] = deque()
+    for item in items:
+        pending.append(ex.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
 # ---- Utilities ----
 
 def collect_forward_decl_wrappers(
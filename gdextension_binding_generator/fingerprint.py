@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Stable fingerprints for signatures, model objects and files.
+
+All fingerprints are blake2b digests (hashlib, no external dependencies) and are stable
+across processes, machines and Python versions, unlike hash(). They are used as cache
+keys, for change detection of parsed classes and files, and for short disambiguating
+suffixes.
+
+- fingerprint_text/fingerprint_bytes: hex digest of a string or buffer
+- method_fingerprint/class_fingerprint: structural digest over every field of a
+  MethodInfo/ClassInfo (types, parameters, flags, bases, ...); values derived from the
+  fields are not hashed. A class digest covers the digests of its methods
+- file_digest/file_digests: digest of file contents, read through mmap; file_digests
+  hashes many files on a thread pool (hashlib releases the GIL on large buffers)
+- generator_fingerprint: digest of the generator's version and Python sources, shared by
+  every cache key that must change with the generator
+- stable_signature_hash: short base36 signature hash, blake2b by default; compat mode
+  keeps the FNV-1a 32-bit values produced by earlier versions and is only used for
+  MethodInfo.signature_hash, so the manifest is unchanged
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence
+
+if TYPE_CHECKING:
+    from .models import ClassInfo, CppType, MethodInfo
+
+# Digest size in bytes (hex digests are twice as long)
+DIGEST_SIZE = 16
+
+_BASE36 = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def _new_hash():
+    return hashlib.blake2b(digest_size=DIGEST_SIZE)
+
+
+def fingerprint_bytes(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=DIGEST_SIZE).hexdigest()
+
+
+def fingerprint_text(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=DIGEST_SIZE).hexdigest()
+
+
+def fingerprint_parts(parts: Iterable[str]) -> str:
+    """
+    Digest of a sequence of strings; parts are NUL-separated, so ("ab", "c") and
+    ("a", "bc") differ.
+    """
+    return fingerprint_text("\0".join(parts))
+
+
+# --------------------------
+# Signature hashes
+# --------------------------
+
+def _base36(value: int) -> str:
+    if value == 0:
+        return "0"
+    chars = []
+    while value > 0:
+        value, rem = divmod(value, 36)
+        chars.append(_BASE36[rem])
+    return "".join(reversed(chars))
+
+
+def _fnv1a_32(data: bytes) -> int:
+    h = 0x811C9DC5
+    for b in data:
+        h = ((h ^ b) * 0x01000193) & 0xFFFFFFFF
+    return h
+
+
+def stable_signature_hash(text: str, compat: bool = False) -> str:
+    """
+    Produce a short, stable hash for disambiguation (deterministic, no randomness),
+    encoded as base36.
+
+    Parameters:
+      - text: signature key to hash
+      - compat: FNV-1a 32-bit, the values used by earlier versions (kept for the
+        manifest); otherwise the first 64 bits of the blake2b digest (fewer collisions,
+        faster on long keys)
+    """
+    data = text.encode("utf-8")
+    if compat:
+        return _base36(_fnv1a_32(data))
+    return _base36(int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big"))
+
+
+# --------------------------
+# Structural hashing
+# --------------------------
+
+def _type_parts(t: CppType) -> str:
+    parts = f"{t.spelling}\1{int(t.is_const)}{int(t.is_pointer)}{int(t.is_reference)}{int(t.is_volatile)}\1{t.kind}\1{t.decl_usr}"
+    return parts if t.pointee is None else f"{parts}\2{_type_parts(t.pointee)}"
+
+
+def _method_parts(m: MethodInfo) -> List[str]:
+    parts = [
+        "M",
+        m.name,
+        m.kind.name,
+        _type_parts(m.return_type),
+        f"{int(m.is_const)}{int(m.is_virtual)}{int(m.is_pure_virtual)}{int(m.is_explicit)}{int(m.is_noexcept)}",
+        m.qualified_name,
+        m.usr,
+        "" if m.overload_index is None else str(m.overload_index),
+        m._explicit_exposed_name or "",
+    ]
+    for p in m.parameters:
+        parts.append(f"P{p.name}\1{_type_parts(p.cpp_type)}\1{p.default_value or ''}\1{int(p.is_variadic)}")
+    return parts
+
+
+def method_fingerprint(m: MethodInfo) -> str:
+    """
+    Structural digest of one method: equal for methods with equal fields.
+    """
+    return fingerprint_parts(_method_parts(m))
+
+
+def class_fingerprint(ci: ClassInfo) -> str:
+    """
+    Structural digest of a class, its bases and all of its methods (in order). Changes
+    whenever anything that shapes the generated wrapper changes in the model.
+    """
+    parts = ["C", ci.name, "::".join(ci.namespaces), ci.header, ci.cursor_usr, ci.wrapper_prefix]
+    for b in ci.bases:
+        parts.append(f"B{b.qualified_name}\1{int(b.is_virtual)}\1{b.access}")
+    parts.extend(method_fingerprint(m) for m in ci.methods)
+    return fingerprint_parts(parts)
+
+
+# --------------------------
+# Files
+# --------------------------
+
+def file_digest(path: str) -> Optional[str]:
+    """
+    Digest of a file's contents, or None if it cannot be read.
+    """
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return _new_hash().hexdigest()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.blake2b(mm, digest_size=DIGEST_SIZE).hexdigest()
+    except (OSError, ValueError):
+        return None
+
+
+def file_digests(paths: Sequence[str], jobs: Optional[int] = None) -> Dict[str, Optional[str]]:
+    """
+    Digest many files, in parallel on a thread pool.
+
+    Parameters:
+      - paths: files to hash; unreadable ones map to None
+      - jobs: worker threads (default: min(32, CPU count + 4)); 1 hashes serially
+    """
+    paths = list(paths)
+    if jobs is None:
+        jobs = min(32, (os.cpu_count() or 1) + 4)
+    if jobs <= 1 or len(paths) <= 1:
+        return {p: file_digest(p) for p in paths}
+    with ThreadPoolExecutor(max_workers=min(jobs, len(paths))) as pool:
+        return dict(zip(paths, pool.map(file_digest, paths)))
+
+
+def source_fingerprint(paths: Iterable[Path]) -> str:
+    """
+    Digest of the contents of the given files, in order; unreadable files count as empty.
+    """
+    paths = [str(p) for p in paths]
+    digests = file_digests(paths)
+    return fingerprint_parts(digests[p] or "-" for p in paths)
+
+
+# --------------------------
+# Generator
+# --------------------------
+
+def generator_fingerprint() -> str:
+    """
+    Digest of the generator's version and the contents of its Python sources. Cache keys
+    include it, so cached results are invalidated whenever the generator changes, also
+    when running from a checkout without a version bump.
+    """
+    from .utils import get_generator_version  # utils imports this module
+
+    sources = sorted(Path(__file__).parent.glob("**/*.py"))
+    return fingerprint_parts((get_generator_version() or "unknown", source_fingerprint(sources)))
+
+
+__all__ = [
+    "DIGEST_SIZE",
+    "class_fingerprint",
+    "file_digest",
+    "file_digests",
+    "fingerprint_bytes",
+    "fingerprint_parts",
+    "fingerprint_text",
+    "generator_fingerprint",
+    "method_fingerprint",
+    "source_fingerprint",
+    "stable_signature_hash",
+]
@@ -22,6 +22,14 @@ Usage (example):
     --clang-args "-Ipath/to/opencascade/include -std=c++17" \
     --output-dir src/generated
 
+Sharded example (parse on several machines, then merge and emit once):
+  python -m gdextension_binding_generator.generate_bindings \
+    --shard 1/4 --ir-out shard-1.ir \
+    --prefix OCC_ --headers path/to/opencascade/include --clang-args "..."
+  python -m gdextension_binding_generator.generate_bindings merge \
+    shard-1.ir shard-2.ir shard-3.ir shard-4.ir \
+    --output-dir src/generated
+
 Variant-only example:
   python -m gdextension_binding_generator.generate_bindings \
     --variant-api \
@@ -43,20 +51,24 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import hashlib
+import os
 import re
 import sys
 import shlex
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
 # Local modules
-from .models import GenerationContext
-from .utils import TemplateRenderer, configure_logging
+from .models import ClassInfo, GenerationContext
+from .utils import OutputIndex, OutputWriter, PruneMode, SyncPolicy, TemplateRenderer, configure_logging
 from .manifest import emit_manifest
-from .parsing.clang_parser import collect_classes_from_headers
+from .ir import IR_COMPRESSIONS, IRError, read_ir, write_ir
+from .symbol_index import SymbolIndex
+from .parsing.clang_parser import PARSE_POOLS, collect_classes_from_headers, merge_class_lists, resolve_batch_size
 from .emitters.godot_variant_emitter import GodotVariantEmitter, VariantEmitterConfig
 from .type_mapping import MappingConfig, TypeMapper
 
@@ -92,35 +104,47 @@ def discover_header_files(paths: List[str]) -> List[Path]:
     return unique
 
 
+def parse_shard_spec(spec: str) -> Tuple[int, int]:
+    """
+    Parse a shard spec "i/N" (1 <= i <= N) into (i, N).
+    """
+    try:
+        index_s, count_s = spec.split("/", 1)
+        index, count = int(index_s), int(count_s)
+    except ValueError:
+        raise ValueError(f"Invalid shard '{spec}' (expected i/N, e.g. 1/4)")
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Invalid shard '{spec}' (need 1 <= i <= N)")
+    return index, count
+
+
+def select_shard(headers: Sequence[Path], index: int, count: int) -> List[Path]:
+    """
+    Return the headers belonging to shard `index` of `count` (1-based), keeping their order.
+
+    Headers are assigned by a hash of their path relative to the common root of all
+    headers, so every machine computes the same partition for the same source tree
+    regardless of where it is checked out.
+    """
+    if not headers:
+        return []
+    root = os.path.commonpath([str(h) for h in headers])
+    if len(headers) == 1:
+        root = os.path.dirname(root)
+    selected: List[Path] = []
+    for h in headers:
+        rel = Path(os.path.relpath(str(h), root)).as_posix()
+        bucket = int.from_bytes(hashlib.sha1(rel.encode("utf-8")).digest()[:8], "big") % count
+        if bucket == index - 1:
+            selected.append(h)
+    return selected
+
+
 # --------------------------
 # CLI
 # --------------------------
 
-def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
-    p = argparse.ArgumentParser(description="Generate Godot 4.4 GDExtension bindings (modular, production-ready)")
-
-    p.add_argument(
-        "--headers",
-        action="append",
-        default=[],
-        help="Header file or directory to parse (repeatable). If a directory is given, all .h/.hpp/.hh/.hxx files are parsed.",
-    )
-    p.add_argument(
-        "--clang-args",
-        default="",
-        help="Additional clang arguments (e.g., -I/path/include -DDEFINE=1 -std=c++17)",
-    )
-    p.add_argument(
-        "--exclude-regex",
-        default="",
-        help="Regex to exclude classes by name (spelling).",
-    )
-    p.add_argument(
-        "--include-filter",
-        action="append",
-        default=[],
-        help="Only include classes whose definition file path starts with any of these prefixes. Repeatable.",
-    )
+def _add_output_arguments(p: argparse.ArgumentParser) -> None:
     p.add_argument(
         "--output-dir",
         default="generated",
@@ -138,10 +162,47 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         help="Path(s) to godot-cpp includes (metadata only; not used directly by the generator).",
     )
     p.add_argument(
-        "--prefix",
-        default="gdextension_binding_generator_prefix_",
-        help="Prefix to add to generated wrapper class names (e.g., OCC_).",
+        "--emit-jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes rendering class wrappers (default: 1, serial). Output and log order are identical for any value.",
+    )
+    p.add_argument(
+        "--template-cache-dir",
+        default=None,
+        help="Directory for compiled template bytecode, keyed by template contents and reused across runs "
+        "(default: <cache-dir>/templates when --cache-dir is given).",
+    )
+    p.add_argument(
+        "--no-incremental",
+        action="store_true",
+        help="Map and render every class again, instead of skipping classes whose inputs are unchanged since the last run "
+        "into the output directory.",
+    )
+    p.add_argument(
+        "--fsync",
+        choices=[policy.value for policy in SyncPolicy],
+        default=SyncPolicy.NONE.value,
+        help="When written files are fsynced: none (default), each (before every rename) or batch (all at the end of the run).",
+    )
+    p.add_argument(
+        "--dir-sync",
+        choices=[policy.value for policy in SyncPolicy],
+        default=SyncPolicy.NONE.value,
+        help="When output directories are fsynced after renames: none (default), each (after every file) or batch "
+        "(once per directory at the end of the run).",
+    )
+    p.add_argument(
+        "--prune",
+        choices=[mode.value for mode in PruneMode],
+        default=PruneMode.DELETE.value,
+        help="Generated files from earlier runs that this run no longer produces: delete (default; hand-edited ones are "
+        "kept), quarantine (move under <output-dir>/.gdext-stale/), report (list only) or keep. Files the generator "
+        "did not write are never touched.",
     )
+
+
+def _add_common_arguments(p: argparse.ArgumentParser) -> None:
     p.add_argument(
         "--no-manifest",
         action="store_true",
@@ -195,6 +256,137 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         help="When using --variant-api, disable std::string <-> godot::String mapping."
     )
 
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        description="Generate Godot 4.4 GDExtension bindings (modular, production-ready)",
+        epilog="Run '%(prog)s merge --help' to combine the IR files of a sharded run.",
+    )
+
+    p.add_argument(
+        "--headers",
+        action="append",
+        default=[],
+        help="Header file or directory to parse (repeatable). If a directory is given, all .h/.hpp/.hh/.hxx files are parsed.",
+    )
+    p.add_argument(
+        "--clang-args",
+        default="",
+        help="Additional clang arguments (e.g., -I/path/include -DDEFINE=1 -std=c++17)",
+    )
+    p.add_argument(
+        "--exclude-regex",
+        default="",
+        help="Regex to exclude classes by name (spelling).",
+    )
+    p.add_argument(
+        "--include-filter",
+        action="append",
+        default=[],
+        help="Only include classes whose definition file path starts with any of these prefixes. Repeatable.",
+    )
+    p.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of headers to parse concurrently (default: 1, serial). Output is identical for any value.",
+    )
+    p.add_argument(
+        "--jobs-pool",
+        choices=list(PARSE_POOLS),
+        default="process",
+        help="Worker pool used with --jobs > 1: 'process' (default) or 'thread' (libclang releases the GIL while parsing).",
+    )
+    p.add_argument(
+        "--batch-size",
+        default="1",
+        help="Headers per translation unit: 1 (default, one TU per header), K (umbrella TUs including K headers), "
+        "'all' (the whole library in one TU) or 'auto' (picked from measured parse time and memory).",
+    )
+    p.add_argument(
+        "--batch-memory-mb",
+        type=int,
+        default=2048,
+        help="Memory budget per umbrella TU used by --batch-size auto (default: 2048).",
+    )
+    p.add_argument(
+        "--pch-prefix",
+        default=None,
+        help="Prefix header (e.g. one including Standard.hxx and common STL headers) compiled once into a PCH "
+        "and loaded into every translation unit with -include-pch. One PCH is built per run, for the single "
+        "--clang-args set; multiple arg sets are not supported.",
+    )
+    p.add_argument(
+        "--pch-dir",
+        default=None,
+        help="Directory for the PCH built from --pch-prefix (default: a temporary directory removed after the run).",
+    )
+    p.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Persistent parse cache. Translation units whose headers and include closure are unchanged "
+        "(same clang args, libclang and generator version) are loaded from it without running libclang.",
+    )
+    p.add_argument(
+        "--main-file-only",
+        action="store_true",
+        help="Only collect classes defined in each translation unit's own header(s), without walking "
+        "included headers. Every class gets exactly one owning header; classes defined in files that are "
+        "not among the discovered headers are skipped.",
+    )
+    p.add_argument(
+        "--shard",
+        default=None,
+        help="Parse only shard i/N (1-based) of the discovered headers, hash-partitioned by relative path, "
+        "and write the result to --ir-out instead of generating sources. Combine shards with the 'merge' subcommand.",
+    )
+    p.add_argument(
+        "--ir-out",
+        default=None,
+        help="Write the parsed classes to this binary IR file (required with --shard).",
+    )
+    p.add_argument(
+        "--ir-in",
+        default=None,
+        help="Emit from a previously written IR file instead of parsing headers (no libclang needed). "
+        "--headers and all parsing options are ignored; the prefix is taken from the IR.",
+    )
+    p.add_argument(
+        "--symbol-db",
+        default=None,
+        help="SQLite symbol index. Parsed classes replace the rows of the parsed headers, and sources are "
+        "generated from the whole index. Without --headers, sources are generated from the index alone.",
+    )
+    p.add_argument(
+        "--ir-compression",
+        choices=list(IR_COMPRESSIONS),
+        default="zlib",
+        help="Compression of IR files written with --ir-out (default: zlib).",
+    )
+    _add_output_arguments(p)
+    p.add_argument(
+        "--prefix",
+        default="gdextension_binding_generator_prefix_",
+        help="Prefix to add to generated wrapper class names (e.g., OCC_).",
+    )
+    _add_common_arguments(p)
+
+    return p.parse_args(argv)
+
+
+def parse_merge_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        prog="generate-godot-bindings merge",
+        description="Merge the partial IR files of a sharded run and generate bindings from them.",
+    )
+    p.add_argument(
+        "ir_files",
+        nargs="+",
+        help="IR files written by --shard i/N --ir-out (one per shard).",
+    )
+    _add_output_arguments(p)
+    _add_common_arguments(p)
     return p.parse_args(argv)
 
 
@@ -202,10 +394,7 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
 # Main
 # --------------------------
 
-def main(argv: Optional[Sequence[str]] = None) -> int:
-    ns = parse_args(argv)
-
-    # Configure logging as early as possible
+def _configure_logging_from_args(ns: argparse.Namespace) -> None:
     if getattr(ns, "log_level", None):
         level_name = str(ns.log_level).upper()
         level = getattr(logging, level_name, logging.INFO)
@@ -225,21 +414,102 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         fmt=getattr(ns, "log_format", "%(levelname)s: %(message)s"),
     )
 
-    out_dir = Path(ns.output_dir).resolve()
-    classes_dir = out_dir / "classes"
 
-    ctx = GenerationContext(
+def _generation_context(ns: argparse.Namespace, prefix: str) -> GenerationContext:
+    out_dir = Path(ns.output_dir).resolve()
+    return GenerationContext(
         output_dir=out_dir,
-        classes_dir=classes_dir,
+        classes_dir=out_dir / "classes",
         templates_dir=Path(ns.templates_dir).resolve() if ns.templates_dir else None,
         godot_includes=[str(Path(p).resolve()) for p in ns.godot_include],
-        prefix=ns.prefix,
+        prefix=prefix,
         dry_run=ns.dry_run,
     )
 
+
+def _template_renderer(ns: argparse.Namespace, ctx: GenerationContext) -> TemplateRenderer:
+    cache_dir = getattr(ns, "template_cache_dir", None)
+    if not cache_dir and getattr(ns, "cache_dir", None):
+        cache_dir = Path(ns.cache_dir) / "templates"
+    return TemplateRenderer(ctx.templates_dir, bytecode_cache_dir=Path(cache_dir).resolve() if cache_dir else None)
+
+
+def _emit_outputs(ns: argparse.Namespace, ctx: GenerationContext, renderer: TemplateRenderer, classes: Sequence[ClassInfo]) -> int:
+    """
+    Report discovered classes, then emit sources and the manifest. Returns the exit code.
+    """
+    # Report discovery
+    logger.info("Discovered %d class(es)", len(classes))
+    for c in classes:
+        inst_count = sum(1 for m in c.methods if m.kind.name in ("INSTANCE", "OPERATOR"))
+        stat_count = sum(1 for m in c.methods if m.kind.name == "STATIC")
+        logger.debug("Class %s (-> wrapper %s) methods: instance=%d, static=%d", c.qualified_name, c.wrapper_name, inst_count, stat_count)
+
+    if ctx.dry_run:
+        logger.info("Dry-run complete (no files written).")
+        return 0
+
+    # Emit sources (Variant-only emitter)
+    try:
+        cfg = MappingConfig(
+            prefix=ctx.prefix,
+            enable_opaque_handles=not getattr(ns, "no_opaque_handles", False),
+            use_wrapped_param_bridge=True,
+            enable_std_string=not getattr(ns, "no_std_string", False),
+        )
+        # Index-backed class lists provide the wrapper names without loading every class
+        known_wrappers = getattr(classes, "known_wrappers", None)
+        mapper = TypeMapper(known_wrappers(), config=cfg) if known_wrappers else TypeMapper.from_classes(classes, config=cfg)
+        ve_cfg = VariantEmitterConfig()
+        emitter = GodotVariantEmitter(
+            ctx=ctx,
+            renderer=renderer,
+            config=ve_cfg,
+            mapper=mapper,
+            jobs=getattr(ns, "emit_jobs", 1),
+            incremental=not getattr(ns, "no_incremental", False),
+            writer=OutputWriter(
+                OutputIndex.load(ctx.output_dir),
+                fsync=SyncPolicy(getattr(ns, "fsync", "none")),
+                dir_sync=SyncPolicy(getattr(ns, "dir_sync", "none")),
+                prune=PruneMode(getattr(ns, "prune", "delete")),
+            ),
+        )
+        emitter.emit(classes)
+    except Exception:
+        logger.exception("Failed to generate files")
+        return 4
+
+    # Optional: emit a JSON manifest of the generation data for debugging/inspection.
+    if not ns.no_manifest:
+        try:
+            emit_manifest(ctx, classes)
+        except Exception:
+            logger.exception("Failed to emit generation manifest")
+            return 5
+
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = list(sys.argv[1:] if argv is None else argv)
+    if args and args[0] == "merge":
+        return merge_main(args[1:])
+    ns = parse_args(args)
+
+    # Configure logging as early as possible
+    _configure_logging_from_args(ns)
+
+    if ns.ir_in:
+        return _emit_from_ir(ns)
+    if ns.symbol_db and not ns.headers:
+        return _emit_from_symbol_db(ns)
+
+    ctx = _generation_context(ns, ns.prefix)
+
     # Initialize renderer (layered: user dir -> package templates -> embedded defaults)
     try:
-        renderer = TemplateRenderer(ctx.templates_dir)
+        renderer = _template_renderer(ns, ctx)
     except Exception as e:
         logger.exception("Failed to initialize templating")
         return 1
@@ -250,6 +520,20 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         logger.error("No headers found to parse. Provide --headers.")
         return 2
 
+    shard: Optional[Tuple[int, int]] = None
+    total_headers = len(headers)
+    if ns.shard:
+        try:
+            shard = parse_shard_spec(ns.shard)
+        except ValueError as ex:
+            logger.error("%s", ex)
+            return 2
+        if not ns.ir_out:
+            logger.error("--shard requires --ir-out")
+            return 2
+        headers = select_shard(headers, *shard)
+        logger.info("Shard %d/%d: parsing %d of %d header(s)", shard[0], shard[1], len(headers), total_headers)
+
     # Prepare parsing parameters
     try:
         clang_args = shlex.split(ns.clang_args) if ns.clang_args else []
@@ -260,6 +544,12 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
 
     exclude_re = re.compile(ns.exclude_regex) if ns.exclude_regex else None
 
+    try:
+        batch_size = resolve_batch_size(ns.batch_size)
+    except ValueError as ex:
+        logger.error("%s", ex)
+        return 2
+
     # Parse classes and methods
     try:
         classes = collect_classes_from_headers(
@@ -269,54 +559,176 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             exclude_class_regex=exclude_re,
             prefix=ctx.prefix,
             emit_diagnostics=True,
+            jobs=max(1, ns.jobs),
+            pool=ns.jobs_pool,
+            batch_size=batch_size,
+            batch_memory_mb=ns.batch_memory_mb,
+            pch_prefix=Path(ns.pch_prefix).resolve() if ns.pch_prefix else None,
+            pch_dir=Path(ns.pch_dir).resolve() if ns.pch_dir else None,
+            cache_dir=Path(ns.cache_dir).resolve() if ns.cache_dir else None,
+            main_file_only=ns.main_file_only,
         )
     except Exception:
         logger.exception("Failed to collect classes")
         return 3
 
-    # Report discovery
-    logger.info("Discovered %d class(es)", len(classes))
-    for c in classes:
-        inst_count = sum(1 for m in c.methods if m.kind.name in ("INSTANCE", "OPERATOR"))
-        stat_count = sum(1 for m in c.methods if m.kind.name == "STATIC")
-        logger.debug("Class %s (-> wrapper %s) methods: instance=%d, static=%d", c.qualified_name, c.wrapper_name, inst_count, stat_count)
-
-    if ctx.dry_run:
-        logger.info("Dry-run complete (no files written).")
+    if ns.ir_out:
+        meta: Dict[str, Any] = {
+            "prefix": ctx.prefix,
+            "shard": list(shard) if shard else None,
+            "headers": len(headers),
+            "total_headers": total_headers,
+        }
+        try:
+            write_ir(Path(ns.ir_out), classes, meta, dry_run=ctx.dry_run, compression=ns.ir_compression)
+        except Exception:
+            logger.exception("Failed to write IR to %s", ns.ir_out)
+            return 6
+    if shard is not None:
+        logger.info("Shard %d/%d: collected %d class(es); run 'merge' on all shard IR files to generate sources", shard[0], shard[1], len(classes))
         return 0
 
-    # Emit sources (Variant-only emitter)
+    if ns.symbol_db:
+        try:
+            index = SymbolIndex(Path(ns.symbol_db))
+        except Exception:
+            logger.exception("Failed to open symbol index %s", ns.symbol_db)
+            return 6
+        with index:
+            recorded = index.get_meta("prefix")
+            if recorded is not None and recorded != ctx.prefix:
+                logger.error("Symbol index %s was built with prefix '%s', not '%s'", ns.symbol_db, recorded, ctx.prefix)
+                return 2
+            try:
+                index.set_meta("prefix", ctx.prefix)
+                written = index.replace_headers(headers, classes)
+            except Exception:
+                logger.exception("Failed to update symbol index %s", ns.symbol_db)
+                return 6
+            logger.info("Symbol index: updated %d class(es) from %d header(s); %d class(es) indexed", written, len(headers), index.count())
+            # Emit from the index so classes of headers parsed in earlier runs are included
+            del classes
+            return _emit_outputs(ns, ctx, renderer, index.classes())
+
+    return _emit_outputs(ns, ctx, renderer, classes)
+
+
+def _emit_from_ir(ns: argparse.Namespace) -> int:
+    """
+    Emit-only run (--ir-in): load classes from an IR file and skip discovery and parsing.
+    """
     try:
-        cfg = MappingConfig(
-            prefix=ctx.prefix,
-            enable_opaque_handles=not getattr(ns, "no_opaque_handles", False),
-            use_wrapped_param_bridge=True,
-            enable_std_string=not getattr(ns, "no_std_string", False),
-        )
-        mapper = TypeMapper.from_classes(classes, config=cfg)
-        ve_cfg = VariantEmitterConfig()
-        emitter = GodotVariantEmitter(
-            ctx=ctx,
-            renderer=renderer,
-            config=ve_cfg,
-            mapper=mapper,
-        )
-        emitter.emit(classes)
-    except Exception:
-        logger.exception("Failed to generate files")
-        return 4
+        classes, meta = read_ir(Path(ns.ir_in))
+    except IRError as ex:
+        logger.error("%s", ex)
+        return 2
+    if meta.get("shard"):
+        shard = meta["shard"]
+        logger.error("%s holds only shard %s/%s; combine all shards with the 'merge' subcommand", ns.ir_in, shard[0], shard[1])
+        return 2
+    prefix = meta.get("prefix", ns.prefix)
+    if prefix != ns.prefix:
+        logger.info("Using prefix '%s' recorded in %s", prefix, ns.ir_in)
 
+    ctx = _generation_context(ns, prefix)
+    try:
+        renderer = _template_renderer(ns, ctx)
+    except Exception:
+        logger.exception("Failed to initialize templating")
+        return 1
+    logger.info("Loaded %d class(es) from %s", len(classes), ns.ir_in)
+    return _emit_outputs(ns, ctx, renderer, classes)
 
 
-    # Optional: emit a JSON manifest of the generation data for debugging/inspection.
-    if not ns.no_manifest:
+def _emit_from_symbol_db(ns: argparse.Namespace) -> int:
+    """
+    Emit-only run (--symbol-db without --headers): generate sources from the symbol index.
+    """
+    db_path = Path(ns.symbol_db)
+    if not db_path.is_file():
+        logger.error("Symbol index %s does not exist; parse headers into it first", db_path)
+        return 2
+    with SymbolIndex(db_path) as index:
+        prefix = index.get_meta("prefix") or ns.prefix
+        ctx = _generation_context(ns, prefix)
         try:
-            emit_manifest(ctx, classes)
+            renderer = _template_renderer(ns, ctx)
         except Exception:
-            logger.exception("Failed to emit generation manifest")
-            return 5
+            logger.exception("Failed to initialize templating")
+            return 1
+        classes = index.classes()
+        logger.info("Loaded %d class(es) from symbol index %s", len(classes), db_path)
+        return _emit_outputs(ns, ctx, renderer, classes)
 
-    return 0
+
+def _check_shards(paths: Sequence[str], metas: Sequence[Dict[str, Any]]) -> Optional[str]:
+    """
+    Validate that sharded IR files form one complete set; return an error message if not.
+    """
+    shards: Dict[int, str] = {}
+    counts = set()
+    totals = set()
+    for path, meta in zip(paths, metas):
+        shard = meta.get("shard")
+        if not shard:
+            continue
+        index, count = int(shard[0]), int(shard[1])
+        counts.add(count)
+        totals.add(meta.get("total_headers"))
+        if index in shards:
+            return f"Shard {index}/{count} given twice ({shards[index]} and {path})"
+        shards[index] = path
+    if not shards:
+        return None
+    if len(counts) > 1:
+        return f"IR files come from runs with different shard counts: {sorted(counts)}"
+    if len(totals) > 1:
+        return f"IR files come from runs that discovered different header sets ({sorted(t or 0 for t in totals)} headers)"
+    count = counts.pop()
+    missing = [i for i in range(1, count + 1) if i not in shards]
+    if missing:
+        return f"Missing shard(s) {', '.join(f'{i}/{count}' for i in missing)}"
+    return None
+
+
+def merge_main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    `merge` subcommand: combine the partial IR files of a sharded run, then assign overload
+    indices and emit exactly as a single run would.
+    """
+    ns = parse_merge_args(argv)
+    _configure_logging_from_args(ns)
+
+    class_lists: List[List[ClassInfo]] = []
+    metas: List[Dict[str, Any]] = []
+    for path in ns.ir_files:
+        try:
+            classes, meta = read_ir(Path(path))
+        except IRError as ex:
+            logger.error("%s", ex)
+            return 2
+        class_lists.append(classes)
+        metas.append(meta)
+
+    error = _check_shards(ns.ir_files, metas)
+    if error:
+        logger.error("%s", error)
+        return 2
+    prefixes = {m.get("prefix", "") for m in metas}
+    if len(prefixes) > 1:
+        logger.error("IR files were generated with different prefixes: %s", ", ".join(sorted(prefixes)))
+        return 2
+
+    ctx = _generation_context(ns, prefixes.pop())
+    try:
+        renderer = _template_renderer(ns, ctx)
+    except Exception:
+        logger.exception("Failed to initialize templating")
+        return 1
+
+    classes = merge_class_lists(class_lists)
+    logger.info("Merged %d IR file(s)", len(ns.ir_files))
+    return _emit_outputs(ns, ctx, renderer, classes)
 
 
 if __name__ == "__main__":
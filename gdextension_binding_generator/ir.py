@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+Serialized intermediate representation (IR) of parsed classes.
+
+An IR file holds the ClassInfo/MethodInfo/ParameterInfo/CppType model collected from a set
+of headers, plus metadata describing the run that produced it. Sharded runs write one
+partial IR per shard for the `merge` subcommand, and any run can write one (--ir-out) to
+re-emit later from it (--ir-in) without invoking libclang.
+
+File layout:
+- magic b"GDXIR", format version (1 byte), compression (1 byte: 0 none, 1 zlib, 2 lzma)
+- the (optionally compressed) payload:
+  - meta: length-prefixed UTF-8 JSON
+  - string table: every distinct string once (names, spellings, USRs, headers, ...)
+  - type table: every distinct CppType once, as (spelling string id, flag bits, kind string
+    id, pointee type id + 1 or 0, declaration USR string id); a pointee always precedes the
+    types that refer to it
+  - classes, whose fields refer to the tables by index
+
+Integers are unsigned LEB128 varints; optional values are stored as index + 1 with 0 for
+None. Only fields are stored; values derived from them (exposed names, signature hashes,
+constructor lists, ...) are recomputed when the IR is loaded.
+"""
+
+from __future__ import annotations
+
+import json
+import lzma
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import logging
+
+from .models import BaseClassRef, ClassInfo, CppType, MethodInfo, MethodKind, ParameterInfo
+from .utils import atomic_write_bytes, get_generator_version
+
+logger = logging.getLogger(__name__)
+
+IR_MAGIC = b"GDXIR"
+# Bump when the payload layout changes; readers reject other versions
+IR_VERSION = 3
+
+IR_COMPRESSIONS: Tuple[str, ...] = ("none", "zlib", "lzma")
+
+_COMPRESSORS: Dict[str, Tuple[int, Callable[[bytes], bytes]]] = {
+    "none": (0, lambda data: data),
+    "zlib": (1, lambda data: zlib.compress(data, 6)),
+    "lzma": (2, lambda data: lzma.compress(data, preset=6)),
+}
+_DECOMPRESSORS: Dict[int, Callable[[bytes], bytes]] = {
+    0: lambda data: data,
+    1: zlib.decompress,
+    2: lzma.decompress,
+}
+
+# Stable on-disk codes for MethodKind (enum auto() values are not part of the format)
+_KIND_CODES: Dict[MethodKind, int] = {
+    MethodKind.CONSTRUCTOR: 0,
+    MethodKind.DESTRUCTOR: 1,
+    MethodKind.INSTANCE: 2,
+    MethodKind.STATIC: 3,
+    MethodKind.OPERATOR: 4,
+}
+_KINDS_BY_CODE: Dict[int, MethodKind] = {v: k for k, v in _KIND_CODES.items()}
+
+# Flag bits
+_TYPE_CONST, _TYPE_POINTER, _TYPE_REFERENCE, _TYPE_VOLATILE = 1, 2, 4, 8
+_METHOD_CONST, _METHOD_VIRTUAL, _METHOD_PURE, _METHOD_EXPLICIT, _METHOD_NOEXCEPT = 1, 2, 4, 8, 16
+_PARAM_VARIADIC = 1
+_BASE_VIRTUAL = 1
+
+
+class IRError(ValueError):
+    """
+    Raised for unreadable, foreign or incompatible IR files.
+    """
+
+
+# --------------------------
+# Encoding
+# --------------------------
+
+def _put_uint(buf: bytearray, value: int) -> None:
+    while value >= 0x80:
+        buf.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buf.append(value)
+
+
+def _put_bytes(buf: bytearray, data: bytes) -> None:
+    _put_uint(buf, len(data))
+    buf += data
+
+
+class _Encoder:
+    def __init__(self) -> None:
+        self.body = bytearray()
+        self._strings: Dict[str, int] = {}
+        self._types: Dict[CppType, int] = {}
+
+    def _table_string(self, value: str) -> int:
+        sid = self._strings.get(value)
+        if sid is None:
+            sid = self._strings[value] = len(self._strings)
+        return sid
+
+    def string(self, value: str) -> None:
+        _put_uint(self.body, self._table_string(value))
+
+    def opt_string(self, value: Optional[str]) -> None:
+        _put_uint(self.body, 0 if value is None else self._table_string(value) + 1)
+
+    def type_id(self, t: CppType) -> int:
+        tid = self._types.get(t)
+        if tid is None:
+            if t.pointee is not None:
+                self.type_id(t.pointee)
+            tid = self._types[t] = len(self._types)
+        return tid
+
+    def cpp_type(self, t: CppType) -> None:
+        _put_uint(self.body, self.type_id(t))
+
+    def class_info(self, ci: ClassInfo) -> None:
+        b = self.body
+        self.string(ci.name)
+        _put_uint(b, len(ci.namespaces))
+        for ns in ci.namespaces:
+            self.string(ns)
+        self.string(ci.header)
+        self.string(ci.cursor_usr)
+        self.string(ci.wrapper_prefix)
+        _put_uint(b, len(ci.bases))
+        for base in ci.bases:
+            self.string(base.qualified_name)
+            self.string(base.access)
+            _put_uint(b, _BASE_VIRTUAL if base.is_virtual else 0)
+        _put_uint(b, len(ci.methods))
+        for m in ci.methods:
+            self.method(m)
+
+    def method(self, m: MethodInfo) -> None:
+        b = self.body
+        self.string(m.name)
+        self.cpp_type(m.return_type)
+        _put_uint(b, _KIND_CODES[m.kind])
+        _put_uint(
+            b,
+            (_METHOD_CONST if m.is_const else 0)
+            | (_METHOD_VIRTUAL if m.is_virtual else 0)
+            | (_METHOD_PURE if m.is_pure_virtual else 0)
+            | (_METHOD_EXPLICIT if m.is_explicit else 0)
+            | (_METHOD_NOEXCEPT if m.is_noexcept else 0),
+        )
+        self.string(m.qualified_name)
+        self.string(m.usr)
+        _put_uint(b, 0 if m.overload_index is None else m.overload_index + 1)
+        self.opt_string(m._explicit_exposed_name)
+        _put_uint(b, len(m.parameters))
+        for p in m.parameters:
+            self.string(p.name)
+            self.cpp_type(p.cpp_type)
+            self.opt_string(p.default_value)
+            _put_uint(b, _PARAM_VARIADIC if p.is_variadic else 0)
+
+    def tables(self) -> bytes:
+        out = bytearray()
+        # Type strings go into the string table before it is written
+        type_sids = [(self._table_string(t.spelling), self._table_string(t.kind), self._table_string(t.decl_usr)) for t in self._types]
+        _put_uint(out, len(self._strings))
+        for s in self._strings:
+            _put_bytes(out, s.encode("utf-8"))
+        _put_uint(out, len(self._types))
+        for t, (spelling_sid, kind_sid, usr_sid) in zip(self._types, type_sids):
+            _put_uint(out, spelling_sid)
+            _put_uint(
+                out,
+                (_TYPE_CONST if t.is_const else 0)
+                | (_TYPE_POINTER if t.is_pointer else 0)
+                | (_TYPE_REFERENCE if t.is_reference else 0)
+                | (_TYPE_VOLATILE if t.is_volatile else 0),
+            )
+            _put_uint(out, kind_sid)
+            _put_uint(out, 0 if t.pointee is None else self._types[t.pointee] + 1)
+            _put_uint(out, usr_sid)
+        return bytes(out)
+
+
+def encode_ir(classes: Iterable[ClassInfo], meta: Optional[Dict[str, Any]] = None, compression: str = "zlib") -> bytes:
+    """
+    Serialize `classes` and run metadata into IR bytes.
+    """
+    if compression not in _COMPRESSORS:
+        raise ValueError(f"Unknown IR compression '{compression}' (expected one of: {', '.join(IR_COMPRESSIONS)})")
+    enc = _Encoder()
+    class_list = list(classes)
+    _put_uint(enc.body, len(class_list))
+    for ci in class_list:
+        enc.class_info(ci)
+
+    payload = bytearray()
+    meta_doc = dict(meta or {}, generator=get_generator_version() or "unknown")
+    _put_bytes(payload, json.dumps(meta_doc, sort_keys=True).encode("utf-8"))
+    payload += enc.tables()
+    payload += enc.body
+
+    code, compress = _COMPRESSORS[compression]
+    return IR_MAGIC + bytes((IR_VERSION, code)) + compress(bytes(payload))
+
+
+# --------------------------
+# Decoding
+# --------------------------
+
+class _Decoder:
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.pos = 0
+        self.strings: List[str] = []
+        self.types: List[CppType] = []
+
+    def uint(self) -> int:
+        data = self.data
+        pos = self.pos
+        byte = data[pos]
+        pos += 1
+        value = byte & 0x7F
+        shift = 7
+        while byte & 0x80:
+            byte = data[pos]
+            pos += 1
+            value |= (byte & 0x7F) << shift
+            shift += 7
+        self.pos = pos
+        return value
+
+    def raw(self) -> bytes:
+        n = self.uint()
+        start = self.pos
+        self.pos = start + n
+        if self.pos > len(self.data):
+            raise IndexError("truncated IR payload")
+        return self.data[start:self.pos]
+
+    def string(self) -> str:
+        return self.strings[self.uint()]
+
+    def opt_string(self) -> Optional[str]:
+        sid = self.uint()
+        return None if sid == 0 else self.strings[sid - 1]
+
+    def tables(self) -> None:
+        self.strings = [self.raw().decode("utf-8") for _ in range(self.uint())]
+        types: List[CppType] = []
+        for _ in range(self.uint()):
+            spelling = self.string()
+            flags = self.uint()
+            kind = self.string()
+            pointee = self.uint()
+            if pointee > len(types):
+                raise ValueError(f"type {len(types)} refers to a later pointee type")
+            types.append(CppType.interned(
+                spelling=spelling,
+                is_const=bool(flags & _TYPE_CONST),
+                is_pointer=bool(flags & _TYPE_POINTER),
+                is_reference=bool(flags & _TYPE_REFERENCE),
+                kind=kind,
+                pointee=types[pointee - 1] if pointee else None,
+                is_volatile=bool(flags & _TYPE_VOLATILE),
+                decl_usr=self.string(),
+            ))
+        self.types = types
+
+    def class_info(self) -> ClassInfo:
+        name = self.string()
+        namespaces = [self.string() for _ in range(self.uint())]
+        header = self.string()
+        usr = self.string()
+        prefix = self.string()
+        bases = []
+        for _ in range(self.uint()):
+            qn = self.string()
+            access = self.string()
+            bases.append(BaseClassRef(qualified_name=qn, is_virtual=bool(self.uint() & _BASE_VIRTUAL), access=access))
+        methods = [self.method() for _ in range(self.uint())]
+        return ClassInfo(
+            name=name,
+            namespaces=namespaces,
+            header=header,
+            cursor_usr=usr,
+            wrapper_prefix=prefix,
+            bases=bases,
+            methods=methods,
+        )
+
+    def method(self) -> MethodInfo:
+        name = self.string()
+        return_type = self.types[self.uint()]
+        kind = _KINDS_BY_CODE[self.uint()]
+        flags = self.uint()
+        qualified_name = self.string()
+        usr = self.string()
+        overload = self.uint()
+        explicit_name = self.opt_string()
+        params = []
+        for _ in range(self.uint()):
+            pname = self.string()
+            ptype = self.types[self.uint()]
+            default = self.opt_string()
+            params.append(ParameterInfo(name=pname, cpp_type=ptype, default_value=default, is_variadic=bool(self.uint() & _PARAM_VARIADIC)))
+        return MethodInfo(
+            name=name,
+            return_type=return_type,
+            parameters=params,
+            is_const=bool(flags & _METHOD_CONST),
+            is_virtual=bool(flags & _METHOD_VIRTUAL),
+            is_pure_virtual=bool(flags & _METHOD_PURE),
+            is_explicit=bool(flags & _METHOD_EXPLICIT),
+            is_noexcept=bool(flags & _METHOD_NOEXCEPT),
+            kind=kind,
+            qualified_name=qualified_name,
+            usr=usr,
+            overload_index=None if overload == 0 else overload - 1,
+            _explicit_exposed_name=explicit_name,
+        )
+
+
+def decode_ir(data: bytes, source: str = "<bytes>") -> Tuple[List[ClassInfo], Dict[str, Any]]:
+    """
+    Deserialize IR bytes, returning (classes, meta).
+    """
+    header_len = len(IR_MAGIC) + 2
+    if len(data) < header_len or not data.startswith(IR_MAGIC):
+        raise IRError(f"{source} is not a binding generator IR file")
+    version, code = data[len(IR_MAGIC)], data[len(IR_MAGIC) + 1]
+    if version != IR_VERSION:
+        raise IRError(f"{source} has IR version {version}, expected {IR_VERSION}")
+    if code not in _DECOMPRESSORS:
+        raise IRError(f"{source} uses unknown IR compression {code}")
+    try:
+        dec = _Decoder(_DECOMPRESSORS[code](data[header_len:]))
+        meta = json.loads(dec.raw().decode("utf-8"))
+        dec.tables()
+        classes = [dec.class_info() for _ in range(dec.uint())]
+    except (IndexError, KeyError, ValueError, zlib.error, lzma.LZMAError) as ex:
+        raise IRError(f"{source} is corrupt: {ex}") from ex
+    if dec.pos != len(dec.data):
+        raise IRError(f"{source} is corrupt: {len(dec.data) - dec.pos} trailing byte(s)")
+    return classes, meta if isinstance(meta, dict) else {}
+
+
+# --------------------------
+# Files
+# --------------------------
+
+def write_ir(
+    path: Path,
+    classes: Iterable[ClassInfo],
+    meta: Optional[Dict[str, Any]] = None,
+    dry_run: bool = False,
+    compression: str = "zlib",
+) -> None:
+    """
+    Write `classes` and run metadata to an IR file (atomically).
+    """
+    data = encode_ir(classes, meta, compression)
+    if dry_run:
+        logger.info("[dry-run] write %s", path)
+        return
+    atomic_write_bytes(Path(path), data)
+    logger.info("Wrote IR %s (%d bytes, %s)", path, len(data), compression)
+
+
+def read_ir(path: Path) -> Tuple[List[ClassInfo], Dict[str, Any]]:
+    """
+    Load an IR file, returning (classes, meta).
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError as ex:
+        raise IRError(f"Cannot read IR file {path}: {ex}") from ex
+    return decode_ir(data, str(path))
+
+
+__all__ = [
+    "IRError",
+    "IR_COMPRESSIONS",
+    "IR_MAGIC",
+    "IR_VERSION",
+    "decode_ir",
+    "encode_ir",
+    "read_ir",
+    "write_ir",
+]
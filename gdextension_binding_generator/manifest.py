@@ -4,17 +4,11 @@ import os
 import platform
 import shlex
 from datetime import datetime, timezone
-try:
-    # Python 3.8+
-    from importlib import metadata as importlib_metadata  # type: ignore
-except Exception:
-    importlib_metadata = None  # type: ignore
 
 import json
 from typing import Sequence
-from .generate_bindings import GenerationContext
-from .models import ClassInfo
-from .utils import write_text
+from .models import ClassInfo, GenerationContext
+from .utils import get_generator_version, write_text
 
 import logging
 logger = logging.getLogger(__name__)
@@ -24,31 +18,8 @@ def emit_manifest(ctx: GenerationContext, classes: Sequence[ClassInfo]) -> None:
     Emit a JSON manifest of the generation inputs, including generator metadata,
     version, and full command-line invocation. Useful for debugging and testing.
     """
-    # Lazy imports to keep module import-time light
-
     # Resolve generator version as best as possible
-    generator_version = None
-    if importlib_metadata is not None:
-        for dist_name in (
-            "gdextension-binding-generator",
-            "gdextension_binding_generator",
-        ):
-            try:
-                generator_version = importlib_metadata.version(dist_name)  # type: ignore[attr-defined]
-                if generator_version:
-                    break
-            except Exception:
-                pass
-    if not generator_version:
-        # Fallback: try package-level __version__
-        try:
-            import importlib
-            top_pkg = (__package__ or "").split(".")[0]
-            if top_pkg:
-                pkg_mod = importlib.import_module(top_pkg)
-                generator_version = getattr(pkg_mod, "__version__", None)
-        except Exception:
-            generator_version = None
+    generator_version = get_generator_version()
 
     # Command line info
     argv = list(getattr(sys, "argv", []) or [])
@@ -3,7 +3,7 @@
 Data models for the GDExtension binding generator.
 
 This module provides strongly-typed, serializable data structures to describe:
-- C++ types (lightweight parsing of pointers/references/const)
+- C++ types (spelling, clang type kind, pointee chain, cv-qualifiers)
 - Function parameters
 - Methods (instance/static/constructor/destructor)
 - Classes (namespaces, headers, methods, etc.)
@@ -16,20 +16,130 @@ The models are designed to be consumed by:
 
 The goal is to keep all binding-relevant metadata in one place and to offer
 convenient helpers that make templates simpler and safer.
+
+Model classes are slotted (no per-instance __dict__) and CppType instances are interned:
+each distinct type exists once per process, however many parameters refer to it.
+
+Derived values (signatures, exposed names, per-kind method lists) are computed once per
+instance. Code that mutates a model after reading them must call invalidate().
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+import sys
+from dataclasses import dataclass, field, fields, asdict
 from enum import Enum, auto
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
-from .utils import sanitize_identifier, stable_signature_hash, camel_to_snake
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+from .naming import camel_to_snake, sanitize_identifier
+from .fingerprint import stable_signature_hash
+
+# --------------------------
+# Slots and cached derived values
+# --------------------------
+
+class _derived:
+    """
+    Read-only property computed on first access and kept in a dedicated slot
+    ("_cached_<name>", added by _slotted). Owners expose invalidate() to drop cached
+    values after changing the fields they are derived from.
+    """
+
+    def __init__(self, fn) -> None:
+        self.fn = fn
+        self.slot = f"_cached_{fn.__name__}"
+        self.member = None  # slot descriptor, bound by _slotted
+        self.__doc__ = fn.__doc__
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        try:
+            value = self.member.__get__(obj, owner)
+        except AttributeError:
+            value = None
+        if value is None:
+            value = self.fn(obj)
+            self.member.__set__(obj, value)
+        return value
+
+
+def _derived_getstate(self):
+    # Pickle fields only; cached values are recomputed on demand
+    return tuple(getattr(self, name) for name in self._field_slots)
+
+
+def _derived_setstate(self, state) -> None:
+    for name, value in zip(self._field_slots, state):
+        object.__setattr__(self, name, value)
+
+
+def _clear_derived(obj) -> None:
+    # None marks a value as not computed (derived values are never None)
+    for d in type(obj)._derived_props:
+        d.member.__set__(obj, None)
+
+
+def _slotted(cls):
+    """
+    Rebuild a dataclass with __slots__ for its fields (dataclass(slots=True) needs
+    Python 3.10). Apply on top of @dataclass; field defaults live in the generated
+    __init__, so the class attributes holding them can be dropped. Each _derived
+    property gets an extra slot for its cached value.
+    """
+    names = tuple(f.name for f in fields(cls))
+    derived = tuple(v for v in cls.__dict__.values() if isinstance(v, _derived))
+    body = {k: v for k, v in cls.__dict__.items() if k not in names and k not in ("__dict__", "__weakref__")}
+    body["__slots__"] = names + tuple(d.slot for d in derived)
+    if derived:
+        body["_field_slots"] = names
+        body["_derived_props"] = derived
+        body["__getstate__"] = _derived_getstate
+        body["__setstate__"] = _derived_setstate
+    slotted = type(cls)(cls.__name__, cls.__bases__, body)
+    slotted.__qualname__ = cls.__qualname__
+    for d in derived:
+        d.member = slotted.__dict__[d.slot]
+    return slotted
+
 
 # --------------------------
 # C++ Type model
 # --------------------------
 
+# Interned CppType instances, keyed by their fields and by raw spelling (from_spelling)
+_TYPE_TABLE: Dict[Tuple, "CppType"] = {}
+_SPELLING_TABLE: Dict[str, "CppType"] = {}
+
+
+def _interned_cpp_type(
+    spelling: str,
+    is_const: bool = False,
+    is_pointer: bool = False,
+    is_reference: bool = False,
+    kind: str = "",
+    pointee: Optional["CppType"] = None,
+    is_volatile: bool = False,
+    decl_usr: str = "",
+) -> "CppType":
+    key = (spelling, is_const, is_pointer, is_reference, kind, pointee, is_volatile, decl_usr)
+    t = _TYPE_TABLE.get(key)
+    if t is None:
+        t = _TYPE_TABLE.setdefault(
+            key,
+            CppType(sys.intern(spelling), is_const, is_pointer, is_reference, sys.intern(kind), pointee, is_volatile, sys.intern(decl_usr)),
+        )
+    return t
+
+
+def interned_type_count() -> int:
+    """
+    Number of distinct CppType instances interned in this process.
+    """
+    return len(_TYPE_TABLE)
+
+
+@_slotted
 @dataclass(frozen=True)
 class CppType:
     """
@@ -41,37 +151,117 @@ class CppType:
     - Support downstream mapping (e.g., to Godot Variant-compatible types)
 
     For complex cases (templates, namespaces), keep the spelling string intact.
+
+    Types collected by the parser are structured: `kind` is the clang TypeKind name of the
+    canonical type (e.g. "POINTER", "LVALUEREFERENCE", "RECORD", "INT"), pointer and
+    reference types carry the type they refer to in `pointee`, and record/enum types the
+    USR of their declaration. The flags then describe the declarator chain (a `const` or
+    `*` inside a template argument does not count). Types built from a spelling alone
+    (from_spelling) have an empty kind and heuristic flags.
+
+    Build instances with from_spelling() or interned() so equal types share one object.
     """
     spelling: str
     is_const: bool = False
     is_pointer: bool = False
     is_reference: bool = False
+    kind: str = ""
+    pointee: Optional[CppType] = None
+    is_volatile: bool = False
+    decl_usr: str = ""
 
     @staticmethod
     def from_spelling(spelling: str) -> CppType:
         """
-        Parse a C++ type spelling heuristically into a CppType.
-        Non-destructive: preserves the original spelling in `canonical` while
-        extracting common modifiers.
-        """
-        is_const = "const" in spelling
-        is_pointer = "*" in spelling
-        is_reference = "&" in spelling
-        return CppType(
-            spelling=spelling,
-            is_const=is_const,
-            is_pointer=is_pointer,
-            is_reference=is_reference,
+        Parse a C++ type spelling heuristically into an unstructured CppType: modifiers
+        are detected by substring, the spelling is kept as-is.
+        """
+        t = _SPELLING_TABLE.get(spelling)
+        if t is None:
+            is_const = "const" in spelling
+            is_pointer = "*" in spelling
+            is_reference = "&" in spelling
+            t = _SPELLING_TABLE.setdefault(spelling, _interned_cpp_type(spelling, is_const, is_pointer, is_reference))
+        return t
+
+    @staticmethod
+    def interned(
+        spelling: str,
+        is_const: bool = False,
+        is_pointer: bool = False,
+        is_reference: bool = False,
+        kind: str = "",
+        pointee: Optional[CppType] = None,
+        is_volatile: bool = False,
+        decl_usr: str = "",
+    ) -> CppType:
+        """
+        The shared CppType instance with these fields.
+        """
+        return _interned_cpp_type(spelling, is_const, is_pointer, is_reference, kind, pointee, is_volatile, decl_usr)
+
+    def __reduce__(self):
+        # Unpickled types (parse cache, worker processes) rejoin the intern table
+        return (
+            _interned_cpp_type,
+            (self.spelling, self.is_const, self.is_pointer, self.is_reference, self.kind, self.pointee, self.is_volatile, self.decl_usr),
         )
 
+    @property
+    def is_structured(self) -> bool:
+        """
+        True if the type was captured from clang rather than guessed from a spelling.
+        """
+        return bool(self.kind)
+
+    @property
+    def base_type(self) -> CppType:
+        """
+        The innermost type of the pointer/reference chain (the type itself if there is none).
+        """
+        t = self
+        while t.pointee is not None:
+            t = t.pointee
+        return t
+
+    @property
+    def pointer_depth(self) -> int:
+        """
+        Number of pointer levels in the chain ('int**' -> 2, 'int*&' -> 1); structured types only.
+        """
+        depth = 0
+        t: Optional[CppType] = self
+        while t is not None:
+            depth += t.kind == "POINTER"
+            t = t.pointee
+        return depth
+
     def to_dict(self) -> Dict:
         return {
             "spelling": self.spelling,
             "is_const": self.is_const,
             "is_pointer": self.is_pointer,
             "is_reference": self.is_reference,
+            "kind": self.kind,
+            "pointee": self.pointee.to_dict() if self.pointee is not None else None,
+            "is_volatile": self.is_volatile,
+            "decl_usr": self.decl_usr,
         }
 
+    @staticmethod
+    def from_dict(d: Dict) -> CppType:
+        pointee = d.get("pointee")
+        return _interned_cpp_type(
+            spelling=d["spelling"],
+            is_const=bool(d.get("is_const", False)),
+            is_pointer=bool(d.get("is_pointer", False)),
+            is_reference=bool(d.get("is_reference", False)),
+            kind=d.get("kind") or "",
+            pointee=CppType.from_dict(pointee) if pointee else None,
+            is_volatile=bool(d.get("is_volatile", False)),
+            decl_usr=d.get("decl_usr") or "",
+        )
+
 
 # --------------------------
 # Method/Parameter models
@@ -84,6 +274,7 @@ class MethodKind(Enum):
     STATIC = auto()
     OPERATOR = auto()
 
+@_slotted
 @dataclass
 class ParameterInfo:
     name: str
@@ -91,13 +282,19 @@ class ParameterInfo:
     default_value: Optional[str] = None
     is_variadic: bool = False
 
-    @property
+    @_derived
     def exposed_name(self) -> str:
         """
         Name as exposed to Godot (snake_case, sanitized).
         """
         return sanitize_identifier(self.name or "arg")
 
+    def invalidate(self) -> None:
+        """
+        Drop cached derived values; call after changing `name`.
+        """
+        _clear_derived(self)
+
     def to_dict(self) -> Dict:
         return {
             "name": self.name,
@@ -107,6 +304,16 @@ class ParameterInfo:
             "is_variadic": self.is_variadic,
         }
 
+    @staticmethod
+    def from_dict(d: Dict) -> ParameterInfo:
+        return ParameterInfo(
+            name=d.get("name", ""),
+            cpp_type=CppType.from_dict(d["cpp_type"]),
+            default_value=d.get("default_value"),
+            is_variadic=bool(d.get("is_variadic", False)),
+        )
+
+@_slotted
 @dataclass
 class MethodInfo:
     """
@@ -128,7 +335,7 @@ class MethodInfo:
     overload_index: Optional[int] = None  # set by parser if needed
     _explicit_exposed_name: Optional[str] = None  # allow renaming strategies upstream
 
-    @property
+    @_derived
     def cpp_signature(self) -> str:
         """
         Human-friendly C++ signature string (without default values),
@@ -139,7 +346,7 @@ class MethodInfo:
         qual = const_q
         return f"{self.name}({params}){qual} -> {self.return_type.spelling}"
 
-    @property
+    @_derived
     def signature_key(self) -> str:
         """
         A unique key suitable for hashing, insensitive to whitespace and qualifiers noise.
@@ -152,11 +359,19 @@ class MethodInfo:
         parts.append(f"->{self.return_type.spelling}")
         return "".join(parts)
 
-    @property
+    @_derived
     def signature_hash(self) -> str:
+        # FNV-1a values, unchanged since they are published in the manifest
+        return stable_signature_hash(self.signature_key, compat=True)
+
+    @_derived
+    def signature_digest(self) -> str:
+        """
+        blake2b hash of signature_key; the internal key for methods without a USR.
+        """
         return stable_signature_hash(self.signature_key)
 
-    @property
+    @_derived
     def exposed_name(self) -> str:
         """
         Name used for Godot exposure and wrapper method, disambiguated if overloaded.
@@ -172,12 +387,19 @@ class MethodInfo:
         # As a fallback, if an emitter wishes to always disambiguate, it can use signature_hash
         return base
 
-    @property
-    def d_method_args(self) -> List[str]:
+    @_derived
+    def d_method_args(self) -> Tuple[str, ...]:
         """
         Argument names for D_METHOD(...) binding (exposed/snake_case).
         """
-        return [p.exposed_name for p in self.parameters]
+        return tuple(p.exposed_name for p in self.parameters)
+
+    def invalidate(self) -> None:
+        """
+        Drop cached derived values (signatures, exposed name, D_METHOD args); call after
+        changing fields such as `overload_index`, `name` or `parameters`.
+        """
+        _clear_derived(self)
 
     def to_dict(self) -> Dict:
         return {
@@ -195,15 +417,36 @@ class MethodInfo:
             "parameters": [p.to_dict() for p in self.parameters],
             "cpp_signature": self.cpp_signature,
             "signature_hash": self.signature_hash,
-            "d_method_args": self.d_method_args,
+            "d_method_args": list(self.d_method_args),
             "overload_index": self.overload_index,
         }
 
+    @staticmethod
+    def from_dict(d: Dict) -> MethodInfo:
+        """
+        Rebuild a MethodInfo from to_dict() output; derived keys are ignored.
+        """
+        return MethodInfo(
+            name=d["name"],
+            return_type=CppType.from_dict(d["return_type"]),
+            parameters=[ParameterInfo.from_dict(p) for p in d.get("parameters", [])],
+            is_const=bool(d.get("is_const", False)),
+            is_virtual=bool(d.get("is_virtual", False)),
+            is_pure_virtual=bool(d.get("is_pure_virtual", False)),
+            is_explicit=bool(d.get("is_explicit", False)),
+            is_noexcept=bool(d.get("is_noexcept", False)),
+            kind=MethodKind[d.get("kind", MethodKind.INSTANCE.name)],
+            qualified_name=d.get("qualified_name", ""),
+            usr=d.get("usr", ""),
+            overload_index=d.get("overload_index"),
+        )
+
 
 # --------------------------
 # Class model
 # --------------------------
 
+@_slotted
 @dataclass
 class BaseClassRef:
     qualified_name: str
@@ -217,6 +460,15 @@ class BaseClassRef:
             "access": self.access,
         }
 
+    @staticmethod
+    def from_dict(d: Dict) -> BaseClassRef:
+        return BaseClassRef(
+            qualified_name=d["qualified_name"],
+            is_virtual=bool(d.get("is_virtual", False)),
+            access=d.get("access", "public"),
+        )
+
+@_slotted
 @dataclass
 class ClassInfo:
     name: str
@@ -225,9 +477,10 @@ class ClassInfo:
     cursor_usr: str = ""  # clang USR to deduplicate
     wrapper_prefix: str = ""  # e.g., "OCC_"
     bases: List[BaseClassRef] = field(default_factory=list)
+    # Per-kind views of `methods` are cached; call invalidate() after mutating the list
     methods: List[MethodInfo] = field(default_factory=list)
 
-    @property
+    @_derived
     def qualified_name(self) -> str:
         if self.namespaces:
             return "::".join(self.namespaces + [self.name])
@@ -248,21 +501,29 @@ class ClassInfo:
         guess = self.qualified_name.replace("::", "/") + ".h"
         return guess
 
-    @property
-    def constructors(self) -> List[MethodInfo]:
-        return [m for m in self.methods if m.kind == MethodKind.CONSTRUCTOR]
+    @_derived
+    def constructors(self) -> Tuple[MethodInfo, ...]:
+        return tuple(m for m in self.methods if m.kind == MethodKind.CONSTRUCTOR)
 
-    @property
-    def destructors(self) -> List[MethodInfo]:
-        return [m for m in self.methods if m.kind == MethodKind.DESTRUCTOR]
+    @_derived
+    def destructors(self) -> Tuple[MethodInfo, ...]:
+        return tuple(m for m in self.methods if m.kind == MethodKind.DESTRUCTOR)
 
-    @property
-    def instance_methods(self) -> List[MethodInfo]:
-        return [m for m in self.methods if m.kind == MethodKind.INSTANCE]
+    @_derived
+    def instance_methods(self) -> Tuple[MethodInfo, ...]:
+        return tuple(m for m in self.methods if m.kind == MethodKind.INSTANCE)
 
-    @property
-    def static_methods(self) -> List[MethodInfo]:
-        return [m for m in self.methods if m.kind == MethodKind.STATIC]
+    @_derived
+    def static_methods(self) -> Tuple[MethodInfo, ...]:
+        return tuple(m for m in self.methods if m.kind == MethodKind.STATIC)
+
+    def invalidate(self) -> None:
+        """
+        Drop cached derived values (qualified name, per-kind method tuples); call after
+        changing `name`, `namespaces` or `methods`, including in-place changes to the
+        `methods` list. Methods cache their own values, see MethodInfo.invalidate().
+        """
+        _clear_derived(self)
 
     def to_dict(self) -> Dict:
         """
@@ -283,6 +544,22 @@ class ClassInfo:
             "static_methods": [m.to_dict() for m in self.static_methods],
         }
 
+    @staticmethod
+    def from_dict(d: Dict) -> ClassInfo:
+        """
+        Rebuild a ClassInfo from to_dict() output (or any dict with the same field names);
+        derived keys such as "constructors" are ignored.
+        """
+        return ClassInfo(
+            name=d["name"],
+            namespaces=list(d.get("namespaces", [])),
+            header=d.get("header", ""),
+            cursor_usr=d.get("cursor_usr", ""),
+            wrapper_prefix=d.get("wrapper_prefix", ""),
+            bases=[BaseClassRef.from_dict(b) for b in d.get("bases", [])],
+            methods=[MethodInfo.from_dict(m) for m in d.get("methods", [])],
+        )
+
 
 # --------------------------
 # Generation context
@@ -317,14 +594,201 @@ class GenerationContext:
 # Template convenience helpers
 # --------------------------
 
+class _ModelView(Mapping):
+    """
+    Read-only, dict-like view of a model object for templates. Keys and values match the
+    object's to_dict(), but each value is computed only when a template reads it (as an
+    attribute or an item), so rendering does not serialize whole class trees.
+    """
+    __slots__ = ("_obj",)
+    _keys: Tuple[str, ...] = ()
+    _key_set: FrozenSet[str] = frozenset()
+
+    def __init__(self, obj) -> None:
+        self._obj = obj
+
+    def __getitem__(self, key: str):
+        if key not in self._key_set:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._obj!r})"
+
+    def to_dict(self) -> Dict:
+        return self._obj.to_dict()
+
+
+def _view_keys(cls):
+    # Keys are the view's public properties, in definition order
+    cls._keys = tuple(k for k, v in cls.__dict__.items() if isinstance(v, property))
+    cls._key_set = frozenset(cls._keys)
+    return cls
+
+
+@_view_keys
+class ParameterView(_ModelView):
+    __slots__ = ()
+
+    @property
+    def name(self) -> str:
+        return self._obj.name
+
+    @property
+    def exposed_name(self) -> str:
+        return self._obj.exposed_name
+
+    @property
+    def cpp_type(self) -> Dict:
+        return self._obj.cpp_type.to_dict()
+
+    @property
+    def default_value(self) -> Optional[str]:
+        return self._obj.default_value
+
+    @property
+    def is_variadic(self) -> bool:
+        return self._obj.is_variadic
+
+
+@_view_keys
+class MethodView(_ModelView):
+    __slots__ = ()
+
+    @property
+    def name(self) -> str:
+        return self._obj.name
+
+    @property
+    def exposed_name(self) -> str:
+        return self._obj.exposed_name
+
+    @property
+    def qualified_name(self) -> str:
+        return self._obj.qualified_name or self._obj.name
+
+    @property
+    def usr(self) -> str:
+        return self._obj.usr
+
+    @property
+    def kind(self) -> str:
+        return self._obj.kind.name
+
+    @property
+    def is_const(self) -> bool:
+        return self._obj.is_const
+
+    @property
+    def is_virtual(self) -> bool:
+        return self._obj.is_virtual
+
+    @property
+    def is_pure_virtual(self) -> bool:
+        return self._obj.is_pure_virtual
+
+    @property
+    def is_explicit(self) -> bool:
+        return self._obj.is_explicit
+
+    @property
+    def is_noexcept(self) -> bool:
+        return self._obj.is_noexcept
+
+    @property
+    def return_type(self) -> Dict:
+        return self._obj.return_type.to_dict()
+
+    @property
+    def parameters(self) -> List[ParameterView]:
+        return [ParameterView(p) for p in self._obj.parameters]
+
+    @property
+    def cpp_signature(self) -> str:
+        return self._obj.cpp_signature
+
+    @property
+    def signature_hash(self) -> str:
+        return self._obj.signature_hash
+
+    @property
+    def d_method_args(self) -> List[str]:
+        return list(self._obj.d_method_args)
+
+    @property
+    def overload_index(self) -> Optional[int]:
+        return self._obj.overload_index
+
+
+@_view_keys
+class ClassView(_ModelView):
+    __slots__ = ()
+
+    @property
+    def name(self) -> str:
+        return self._obj.name
+
+    @property
+    def namespaces(self) -> List[str]:
+        return list(self._obj.namespaces)
+
+    @property
+    def qualified_name(self) -> str:
+        return self._obj.qualified_name
+
+    @property
+    def absolute_qualified_name(self) -> str:
+        q = self._obj.qualified_name
+        return q if q.startswith("::") else "::" + q
+
+    @property
+    def header(self) -> str:
+        return self._obj.include_header
+
+    @property
+    def wrapper_name(self) -> str:
+        return self._obj.wrapper_name
+
+    @property
+    def bases(self) -> List[Dict]:
+        return [b.to_dict() for b in self._obj.bases]
+
+    @property
+    def methods(self) -> List[MethodView]:
+        return [MethodView(m) for m in self._obj.methods]
+
+    @property
+    def constructors(self) -> List[MethodView]:
+        return [MethodView(m) for m in self._obj.constructors]
+
+    @property
+    def destructors(self) -> List[MethodView]:
+        return [MethodView(m) for m in self._obj.destructors]
+
+    @property
+    def instance_methods(self) -> List[MethodView]:
+        return [MethodView(m) for m in self._obj.instance_methods]
+
+    @property
+    def static_methods(self) -> List[MethodView]:
+        return [MethodView(m) for m in self._obj.static_methods]
+
+
 def build_template_context(prefix: str, classes: Iterable[ClassInfo]) -> Dict:
     """
     Produce a flattened context dict to pass to Jinja2 templates.
-    Keeps the surface small and stable across templates.
+    Keeps the surface small and stable across templates: each class is a ClassView,
+    which exposes the keys of ClassInfo.to_dict() but computes them on access.
     """
     return {
         "prefix": prefix,
-        "classes": [c.to_dict() for c in classes],
+        "classes": [ClassView(c) for c in classes],
     }
 
 
@@ -336,6 +800,10 @@ __all__ = [
     "BaseClassRef",
     "ClassInfo",
     "GenerationContext",
+    "ClassView",
+    "MethodView",
+    "ParameterView",
+    "interned_type_count",
     "camel_to_snake",
     "sanitize_identifier",
     "stable_signature_hash",
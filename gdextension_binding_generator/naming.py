@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Identifier naming for the GDExtension binding generator.
+
+Every name exposed to Godot or emitted into C++ (method and parameter names, template
+`sanitize` filter output, D_METHOD arguments) goes through sanitize_identifier(). The same
+few thousand names recur across a library, so results are memoized in a bounded LRU
+cache, and reserved words are looked up in a frozenset.
+
+assign_exposed_names() resolves the exposed method names of one class in a single pass:
+overloads get deterministic suffixes (_1, _2, ...) and no two exposed methods of the class,
+instance or static, end up with the same name.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Sequence, Set, Tuple
+
+if TYPE_CHECKING:
+    from .models import MethodInfo
+
+# Sanitized names kept in the LRU cache
+NAME_CACHE_SIZE = 1 << 16
+
+# C++ keywords and common builtins
+_CPP_KEYWORDS = frozenset({
+    "alignas", "alignof", "and", "and_eq", "asm", "auto", "bitand", "bitor", "bool", "break", "case",
+    "catch", "char", "char8_t", "char16_t", "char32_t", "class", "compl", "const", "consteval",
+    "constexpr", "constinit", "const_cast", "continue", "co_await", "co_return", "co_yield",
+    "decltype", "default", "delete", "do", "double", "dynamic_cast", "else", "enum", "explicit",
+    "export", "extern", "false", "float", "for", "friend", "goto", "if", "inline", "int", "long",
+    "mutable", "namespace", "new", "noexcept", "not", "not_eq", "nullptr", "operator", "or", "or_eq",
+    "private", "protected", "public", "register", "reinterpret_cast", "return", "short", "signed",
+    "sizeof", "static", "static_assert", "static_cast", "struct", "switch", "template", "this",
+    "thread_local", "throw", "true", "try", "typedef", "typeid", "typename", "union", "unsigned",
+    "using", "virtual", "void", "volatile", "wchar_t", "while", "xor", "xor_eq",
+})
+
+# Godot/GDScript identifiers we avoid exposing verbatim
+_GODOT_RESERVED = frozenset({
+    "signal", "var", "self", "super", "_init", "_ready", "_process", "_physics_process",
+})
+
+RESERVED_IDENTIFIERS: FrozenSet[str] = _CPP_KEYWORDS | _GODOT_RESERVED
+
+# An uppercase ASCII letter that follows a letter starts a new snake_case word
+_ASCII_WORD_BOUNDARY = re.compile(r"(?<=[A-Za-z])(?=[A-Z])")
+_ASCII_NON_WORD = re.compile(r"[^0-9A-Za-z_]")
+
+
+def _camel_to_snake(name: str) -> str:
+    if name.isascii():
+        return _ASCII_WORD_BOUNDARY.sub("_", name).lower()
+    out: List[str] = []
+    prev_alpha = False
+    for ch in name:
+        if ch.isupper() and prev_alpha:
+            out.append("_")
+        out.append(ch.lower())
+        prev_alpha = ch.isalpha()
+    return "".join(out)
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def camel_to_snake(name: str) -> str:
+    """
+    Convert CamelCase or mixedCase to snake_case, leaving existing underscores intact.
+    """
+    return _camel_to_snake(name)
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def sanitize_identifier(name: str) -> str:
+    """
+    Sanitize an identifier for exposure to C++/Godot:
+    - Convert to snake_case (consistent with templates).
+    - Replace non [A-Za-z0-9_] characters with underscores.
+    - Ensure it does not start with a digit (prefix with underscore if needed).
+    - If it collides with a reserved identifier or C++ keyword, append a trailing underscore.
+    """
+    snake = _camel_to_snake(name or "identifier")
+    if snake.isascii():
+        ident = _ASCII_NON_WORD.sub("_", snake)
+    else:
+        ident = "".join(ch if ch.isalnum() or ch == "_" else "_" for ch in snake)
+    if ident[0].isdigit():
+        ident = f"_{ident}"
+    if ident in RESERVED_IDENTIFIERS:
+        ident = f"{ident}_"
+    return ident
+
+
+def naming_cache_info() -> Dict[str, int]:
+    """
+    Hit/miss counters of the sanitize_identifier cache.
+    """
+    info = sanitize_identifier.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "max_size": info.maxsize or 0}
+
+
+def clear_naming_cache() -> None:
+    sanitize_identifier.cache_clear()
+    camel_to_snake.cache_clear()
+
+
+def assign_exposed_names(methods: Sequence[MethodInfo]) -> None:
+    """
+    Resolve the exposed names of one class's methods in a single pass by setting their
+    overload_index.
+
+    Methods are grouped by sanitized name, separately for instance and static methods, and
+    each group is ordered by signature_key. The first method of a group keeps the plain
+    name (index 0, or None when it is not overloaded) and the others get suffixes _1, _2,
+    ... Plain names are claimed first, instance methods before static ones; a candidate
+    name already taken by another method of the class moves on to the next free suffix.
+    Constructors and destructors are not exposed as methods and are left untouched.
+    """
+    from .models import MethodKind
+
+    groups: Dict[Tuple[bool, str], List[MethodInfo]] = {}
+    for m in methods:
+        if m.kind not in (MethodKind.INSTANCE, MethodKind.STATIC, MethodKind.OPERATOR):
+            continue
+        base = sanitize_identifier(m._explicit_exposed_name or m.name)
+        groups.setdefault((m.kind == MethodKind.STATIC, base), []).append(m)
+
+    ordered = sorted(groups.items(), key=lambda item: item[0][0])
+    taken: Set[str] = set()
+    pending: List[Tuple[str, List[MethodInfo]]] = []
+    for (_, base), members in ordered:
+        members.sort(key=lambda m: m.signature_key)
+        if base in taken:
+            pending.append((base, members))
+            continue
+        taken.add(base)
+        members[0].overload_index = 0 if len(members) > 1 else None
+        members[0].invalidate()
+        pending.append((base, members[1:]))
+
+    for base, rest in pending:
+        suffix = 1
+        for m in rest:
+            while f"{base}_{suffix}" in taken:
+                suffix += 1
+            taken.add(f"{base}_{suffix}")
+            m.overload_index = suffix
+            m.invalidate()
+            suffix += 1
+
+
+__all__ = [
+    "NAME_CACHE_SIZE",
+    "RESERVED_IDENTIFIERS",
+    "assign_exposed_names",
+    "camel_to_snake",
+    "clear_naming_cache",
+    "naming_cache_info",
+    "sanitize_identifier",
+]
@@ -22,12 +22,22 @@ Requirements:
 
 from __future__ import annotations
 
-# removed unused import: os
-
+import contextlib
+import math
+import os
 import re
+import shutil
 import sys
+import tempfile
+import threading
+import time
+import multiprocessing
+from multiprocessing import util as mp_util
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple, Union
 import logging
 
 logger = logging.getLogger(__name__)
@@ -37,6 +47,7 @@ try:
 except Exception:  # pragma: no cover
     cindex = None  # Lazy error on use
 
+from .parse_cache import ParseCache, ParseResult
 from ..models import (
     BaseClassRef,
     ClassInfo,
@@ -44,8 +55,9 @@ from ..models import (
     MethodInfo,
     MethodKind,
     ParameterInfo,
-    sanitize_identifier,
 )
+from ..fingerprint import fingerprint_parts, fingerprint_text, generator_fingerprint
+from ..naming import assign_exposed_names
 
 
 # --------------------------
@@ -72,26 +84,346 @@ def _create_index():
     return idx_cls.create()
 
 
-def parse_translation_unit(header: Path, clang_args: List[str]):
+def _parse_options() -> int:
+    tu_cls = getattr(cindex, "TranslationUnit", None)
+    return (
+        getattr(tu_cls, "PARSE_SKIP_FUNCTION_BODIES", 0)
+        | getattr(tu_cls, "PARSE_INCOMPLETE", 0)
+        | getattr(tu_cls, "PARSE_DETAILED_PROCESSING_RECORD", 0)
+    )
+
+
+def _effective_clang_args(clang_args: List[str]) -> List[str]:
+    args = list(clang_args)
+    # Silence warnings from system headers
+    if not any(a.startswith("-W") for a in args):
+        args.extend(["-Wno-everything"])
+    return args
+
+
+@dataclass
+class ParseStats:
+    """
+    Timing counters for libclang work, aggregated across sessions and workers.
+    """
+    sessions: int = 0
+    translation_units: int = 0
+    umbrella_fallbacks: int = 0
+    pch_fallbacks: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    pruned_classes: int = 0
+    index_setup_seconds: float = 0.0
+    index_teardown_seconds: float = 0.0
+    parse_seconds: float = 0.0
+
+    def add(self, other: "ParseStats") -> None:
+        self.sessions += other.sessions
+        self.translation_units += other.translation_units
+        self.umbrella_fallbacks += other.umbrella_fallbacks
+        self.pch_fallbacks += other.pch_fallbacks
+        self.cache_hits += other.cache_hits
+        self.cache_misses += other.cache_misses
+        self.pruned_classes += other.pruned_classes
+        self.index_setup_seconds += other.index_setup_seconds
+        self.index_teardown_seconds += other.index_teardown_seconds
+        self.parse_seconds += other.parse_seconds
+
+    def to_dict(self) -> Dict:
+        return {
+            "sessions": self.sessions,
+            "translation_units": self.translation_units,
+            "umbrella_fallbacks": self.umbrella_fallbacks,
+            "pch_fallbacks": self.pch_fallbacks,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "pruned_classes": self.pruned_classes,
+            "index_setup_seconds": self.index_setup_seconds,
+            "index_teardown_seconds": self.index_teardown_seconds,
+            "parse_seconds": self.parse_seconds,
+        }
+
+
+class ParseSession:
+    """
+    Owns a single libclang Index and reuses it for every header parsed through it.
+
+    The Index is created lazily on the first parse and disposed by close() (or on leaving a
+    `with` block). Translation units keep a reference to their Index, so callers should drop
+    them before closing for the disposal to happen at that point.
+
+    Usage:
+        with ParseSession() as session:
+            for header in headers:
+                tu = session.parse(header, clang_args)
+                ...
+        logger.info("index setup took %.3fs", session.stats.index_setup_seconds)
+    """
+
+    def __init__(self) -> None:
+        self._index: Any = None
+        self.stats = ParseStats()
+
+    @property
+    def index(self) -> Any:
+        if self._index is None:
+            start = time.perf_counter()
+            self._index = _create_index()
+            self.stats.index_setup_seconds += time.perf_counter() - start
+            self.stats.sessions += 1
+        return self._index
+
+    def parse(
+        self,
+        header: Path,
+        clang_args: List[str],
+        unsaved_files: Optional[List[Tuple[str, str]]] = None,
+    ):
+        """
+        Parse a single header into a TranslationUnit using this session's Index.
+
+        `unsaved_files` is forwarded to libclang as (path, contents) pairs, e.g. for
+        synthetic sources that only exist in memory.
+        """
+        idx = self.index
+        start = time.perf_counter()
+        tu = idx.parse(
+            str(header),
+            args=_effective_clang_args(clang_args),
+            unsaved_files=unsaved_files,
+            options=_parse_options(),
+        )
+        self.stats.parse_seconds += time.perf_counter() - start
+        self.stats.translation_units += 1
+        return tu
+
+    def close(self) -> None:
+        """
+        Dispose of the Index. Safe to call more than once; a later parse() creates a new Index.
+        """
+        if self._index is None:
+            return
+        start = time.perf_counter()
+        # Dropping the last reference runs clang_disposeIndex immediately (refcounting)
+        self._index = None
+        self.stats.index_teardown_seconds += time.perf_counter() - start
+
+    def __enter__(self) -> "ParseSession":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def parse_translation_unit(header: Path, clang_args: List[str], session: Optional[ParseSession] = None):
     """
     Parse a single header into a TranslationUnit with conservative options suitable
     for faster traversal and minimal preprocessing effects.
+
+    Pass a ParseSession to reuse its Index; without one, a throwaway Index is created.
     """
+    if session is not None:
+        return session.parse(header, clang_args)
     idx = _create_index()
-    args = list(clang_args)
-    # Silence warnings from system headers
-    if not any(a.startswith("-W") for a in args):
-        args.extend(["-Wno-everything"])
-    tu = idx.parse(
-        str(header),
-        args=args,
-        options=(
-            getattr(getattr(cindex, "TranslationUnit", None), "PARSE_SKIP_FUNCTION_BODIES", 0)
-            | getattr(getattr(cindex, "TranslationUnit", None), "PARSE_INCOMPLETE", 0)
-            | getattr(getattr(cindex, "TranslationUnit", None), "PARSE_DETAILED_PROCESSING_RECORD", 0)
-        ),
+    return idx.parse(str(header), args=_effective_clang_args(clang_args), options=_parse_options())
+
+
+class _SessionPool:
+    """
+    One ParseSession per thread, created on first use and closed together by close_all().
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions: List[ParseSession] = []
+
+    def get(self) -> ParseSession:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = ParseSession()
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def close_all(self) -> ParseStats:
+        total = ParseStats()
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+            total.add(session.stats)
+        self._local = threading.local()
+        return total
+
+
+class _ClassRegistry:
+    """
+    Run-wide set of class keys (USR, or qualified name without one) that some translation
+    unit has already claimed for extraction.
+
+    The first TU to reach a class definition claims it and extracts it; every later TU
+    prunes that subtree without touching its methods. Shared by reference between the
+    serial loop and worker threads.
+    """
+
+    def __init__(self, keys: Iterable[str] = ()) -> None:
+        self._keys = set(keys)
+        self._lock = threading.Lock()
+
+    def claim(self, key: str) -> bool:
+        """
+        Return True if the caller is the first to claim `key`.
+        """
+        with self._lock:
+            if key in self._keys:
+                return False
+            self._keys.add(key)
+            return True
+
+    def update(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            self._keys.update(keys)
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            return list(self._keys)
+
+
+class _SharedClassRegistry:
+    """
+    _ClassRegistry counterpart for worker processes, backed by a multiprocessing.Manager
+    dict mapping each claimed key to the claiming process.
+
+    Keys this process has already seen are answered locally, so each class costs at most
+    one round trip to the manager per worker.
+    """
+
+    def __init__(self, claims: Any) -> None:
+        self._claims = claims
+        self._owner = os.getpid()
+        self._seen: set = set()
+
+    def claim(self, key: str) -> bool:
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        return self._claims.setdefault(key, self._owner) == self._owner
+
+
+PARSE_POOLS: Tuple[str, ...] = ("process", "thread")
+
+# Per-process session pool and class registry for ProcessPoolExecutor workers
+# (set by _init_process_worker)
+_PROCESS_SESSIONS: Optional[_SessionPool] = None
+_PROCESS_CLASSES: Optional[_SharedClassRegistry] = None
+
+
+def _init_process_worker(stats_queue: Any, claims: Any = None) -> None:
+    """
+    ProcessPoolExecutor initializer: give the worker its own session pool, and report the
+    worker's stats through `stats_queue` when it exits (after the pool shuts down).
+
+    `claims` is the Manager dict proxy shared by all workers for class claims.
+    """
+    global _PROCESS_SESSIONS, _PROCESS_CLASSES
+    _PROCESS_SESSIONS = _SessionPool()
+    _PROCESS_CLASSES = _SharedClassRegistry(claims) if claims is not None else None
+
+    def _finalize(pool: _SessionPool = _PROCESS_SESSIONS) -> None:
+        stats_queue.put(pool.close_all())
+
+    mp_util.Finalize(_PROCESS_SESSIONS, _finalize, exitpriority=10)
+
+
+# --------------------------
+# Precompiled prefix header
+# --------------------------
+
+@dataclass(frozen=True)
+class PrecompiledPrefix:
+    """
+    A PCH built from a prefix header (typically the Standard_*/STL includes shared by
+    every header of a library). One PCH is built per run, for the run's single set of
+    clang args. It cannot be used to parse a header it already contains (the header would
+    be defined twice); args_for() returns None then, and also as a safety check when
+    called with args other than the ones the PCH was built with.
+    """
+    prefix_header: Path
+    pch_path: Path
+    clang_args: Tuple[str, ...]
+    covered_files: FrozenSet[str] = frozenset()
+
+    def args_for(self, clang_args: Sequence[str], batch: Sequence[Path] = ()) -> Optional[List[str]]:
+        if tuple(clang_args) != self.clang_args:
+            return None
+        if any(str(Path(h).resolve()) in self.covered_files for h in batch):
+            return None
+        return list(clang_args) + ["-include-pch", str(self.pch_path)]
+
+
+def build_prefix_pch(
+    prefix_header: Path,
+    clang_args: List[str],
+    pch_dir: Path,
+    session: Optional[ParseSession] = None,
+) -> Optional[PrecompiledPrefix]:
+    """
+    Parse `prefix_header` once and save it as a PCH under `pch_dir`.
+
+    libclang's precompiled preamble only speeds up reparsing the same main file, so a
+    real PCH passed via -include-pch is what lets distinct headers share the prefix.
+    Returns None (after logging a warning) when the prefix header does not parse cleanly
+    or the PCH cannot be written; callers then parse without a PCH.
+    """
+    ensure_libclang_loaded()
+    prefix_header = Path(prefix_header).resolve()
+    key = "\0".join([str(prefix_header)] + list(clang_args))
+    digest = fingerprint_text(key)[:16]
+    pch_path = Path(pch_dir) / f"{prefix_header.stem}-{digest}.pch"
+    error = getattr(getattr(cindex, "Diagnostic", None), "Error", 3)
+
+    own_session = session is None
+    session = session or ParseSession()
+    start = time.perf_counter()
+    try:
+        tu = session.parse(prefix_header, clang_args)
+        errors = [str(d) for d in tu.diagnostics if getattr(d, "severity", 0) >= error]
+        if errors:
+            logger.warning("Not using a PCH: prefix header %s has errors (first: %s)", prefix_header, errors[0])
+            return None
+        covered = {str(prefix_header)}
+        for inc in tu.get_includes():
+            try:
+                covered.add(str(Path(str(inc.include.name)).resolve()))
+            except Exception:
+                continue
+        Path(pch_dir).mkdir(parents=True, exist_ok=True)
+        tu.save(str(pch_path))
+    except Exception as ex:
+        logger.warning("Not using a PCH: failed to build one from %s: %s", prefix_header, ex)
+        return None
+    finally:
+        if own_session:
+            session.close()
+    logger.info("Built PCH for prefix header %s in %.2fs", prefix_header, time.perf_counter() - start)
+    return PrecompiledPrefix(
+        prefix_header=prefix_header,
+        pch_path=pch_path,
+        clang_args=tuple(clang_args),
+        covered_files=frozenset(covered),
     )
-    return tu
+
+
+def _is_pch_failure(tu: Any) -> bool:
+    fatal = getattr(getattr(cindex, "Diagnostic", None), "Fatal", 4)
+    for d in tu.diagnostics:
+        if getattr(d, "severity", 0) >= fatal:
+            text = str(getattr(d, "spelling", "") or d).lower()
+            if "pch" in text or "precompiled" in text or "ast file" in text:
+                return True
+    return False
 
 
 # --------------------------
@@ -177,15 +509,62 @@ def _fully_qualified_type_spelling(tp: Any) -> str:
         spelling = _qualified_name_from_cursor(decl)
     return spelling
 
+_POINTER_TYPE_KINDS = frozenset({"POINTER"})
+_REFERENCE_TYPE_KINDS = frozenset({"LVALUEREFERENCE", "RVALUEREFERENCE"})
+
+
+def _structured_cpp_type(ct: Any, spelling: str) -> CppType:
+    """
+    Build a structured CppType from a canonical clang Type: its TypeKind, cv-qualifiers,
+    the pointee chain of pointers/references and the USR of a record/enum declaration.
+    """
+    kind = ct.kind.name
+    pointee: Optional[CppType] = None
+    decl_usr = ""
+    if kind in _POINTER_TYPE_KINDS or kind in _REFERENCE_TYPE_KINDS:
+        inner = ct.get_pointee()
+        pointee = _structured_cpp_type(inner, getattr(inner, "spelling", None) or "void")
+    else:
+        try:
+            decl_usr = ct.get_declaration().get_usr() or ""
+        except Exception:
+            decl_usr = ""
+    is_const = bool(ct.is_const_qualified())
+    is_volatile = bool(ct.is_volatile_qualified())
+    is_reference = kind in _REFERENCE_TYPE_KINDS
+    is_pointer = kind in _POINTER_TYPE_KINDS
+    if pointee is not None:
+        # const/volatile anywhere in the declarator chain; a reference to a pointer is a pointer
+        is_const = is_const or pointee.is_const
+        is_volatile = is_volatile or pointee.is_volatile
+        is_pointer = is_pointer or (is_reference and pointee.is_pointer)
+    return CppType.interned(
+        spelling,
+        is_const=is_const,
+        is_pointer=is_pointer,
+        is_reference=is_reference,
+        kind=kind,
+        pointee=pointee,
+        is_volatile=is_volatile,
+        decl_usr=decl_usr,
+    )
+
+
 def _cpp_type_from_clang_type(tp: Any) -> CppType:
     """
-    Convert a clang Type to a CppType with best effort. We primarily rely on
-    the type spelling; detection of pointer/reference/const is delegated to
-    the CppType.from_spelling heuristic. The spelling is normalized to a
-    fully qualified form when possible.
+    Convert a clang Type to a CppType. The spelling is normalized to a fully qualified
+    form when possible; kind, cv-qualifiers, pointee chain and declaration USR are read
+    from the canonical type while the cursor is live. Falls back to the
+    CppType.from_spelling heuristic if the type cannot be inspected.
     """
     spelling = _fully_qualified_type_spelling(tp)
-    return CppType.from_spelling(spelling)
+    try:
+        get_canon = getattr(tp, "get_canonical", None)
+        ct = get_canon() if callable(get_canon) else tp
+        return _structured_cpp_type(ct, spelling)
+    except Exception as ex:
+        logger.debug("Cannot inspect clang type '%s'; guessing from its spelling: %s", spelling, ex)
+        return CppType.from_spelling(spelling)
 
 
 def _method_kind_from_cursor(node: Any) -> MethodKind:
@@ -218,6 +597,21 @@ def _should_consider_location(node: Any, include_filters: Optional[List[str]]) -
     return not _is_system_location(loc)
 
 
+def _is_foreign_location(node: Any, main_files: FrozenSet[str], resolved: Dict[str, str]) -> bool:
+    """
+    True if `node` lives in a file outside `main_files` (resolved paths). Nodes without a
+    file (the TU itself) are never foreign. `resolved` memoizes path resolution per walk.
+    """
+    loc = getattr(node, "location", None)
+    if loc is None or loc.file is None:
+        return False
+    name = str(loc.file.name)
+    fpath = resolved.get(name)
+    if fpath is None:
+        fpath = resolved[name] = str(Path(name).resolve())
+    return fpath not in main_files
+
+
 def _best_header_for_cursor(node: Any) -> str:
     try:
         return node.location.file.name  # type: ignore[attr-defined]
@@ -232,7 +626,7 @@ def _parse_parameters(node: Any) -> List[ParameterInfo]:
     params: List[ParameterInfo] = []
     try:
         for i, p in enumerate(getattr(node, "get_arguments", lambda: [])(), start=1):
-            name = p.spelling or f"arg{i}"
+            name = sys.intern(p.spelling or f"arg{i}")
             cpp_t = _cpp_type_from_clang_type(p.type)
             params.append(ParameterInfo(name=name, cpp_type=cpp_t, default_value=None))
     except Exception as ex:
@@ -254,7 +648,7 @@ def _parse_method(
         return None
 
     kind = _method_kind_from_cursor(node)
-    name = node.spelling or ""
+    name = sys.intern(node.spelling or "")
     usr = ""
     try:
         usr = node.get_usr() or ""
@@ -348,19 +742,88 @@ def _parse_base_specifiers(node: Any) -> List[BaseClassRef]:
     return bases
 
 
+def _class_key(ci: ClassInfo) -> str:
+    return ci.cursor_usr or ci.qualified_name
+
+
+def _method_key(mi: MethodInfo) -> str:
+    return mi.usr or mi.signature_digest
+
+
+class _ClassMerger:
+    """
+    ClassInfo records keyed by USR (or qualified name), merging repeated sightings of a
+    class so that each method (by USR, or signature without one) and each base (by
+    qualified name) is held once. Member indexes are only built for classes seen twice.
+    """
+
+    def __init__(self) -> None:
+        self.classes: Dict[str, ClassInfo] = {}
+        self._methods: Dict[str, set] = {}
+        self._bases: Dict[str, set] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.classes
+
+    def values(self) -> Iterable[ClassInfo]:
+        return self.classes.values()
+
+    def add(self, ci: ClassInfo, key: Optional[str] = None) -> None:
+        key = key or _class_key(ci)
+        existing = self.classes.get(key)
+        if existing is None:
+            self.classes[key] = ci
+            return
+        if existing is ci:
+            return
+        methods = self._methods.get(key)
+        if methods is None:
+            methods = self._methods[key] = {_method_key(m) for m in existing.methods}
+        for m in ci.methods:
+            mk = _method_key(m)
+            if mk not in methods:
+                methods.add(mk)
+                existing.methods.append(m)
+        existing.invalidate()
+        bases = self._bases.get(key)
+        if bases is None:
+            bases = self._bases[key] = {b.qualified_name for b in existing.bases}
+        for b in ci.bases:
+            if b.qualified_name not in bases:
+                bases.add(b.qualified_name)
+                existing.bases.append(b)
+        # Prefer a concrete header path
+        if not existing.header and ci.header:
+            existing.header = ci.header
+
+
 def _collect_class_decls(
     tu: object,
     include_filters: Optional[List[str]],
     exclude_class_regex: Optional[object],
     prefix: str,
+    registry: Optional[Any] = None,
+    skipped: Optional[List[str]] = None,
+    main_files: Optional[FrozenSet[str]] = None,
 ):
     """
     Traverse the TU and collect ClassInfo entries including methods.
+
+    With a class registry, a class definition is only extracted if this TU wins its claim;
+    otherwise its subtree is pruned and its key appended to `skipped`.
+
+    With `main_files` (resolved paths), declarations located in any other file are pruned
+    without being walked, so the TU only contributes what its own headers define.
     """
-    class_map: Dict[str, ClassInfo] = {}
+    class_map = _ClassMerger()
+    resolved: Dict[str, str] = {}
 
     def visit(node) -> None:
         try:
+            # Main-file-only mode: included headers belong to their own TUs
+            if main_files is not None and _is_foreign_location(node, main_files, resolved):
+                return
+
             # Respect file filters and avoid system locations unless overridden
             if not _should_consider_location(node, include_filters):
                 # Warn when include filters are active and a class/struct is excluded
@@ -434,6 +897,13 @@ def _collect_class_decls(
                             wrapper_prefix=prefix,
                         )
 
+                        # Another TU already extracted this class (and its nested classes)
+                        key = usr or ci.qualified_name
+                        if registry is not None and key not in class_map and not registry.claim(key):
+                            if skipped is not None:
+                                skipped.append(key)
+                            return
+
                         # Parse base classes
                         ci.bases = _parse_base_specifiers(node)
 
@@ -446,16 +916,7 @@ def _collect_class_decls(
                                     ci.methods.append(mi)
 
                         # Deduplicate by USR if available; otherwise by qualified name
-                        key = usr or ci.qualified_name
-                        if key not in class_map:
-                            class_map[key] = ci
-                        else:
-                            # Merge methods if the class was encountered multiple times
-                            existing = class_map[key]
-                            existing.methods.extend(ci.methods)
-                            # Prefer a concrete header path
-                            if not existing.header and ci.header:
-                                existing.header = ci.header
+                        class_map.add(ci, key)
 
             # Recurse
             for c in node.get_children():
@@ -480,34 +941,381 @@ def _collect_class_decls(
 def _assign_overload_indices(ci: ClassInfo) -> None:
     """
     Detect overloaded methods by name within instance/static groups, assign deterministic indices.
-    The first overload keeps base name (index 0), subsequent overloads get suffixes (_1, _2, ...).
+    The first overload keeps base name (index 0), subsequent overloads get suffixes (_1, _2, ...);
+    see naming.assign_exposed_names for how colliding names are resolved.
     """
-    # Group by (kind_group, base_name)
-    # kind_group distinguishes instance and static; we avoid mixing them in overload sets
-    groups: Dict[Tuple[str, str], List[int]] = {}
-    for i, m in enumerate(ci.methods):
-        if m.kind not in (MethodKind.INSTANCE, MethodKind.STATIC, MethodKind.OPERATOR):
-            continue
-        # Operators also overload; treat "operator_plus" style exposure; leave as-is for now
-        base_name = sanitize_identifier(m.name)
-        kind_group = "static" if m.kind == MethodKind.STATIC else "instance"
-        groups.setdefault((kind_group, base_name), []).append(i)
-
-    for _, idxs in groups.items():
-        if len(idxs) <= 1:
-            # Single method: not overloaded, leave overload_index as None
+    assign_exposed_names(ci.methods)
+
+
+# --------------------------
+# Translation-unit workers
+# --------------------------
+
+# Batch size keywords accepted besides a positive integer
+BATCH_MODES: Tuple[str, ...] = ("auto", "all")
+
+# Auto batch sizing: headers parsed as probes, and the target share of TU time spent on the
+# shared include prefix (which is what umbrella TUs amortize).
+_AUTO_PROBE_HEADERS = 4
+_AUTO_SHARED_OVERHEAD = 0.1
+
+
+def _umbrella_source(batch: Sequence[Path]) -> str:
+    lines = ["// Umbrella translation unit synthesized by the GDExtension binding generator"]
+    lines.extend(f'#include "{Path(h).as_posix()}"' for h in batch)
+    return "\n".join(lines) + "\n"
+
+
+def _umbrella_path(batch: Sequence[Path]) -> Path:
+    """
+    In-memory path for an umbrella TU. It lives next to the first header and reuses its
+    suffix, so relative lookups and clang's language detection match per-header parsing.
+    """
+    first = Path(batch[0])
+    digest = fingerprint_parts(str(h) for h in batch)[:12]
+    return first.parent / f"__gdextension_umbrella_{digest}{first.suffix}"
+
+
+def _has_fatal_diagnostics(tu: Any) -> bool:
+    fatal = getattr(getattr(cindex, "Diagnostic", None), "Fatal", 4)
+    return any(getattr(d, "severity", 0) >= fatal for d in tu.diagnostics)
+
+
+def _parse_unit(
+    session: ParseSession,
+    batch: Sequence[Path],
+    clang_args: List[str],
+    pch: Optional[PrecompiledPrefix] = None,
+):
+    """
+    Parse one work unit: the header itself for a single-header batch, otherwise a synthetic
+    umbrella TU that #includes every header of the batch.
+
+    With a PrecompiledPrefix usable for these clang args and headers the unit is parsed
+    against the PCH; if libclang rejects it, the unit is parsed again without.
+    """
+    pch_args = pch.args_for(clang_args, batch) if pch is not None else None
+    if pch_args is not None:
+        try:
+            tu = _parse_unit_with_args(session, batch, pch_args)
+            if not _is_pch_failure(tu):
+                return tu
+            del tu
+        except Exception as ex:
+            logger.debug("Parsing %s with PCH %s failed: %s", batch[0], pch.pch_path, ex)
+        session.stats.pch_fallbacks += 1
+    return _parse_unit_with_args(session, batch, clang_args)
+
+
+def _parse_unit_with_args(session: ParseSession, batch: Sequence[Path], clang_args: List[str]):
+    if len(batch) == 1:
+        return session.parse(batch[0], clang_args)
+    path = _umbrella_path(batch)
+    return session.parse(path, clang_args, unsaved_files=[(str(path), _umbrella_source(batch))])
+
+
+def _collect_from_tu(
+    tu: Any,
+    batch: Sequence[Path],
+    include_filters: Optional[List[str]],
+    exclude_class_regex: Optional[object],
+    prefix: str,
+    emit_diagnostics: bool,
+    main_file_only: bool = False,
+    registry: Optional[Any] = None,
+) -> ParseResult:
+    """
+    Collect the classes and diagnostics of a parsed unit for the headers in `batch`.
+
+    In main-file-only mode the unit's own headers own every class it reports, so the
+    class registry is not consulted.
+    """
+    diagnostics = [str(diag) for diag in tu.diagnostics] if emit_diagnostics else []
+    skipped: List[str] = []
+    classes = _collect_class_decls(
+        tu=tu,
+        include_filters=include_filters,
+        exclude_class_regex=exclude_class_regex,
+        prefix=prefix,
+        registry=None if main_file_only else registry,
+        skipped=skipped,
+        main_files=frozenset(str(Path(h).resolve()) for h in batch) if main_file_only else None,
+    )
+    return classes, diagnostics, skipped
+
+
+def _parse_batch_classes(
+    batch: Sequence[Path],
+    clang_args: List[str],
+    include_filters: Optional[List[str]],
+    exclude_class_regex: Optional[object],
+    prefix: str,
+    emit_diagnostics: bool,
+    main_file_only: bool = False,
+    pch: Optional[PrecompiledPrefix] = None,
+    cache: Optional[ParseCache] = None,
+    sessions: Optional[_SessionPool] = None,
+    registry: Optional[_ClassRegistry] = None,
+) -> ParseResult:
+    """
+    Parse a batch of headers (one TU) and collect its classes.
+
+    Runs unchanged in the calling process, in a worker thread or in a worker process.
+    Diagnostics are returned as strings instead of being logged here, so the caller can
+    report them in header order regardless of which worker finished first.
+
+    If an umbrella TU hits a fatal error (e.g. two headers that cannot be included
+    together), the batch is re-parsed one header at a time.
+
+    With a ParseCache, the result is stored along with the TU's include closure. Cache
+    lookups happen in the caller so that hits never reach a worker.
+
+    `sessions` supplies the calling thread's ParseSession and `registry` the run's class
+    registry; worker processes leave both unset and use the ones set up by
+    _init_process_worker.
+    """
+    pool = sessions if sessions is not None else _PROCESS_SESSIONS
+    if pool is None:
+        raise RuntimeError("No parse session available for this worker")
+    session = pool.get()
+    claims: Optional[Any] = registry if registry is not None else _PROCESS_CLASSES
+
+    dependencies: List[str] = list(pch.covered_files) if pch is not None else []
+    tu = _parse_unit(session, batch, clang_args, pch)
+    if len(batch) == 1 or not _has_fatal_diagnostics(tu):
+        dependencies.extend(_tu_dependencies(tu))
+        result = _collect_from_tu(tu, batch, include_filters, exclude_class_regex, prefix, emit_diagnostics, main_file_only, claims)
+    else:
+        del tu
+        session.stats.umbrella_fallbacks += 1
+        logger.info("Umbrella TU for %d header(s) starting at %s failed; parsing them individually", len(batch), batch[0])
+        classes: List[ClassInfo] = []
+        diagnostics: List[str] = []
+        skipped: List[str] = []
+        for header in batch:
+            htu = _parse_unit(session, (header,), clang_args, pch)
+            dependencies.extend(_tu_dependencies(htu))
+            c, d, k = _collect_from_tu(htu, (header,), include_filters, exclude_class_regex, prefix, emit_diagnostics, main_file_only, claims)
+            classes.extend(c)
+            diagnostics.extend(d)
+            skipped.extend(k)
+        result = (classes, diagnostics, skipped)
+
+    if cache is not None:
+        cache.store(batch, dependencies, result)
+    return result
+
+
+def _tu_dependencies(tu: Any) -> List[str]:
+    """
+    Files read while parsing `tu` (its include closure), as resolved paths.
+    """
+    deps: List[str] = []
+    for inc in tu.get_includes():
+        try:
+            deps.append(str(Path(str(inc.include.name)).resolve()))
+        except Exception:
             continue
-        # Multiple overloads: assign indices deterministically by signature
-        # Create stable ordering using the signature_key/hash
-        idxs_sorted = sorted(idxs, key=lambda j: ci.methods[j].signature_key)
-        for order, j in enumerate(idxs_sorted):
-            ci.methods[j].overload_index = order
+    return deps
+
+
+def _libclang_version() -> str:
+    """
+    libclang's version string (clang_getClangVersion), falling back to the library path.
+    """
+    ensure_libclang_loaded()
+    try:
+        fn = cindex.conf.lib.clang_getClangVersion
+        fn.argtypes = []
+        fn.restype = cindex._CXString
+        fn.errcheck = cindex._CXString.from_result
+        return str(fn())
+    except Exception:
+        try:
+            return str(cindex.conf.get_filename())
+        except Exception:
+            return "unknown"
+
+
+def _current_rss_bytes() -> Optional[int]:
+    """
+    Resident set size of this process, or None when it cannot be measured.
+    """
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        pass
+    try:
+        import resource
+
+        # Peak RSS is the best portable approximation (KiB on Linux, bytes on macOS)
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss if sys.platform == "darwin" else rss * 1024
+    except Exception:
+        return None
+
+
+def _measure_unit(
+    session: ParseSession,
+    batch: Sequence[Path],
+    clang_args: List[str],
+    collect: Any,
+    pch: Optional[PrecompiledPrefix],
+    cache: Optional[ParseCache],
+) -> Tuple[float, Optional[int], ParseResult]:
+    """
+    Parse and collect one unit, returning (seconds, RSS growth while the TU is alive, result).
+    """
+    rss_before = _current_rss_bytes()
+    start = time.perf_counter()
+    tu = _parse_unit(session, batch, clang_args, pch)
+    rss_after = _current_rss_bytes()
+    result = collect(tu, batch)
+    elapsed = time.perf_counter() - start
+    if cache is not None:
+        cache.store(batch, list(pch.covered_files if pch is not None else ()) + _tu_dependencies(tu), result)
+    del tu
+    grown = None if rss_before is None or rss_after is None else max(0, rss_after - rss_before)
+    return elapsed, grown, result
+
+
+def _auto_batch_size(
+    headers: List[Path],
+    clang_args: List[str],
+    collect: Any,
+    jobs: int,
+    memory_budget_bytes: int,
+    stats: ParseStats,
+    pch: Optional[PrecompiledPrefix] = None,
+    cache: Optional[ParseCache] = None,
+) -> Tuple[int, int, List[ParseResult]]:
+    """
+    Pick an umbrella batch size from measured parse time and memory.
+
+    The first header is parsed alone and the next few as one umbrella TU. Fitting
+    cost = shared + per_header * K to both gives the cost of the common include prefix and
+    the marginal cost of each extra header. K is the smallest batch that keeps the shared
+    part under _AUTO_SHARED_OVERHEAD of the TU time, capped by the memory budget per TU and
+    by the need to give every worker at least one batch.
+
+    Returns (batch_size, headers_consumed, results). The probe results are real parse
+    results for headers[:headers_consumed] and must be merged first.
+    """
+    k = min(_AUTO_PROBE_HEADERS, len(headers) - 1)
+    if k < 2:
+        return 1, 0, []
+
+    with ParseSession() as session:
+        t1, m1, r1 = _measure_unit(session, headers[:1], clang_args, collect, pch, cache)
+        tk, mk, rk = _measure_unit(session, headers[1:1 + k], clang_args, collect, pch, cache)
+    stats.add(session.stats)
+    consumed = 1 + k
+    remaining = len(headers) - consumed
+
+    per_header = max((tk - t1) / (k - 1), 1e-6)
+    shared = max(t1 - per_header, 0.0)
+    size = max(1, math.ceil(shared * (1.0 - _AUTO_SHARED_OVERHEAD) / (_AUTO_SHARED_OVERHEAD * per_header)))
+
+    if m1 is not None and mk is not None:
+        mem_per_header = max((mk - m1) / (k - 1), 0.0)
+        mem_shared = max(m1 - mem_per_header, 0.0)
+        if mem_per_header > 0:
+            size = min(size, max(1, int((memory_budget_bytes - mem_shared) // mem_per_header)))
+
+    if jobs > 1 and remaining > 0:
+        size = min(size, math.ceil(remaining / jobs))
+    size = max(1, min(size, max(remaining, 1)))
+
+    logger.info(
+        "Auto batch size %d (probe: %.3fs shared + %.3fs/header, %s/header)",
+        size,
+        shared,
+        per_header,
+        "n/a" if m1 is None or mk is None else f"{max((mk - m1) / (k - 1), 0) / (1 << 20):.1f} MiB",
+    )
+    return size, consumed, [r1, rk]
+
+
+def _iter_parsed_units(
+    units: List[Tuple[Path, ...]],
+    worker: Any,
+    jobs: int,
+    pool: str,
+    stats: ParseStats,
+    registry: Optional[_ClassRegistry],
+) -> Iterable[ParseResult]:
+    """
+    Yield worker results in the same order as `units`, parsing serially or on a pool.
+
+    - "process": a ProcessPoolExecutor; each worker process loads libclang once. Class
+      claims go through a Manager dict seeded from `registry` (none without a registry).
+    - "thread": a ThreadPoolExecutor; ctypes releases the GIL while libclang parses.
+
+    Every worker reuses one ParseSession for all of its units. Sessions are closed once
+    all units are parsed and their counters are added to `stats`.
+    """
+    if pool not in PARSE_POOLS:
+        raise ValueError(f"Unknown parse pool '{pool}' (expected one of: {', '.join(PARSE_POOLS)})")
+
+    if pool == "process" and jobs > 1 and len(units) > 1:
+        workers = min(jobs, len(units))
+        ctx = multiprocessing.get_context()
+        stats_queue = ctx.SimpleQueue()
+        # Small chunks keep the pool balanced while amortizing IPC per unit
+        chunksize = max(1, len(units) // (workers * 8))
+        claims: Any = None
+        with contextlib.ExitStack() as stack:
+            if registry is not None:
+                manager = stack.enter_context(ctx.Manager())
+                claims = manager.dict(dict.fromkeys(registry.keys(), 0))
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=ctx,
+                initializer=_init_process_worker,
+                initargs=(stats_queue, claims),
+            ) as ex:
+                yield from ex.map(worker, units, chunksize=chunksize)
+            if registry is not None:
+                registry.update(claims.keys())
+        # Workers have exited (and reported) once the executor is shut down
+        while not stats_queue.empty():
+            stats.add(stats_queue.get())
+        return
+
+    sessions = _SessionPool()
+    try:
+        if jobs <= 1 or len(units) <= 1:
+            for unit in units:
+                yield worker(unit, sessions=sessions, registry=registry)
+            return
+        with ThreadPoolExecutor(max_workers=min(jobs, len(units))) as ex:
+            yield from ex.map(partial(worker, sessions=sessions, registry=registry), units)
+    finally:
+        stats.add(sessions.close_all())
 
 
 # --------------------------
 # Public API
 # --------------------------
 
+def resolve_batch_size(value: Union[int, str]) -> Union[int, str]:
+    """
+    Validate a batch size given as a positive integer or one of BATCH_MODES.
+    """
+    if isinstance(value, str):
+        v = value.strip().lower()
+        if v in BATCH_MODES:
+            return v
+        try:
+            value = int(v)
+        except ValueError:
+            raise ValueError(f"Invalid batch size '{value}' (expected a positive integer or one of: {', '.join(BATCH_MODES)})")
+    if int(value) < 1:
+        raise ValueError(f"Invalid batch size {value} (must be >= 1)")
+    return int(value)
+
+
 def collect_classes_from_headers(
     headers: Iterable[Path],
     clang_args: List[str],
@@ -515,6 +1323,15 @@ def collect_classes_from_headers(
     exclude_class_regex: Optional[object] = None,
     prefix: str = "",
     emit_diagnostics: bool = True,
+    jobs: int = 1,
+    pool: str = "process",
+    stats: Optional[ParseStats] = None,
+    batch_size: Union[int, str] = 1,
+    batch_memory_mb: int = 2048,
+    pch_prefix: Optional[Path] = None,
+    pch_dir: Optional[Path] = None,
+    cache_dir: Optional[Path] = None,
+    main_file_only: bool = False,
 ) -> List[ClassInfo]:
     """
     Parse headers and return a list of ClassInfo with detailed method info.
@@ -526,39 +1343,220 @@ def collect_classes_from_headers(
     - exclude_class_regex: Regular expression to exclude classes by name.
     - prefix: Wrapper class name prefix (e.g., "OCC_").
     - emit_diagnostics: Whether to print clang diagnostics to stderr.
+    - jobs: Number of translation units parsed concurrently (1 = serial, in-process).
+    - pool: Worker pool used when jobs > 1: "process" or "thread".
+    - stats: Optional ParseStats that receives libclang index/parse timings for the run.
+    - batch_size: Headers per translation unit. 1 parses each header on its own; K > 1 builds
+      umbrella TUs that #include K consecutive headers; "all" puts every header in one TU;
+      "auto" picks K from probe parses (see _auto_batch_size).
+    - batch_memory_mb: Memory budget per umbrella TU used by batch_size="auto".
+    - pch_prefix: Optional prefix header compiled once into a PCH and loaded into every TU
+      via -include-pch. Only one PCH is built, for `clang_args` (all TUs of a run share
+      them). TUs that include a header already in the PCH, or that libclang cannot load
+      the PCH into, are parsed without it.
+    - pch_dir: Where to write the PCH. Defaults to a temporary directory removed after the run.
+    - cache_dir: Optional persistent parse cache (see parse_cache.ParseCache). Translation
+      units whose header and include closure are unchanged are loaded from it without
+      invoking libclang.
+    - main_file_only: Each translation unit only contributes declarations located in its own
+      header(s), and included headers are not walked. Every class then has exactly one
+      owning header, so results of different TUs (or shards) are disjoint. Classes defined
+      in files that are not in `headers` are not collected in this mode.
+
+    Each class definition is extracted once, by the first translation unit that claims it;
+    later units prune its subtree. Results are merged in header order, so the output is
+    identical for any jobs/pool setting.
 
     Returns:
     - Sorted list of ClassInfo instances.
     """
     ensure_libclang_loaded()
+    batch_size = resolve_batch_size(batch_size)
 
     filters = [str(Path(f).resolve()) for f in (include_filters or [])]
-    class_map: Dict[str, ClassInfo] = {}
-
-    for header in headers:
-        tu = parse_translation_unit(header, clang_args)
-        if emit_diagnostics:
-            for diag in tu.diagnostics:
-                logger.warning("[clang] %s", diag)
-
-        classes = _collect_class_decls(
-            tu=tu,
-            include_filters=filters if filters else None,
-            exclude_class_regex=exclude_class_regex,
-            prefix=prefix,
+    worker_kwargs: Dict[str, Any] = dict(
+        include_filters=filters if filters else None,
+        exclude_class_regex=exclude_class_regex,
+        prefix=prefix,
+        emit_diagnostics=emit_diagnostics,
+        main_file_only=main_file_only,
+    )
+    header_list = [Path(h) for h in headers]
+    run_stats = ParseStats()
+
+    cache: Optional[ParseCache] = None
+    if cache_dir is not None:
+        cache = ParseCache(
+            Path(cache_dir),
+            {
+                "clang_args": list(clang_args),
+                "include_filters": filters,
+                "exclude_class_regex": getattr(exclude_class_regex, "pattern", None) or (str(exclude_class_regex) if exclude_class_regex else None),
+                "prefix": prefix,
+                "emit_diagnostics": emit_diagnostics,
+                "main_file_only": main_file_only,
+                "pch_prefix": str(Path(pch_prefix).resolve()) if pch_prefix is not None else None,
+                "libclang": _libclang_version(),
+                "generator": generator_fingerprint(),
+            },
         )
+
+    tmp_pch_dir: Optional[str] = None
+    pch_state: Dict[str, Any] = {}
+
+    def get_pch() -> Optional[PrecompiledPrefix]:
+        # Built on first use, so fully cached runs never touch libclang
+        nonlocal tmp_pch_dir
+        if pch_prefix is None:
+            return None
+        if "pch" not in pch_state:
+            if pch_dir is None:
+                tmp_pch_dir = tempfile.mkdtemp(prefix="gdextension-pch-")
+            with ParseSession() as pch_session:
+                pch_state["pch"] = build_prefix_pch(Path(pch_prefix), list(clang_args), Path(pch_dir or tmp_pch_dir), session=pch_session)
+            run_stats.add(pch_session.stats)
+        return pch_state["pch"]
+
+    try:
+        return _collect_classes(header_list, clang_args, worker_kwargs, jobs, pool, batch_size, batch_memory_mb, get_pch, cache, run_stats, stats)
+    finally:
+        if tmp_pch_dir is not None:
+            shutil.rmtree(tmp_pch_dir, ignore_errors=True)
+
+
+def _collect_classes(
+    header_list: List[Path],
+    clang_args: List[str],
+    worker_kwargs: Dict[str, Any],
+    jobs: int,
+    pool: str,
+    batch_size: Union[int, str],
+    batch_memory_mb: int,
+    get_pch: Any,
+    cache: Optional[ParseCache],
+    run_stats: ParseStats,
+    stats: Optional[ParseStats],
+) -> List[ClassInfo]:
+    """
+    Batch, parse and merge headers for collect_classes_from_headers.
+    """
+    class_map = _ClassMerger()
+    # Main-file-only units are disjoint by construction and need no class claims
+    registry = None if worker_kwargs.get("main_file_only") else _ClassRegistry()
+
+    # Plan translation units. With a cache, a previously chosen auto batch size is reused so
+    # the unit layout (and therefore every cache key) is stable across runs.
+    probe_units: List[Tuple[Path, ...]] = []
+    probe_results: List[ParseResult] = []
+    units: List[Tuple[Path, ...]] = []
+    remaining = header_list
+    if batch_size == "auto":
+        remembered = cache.load_meta().get("auto_batch") if cache is not None else None
+        if remembered and remembered.get("headers") == len(header_list):
+            probe = int(remembered["probe"])
+            units = [tuple(header_list[:1]), tuple(header_list[1:1 + probe])] if probe else []
+            size, remaining = int(remembered["size"]), header_list[1 + probe if probe else 0:]
+            logger.info("Reusing auto batch size %d from the parse cache", size)
+        else:
+            size, consumed, probe_results = _auto_batch_size(
+                header_list,
+                list(clang_args),
+                partial(_collect_from_tu, registry=registry, **worker_kwargs),
+                jobs,
+                batch_memory_mb * (1 << 20),
+                run_stats,
+                get_pch(),
+                cache,
+            )
+            remaining = header_list[consumed:]
+            if probe_results:
+                probe_units = [tuple(header_list[:1]), tuple(header_list[1:consumed])]
+            if cache is not None:
+                cache.store_meta(auto_batch={"headers": len(header_list), "probe": max(consumed - 1, 0), "size": size})
+    elif batch_size == "all":
+        size = max(1, len(header_list))
+    else:
+        size = int(batch_size)
+    units.extend(tuple(remaining[i:i + size]) for i in range(0, len(remaining), size))
+
+    # Resolve cache hits up front so that only misses are handed to workers
+    cached: List[Optional[ParseResult]] = [None] * len(units)
+    if cache is not None:
+        for i, unit in enumerate(units):
+            cached[i] = cache.load(unit)
+            if cached[i] is not None and registry is not None:
+                # Classes provided by hits need not be extracted again by the misses
+                registry.update(_class_key(c) for c in cached[i][0])
+        hits = sum(1 for c in cached if c is not None)
+        run_stats.cache_hits += hits
+        run_stats.cache_misses += len(units) - hits
+        logger.info("Parse cache: %d of %d translation unit(s) up to date", hits, len(units))
+    misses = [unit for unit, hit in zip(units, cached) if hit is None]
+
+    if jobs > 1 and misses:
+        logger.info("Parsing %d translation unit(s) with %d %s worker(s)", len(misses), jobs, pool)
+
+    unit_skips: List[Tuple[Tuple[Path, ...], List[str]]] = []
+
+    def _merge(unit: Tuple[Path, ...], result: ParseResult) -> None:
+        classes, diagnostics, skipped = result
+        for diag in diagnostics:
+            logger.warning("[clang] %s", diag)
+        if skipped:
+            run_stats.pruned_classes += len(skipped)
+            unit_skips.append((unit, skipped))
+
         for c in classes:
-            key = c.cursor_usr or c.qualified_name
-            if key in class_map:
-                # Merge methods/bases carefully, avoiding duplicates by USR when present
-                existing = class_map[key]
-                existing.methods.extend(c.methods)
-                existing.bases.extend(c.bases)
-                if not existing.header and c.header:
-                    existing.header = c.header
-            else:
-                class_map[key] = c
+            class_map.add(c)
+
+    for unit, result in zip(probe_units, probe_results):
+        _merge(unit, result)
+    parsed: Iterable[ParseResult] = ()
+    if misses:
+        worker = partial(_parse_batch_classes, clang_args=list(clang_args), pch=get_pch(), cache=cache, **worker_kwargs)
+        parsed = _iter_parsed_units(misses, worker, jobs, pool, run_stats, registry)
+    parsed_iter = iter(parsed)
+    # Hits and misses are merged in unit order, so the result does not depend on the cache
+    for unit, hit in zip(units, cached):
+        _merge(unit, hit if hit is not None else next(parsed_iter))
+    # Exhaust the worker iterator so its sessions are closed and their stats recorded
+    for _ in parsed_iter:
+        raise RuntimeError("Parse workers returned more results than translation units")
+
+    # A unit skips classes that another unit claimed. A cached entry can outlive the unit
+    # that provided them (e.g. a header was removed or no longer includes them); such
+    # units are parsed again with a registry of their own and only the gaps are filled.
+    orphaned = [unit for unit, skipped in unit_skips if any(key not in class_map for key in skipped)]
+    if orphaned:
+        logger.info("Re-parsing %d translation unit(s) whose skipped classes were not extracted elsewhere", len(orphaned))
+        worker = partial(_parse_batch_classes, clang_args=list(clang_args), pch=get_pch(), cache=cache, **worker_kwargs)
+        sessions = _SessionPool()
+        try:
+            for unit in orphaned:
+                for c in worker(unit, sessions=sessions, registry=_ClassRegistry())[0]:
+                    class_map.add(c)
+        finally:
+            run_stats.add(sessions.close_all())
+
+    logger.info(
+        "Parsed %d translation unit(s) in %.2fs (index setup %.3fs, teardown %.3fs across %d session(s); %d umbrella fallback(s), %d PCH fallback(s); %d cache hit(s); %d class subtree(s) pruned)",
+        run_stats.translation_units,
+        run_stats.parse_seconds,
+        run_stats.index_setup_seconds,
+        run_stats.index_teardown_seconds,
+        run_stats.sessions,
+        run_stats.umbrella_fallbacks,
+        run_stats.pch_fallbacks,
+        run_stats.cache_hits,
+        run_stats.pruned_classes,
+    )
+    if stats is not None:
+        stats.add(run_stats)
+
+    return _finalize_classes(class_map)
 
+
+def _finalize_classes(class_map: _ClassMerger) -> List[ClassInfo]:
     # After merging across TUs, reassign overload indices for each class
     for ci in class_map.values():
         _assign_overload_indices(ci)
@@ -566,8 +1564,31 @@ def collect_classes_from_headers(
     return sorted(class_map.values(), key=lambda c: (c.namespaces, c.name))
 
 
+def merge_class_lists(class_lists: Iterable[Iterable[ClassInfo]]) -> List[ClassInfo]:
+    """
+    Merge classes collected by separate runs (e.g. the shards of a sharded run).
+
+    Classes are matched by USR (or qualified name) and each method and base is kept once,
+    exactly as translation units are merged within a run. Overload indices are then
+    reassigned and the result is sorted like collect_classes_from_headers output.
+    """
+    class_map = _ClassMerger()
+    for classes in class_lists:
+        for c in classes:
+            class_map.add(c)
+    return _finalize_classes(class_map)
+
+
 __all__ = [
+    "BATCH_MODES",
+    "PARSE_POOLS",
+    "ParseSession",
+    "ParseStats",
+    "PrecompiledPrefix",
+    "build_prefix_pch",
     "collect_classes_from_headers",
+    "merge_class_lists",
     "parse_translation_unit",
+    "resolve_batch_size",
     "ensure_libclang_loaded",
 ]
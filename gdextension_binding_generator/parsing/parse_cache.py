@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Persistent on-disk cache of parse results.
+
+Each entry stores the ClassInfo/MethodInfo IR and clang diagnostics collected from one
+translation unit (a single header, or an umbrella batch of headers), together with the
+content hash of every file that TU read (the headers themselves plus the full include
+closure reported by `tu.get_includes()`).
+
+Entries also list the classes the TU skipped because another unit of the same run had
+already claimed them (see clang_parser's class registry); the caller re-parses an entry
+whose skipped classes are no longer provided by any other unit.
+
+Entries are addressed by the unit's header paths and a context key covering everything
+else that shapes the result: clang args, include filters, exclusion regex, wrapper prefix,
+PCH prefix header, libclang version and generator version. A lookup succeeds only if every
+recorded dependency still has the same content hash, so touching one header invalidates
+exactly the units that include it and everything else skips libclang entirely.
+Keys and content hashes are blake2b fingerprints (see fingerprint.py); the dependencies of
+an entry are hashed in parallel.
+
+Layout:
+- <cache_dir>/parse-v<N>/<key[:2]>/<key>.pkl   one entry per translation unit
+- <cache_dir>/parse-v<N>/meta-<context>.json   small run metadata (e.g. auto batch size)
+"""
+
+from __future__ import annotations
+
+import json
+import pickle
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+import logging
+
+from ..fingerprint import file_digest, file_digests, fingerprint_parts, fingerprint_text
+from ..models import ClassInfo
+from ..utils import atomic_write_bytes
+
+logger = logging.getLogger(__name__)
+
+# Bump when the entry layout or the pickled IR classes change incompatibly
+CACHE_FORMAT_VERSION = 6
+
+# (classes, diagnostics, keys of classes skipped because another unit claimed them)
+ParseResult = Tuple[List[ClassInfo], List[str], List[str]]
+
+
+class ParseCache:
+    """
+    Content-addressed store of per-translation-unit parse results.
+
+    Instances are cheap and picklable, so worker processes receive their own copy. File
+    digests are memoized per instance: files are assumed not to change during a run.
+    """
+
+    def __init__(self, cache_dir: Path, context: Mapping[str, Any]) -> None:
+        self.root = Path(cache_dir) / f"parse-v{CACHE_FORMAT_VERSION}"
+        payload = json.dumps(dict(context), sort_keys=True, default=str)
+        self.context_key = fingerprint_text(payload)
+        self._digests: Dict[str, Optional[str]] = {}
+
+    # ---- Keys and digests ----
+
+    def unit_key(self, batch: Sequence[Path]) -> str:
+        return fingerprint_parts([self.context_key] + [str(Path(header).resolve()) for header in batch])
+
+    def digest(self, path: str) -> Optional[str]:
+        if path not in self._digests:
+            self._digests[path] = file_digest(path)
+        return self._digests[path]
+
+    def prefetch(self, paths: Iterable[str]) -> None:
+        """
+        Hash the not yet memoized `paths` in parallel.
+        """
+        missing = [p for p in dict.fromkeys(paths) if p not in self._digests]
+        if missing:
+            self._digests.update(file_digests(missing))
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.pkl"
+
+    # ---- Entries ----
+
+    def load(self, batch: Sequence[Path]) -> Optional[ParseResult]:
+        """
+        Return the cached (classes, diagnostics, skipped) for `batch`, or None if missing or stale.
+        """
+        path = self._entry_path(self.unit_key(batch))
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as ex:
+            logger.debug("Ignoring unreadable parse cache entry %s: %s", path, ex)
+            return None
+        if not isinstance(entry, dict) or entry.get("format") != CACHE_FORMAT_VERSION:
+            return None
+        dependencies = entry.get("dependencies", {})
+        self.prefetch(dependencies)
+        for dep, digest in dependencies.items():
+            if self.digest(dep) != digest:
+                return None
+        return entry["classes"], entry["diagnostics"], entry["skipped"]
+
+    def store(self, batch: Sequence[Path], dependencies: Iterable[str], result: ParseResult) -> None:
+        """
+        Record `result` for `batch`. Dependencies that cannot be hashed make the entry
+        unusable, so it is not written.
+        """
+        deps: Dict[str, str] = {}
+        paths = sorted(set(dependencies) | {str(Path(h).resolve()) for h in batch})
+        self.prefetch(paths)
+        for dep in paths:
+            digest = self.digest(dep)
+            if digest is None:
+                logger.debug("Not caching %s: cannot hash dependency %s", batch[0], dep)
+                return
+            deps[dep] = digest
+        classes, diagnostics, skipped = result
+        entry = {
+            "format": CACHE_FORMAT_VERSION,
+            "headers": [str(h) for h in batch],
+            "dependencies": deps,
+            "classes": classes,
+            "diagnostics": diagnostics,
+            "skipped": list(skipped),
+        }
+        try:
+            atomic_write_bytes(self._entry_path(self.unit_key(batch)), pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception as ex:
+            logger.warning("Failed to write parse cache entry for %s: %s", batch[0], ex)
+
+    # ---- Run metadata ----
+
+    def _meta_path(self) -> Path:
+        return self.root / f"meta-{self.context_key[:16]}.json"
+
+    def load_meta(self) -> Dict[str, Any]:
+        try:
+            with open(self._meta_path(), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except Exception:
+            return {}
+
+    def store_meta(self, **values: Any) -> None:
+        data = self.load_meta()
+        data.update(values)
+        try:
+            atomic_write_bytes(self._meta_path(), json.dumps(data, sort_keys=True).encode("utf-8"))
+        except Exception as ex:
+            logger.warning("Failed to write parse cache metadata: %s", ex)
+
+
+__all__ = [
+    "CACHE_FORMAT_VERSION",
+    "ParseCache",
+    "ParseResult",
+]
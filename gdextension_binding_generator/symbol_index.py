@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""
+SQLite-backed symbol index of parsed classes.
+
+The index persists the parsed model (classes, bases, methods, parameters and their
+canonical types, keyed by USR) in a single SQLite file:
+- The parser fills it after a run, replacing only the rows of the headers that were parsed,
+  so re-parsing a few changed headers is a cheap incremental update.
+- Emitters read it through ClassRows, a lazy sequence that loads one ClassInfo at a time,
+  so emission does not need every ClassInfo of a large library in memory.
+- Queries such as "all methods returning X" or "all subclasses of Y" run on indexed
+  columns without reparsing anything.
+
+Type rows are shared: each distinct CppType is stored once and referenced by id; pointer
+and reference types refer to the row of their pointee (pointee_id, 0 for none).
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Sequence as SequenceABC
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import logging
+
+from .models import BaseClassRef, ClassInfo, CppType, MethodInfo, MethodKind, ParameterInfo
+
+logger = logging.getLogger(__name__)
+
+# Bump when the schema changes; older databases are rebuilt from scratch
+SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS types (
+    id INTEGER PRIMARY KEY,
+    spelling TEXT NOT NULL,
+    is_const INTEGER NOT NULL,
+    is_pointer INTEGER NOT NULL,
+    is_reference INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    pointee_id INTEGER NOT NULL,
+    is_volatile INTEGER NOT NULL,
+    decl_usr TEXT NOT NULL,
+    UNIQUE (spelling, is_const, is_pointer, is_reference, kind, pointee_id, is_volatile, decl_usr)
+);
+CREATE INDEX IF NOT EXISTS types_decl_usr ON types (decl_usr);
+CREATE TABLE IF NOT EXISTS classes (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    usr TEXT NOT NULL,
+    name TEXT NOT NULL,
+    namespaces TEXT NOT NULL,
+    qualified_name TEXT NOT NULL,
+    header TEXT NOT NULL,
+    source TEXT NOT NULL,
+    wrapper_prefix TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS classes_source ON classes (source);
+CREATE INDEX IF NOT EXISTS classes_qualified_name ON classes (qualified_name);
+CREATE TABLE IF NOT EXISTS bases (
+    class_id INTEGER NOT NULL REFERENCES classes (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    qualified_name TEXT NOT NULL,
+    is_virtual INTEGER NOT NULL,
+    access TEXT NOT NULL,
+    PRIMARY KEY (class_id, position)
+);
+CREATE INDEX IF NOT EXISTS bases_qualified_name ON bases (qualified_name);
+CREATE TABLE IF NOT EXISTS methods (
+    id INTEGER PRIMARY KEY,
+    class_id INTEGER NOT NULL REFERENCES classes (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    usr TEXT NOT NULL,
+    name TEXT NOT NULL,
+    qualified_name TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    is_const INTEGER NOT NULL,
+    is_virtual INTEGER NOT NULL,
+    is_pure_virtual INTEGER NOT NULL,
+    is_explicit INTEGER NOT NULL,
+    is_noexcept INTEGER NOT NULL,
+    return_type_id INTEGER NOT NULL REFERENCES types (id),
+    overload_index INTEGER,
+    explicit_exposed_name TEXT
+);
+CREATE INDEX IF NOT EXISTS methods_class ON methods (class_id, position);
+CREATE INDEX IF NOT EXISTS methods_usr ON methods (usr);
+CREATE INDEX IF NOT EXISTS methods_return_type ON methods (return_type_id);
+CREATE TABLE IF NOT EXISTS parameters (
+    method_id INTEGER NOT NULL REFERENCES methods (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    type_id INTEGER NOT NULL REFERENCES types (id),
+    default_value TEXT,
+    is_variadic INTEGER NOT NULL,
+    PRIMARY KEY (method_id, position)
+);
+CREATE INDEX IF NOT EXISTS parameters_type ON parameters (type_id);
+"""
+
+_TABLES = ("parameters", "methods", "bases", "classes", "types", "meta")
+
+
+def _class_key(ci: ClassInfo) -> str:
+    return ci.cursor_usr or ci.qualified_name
+
+
+def _source_path(header: str) -> str:
+    # Resolved form of a class's header, used to match the headers of a run
+    return str(Path(header).resolve()) if header else ""
+
+
+def _split_namespaces(joined: str) -> List[str]:
+    return joined.split("::") if joined else []
+
+
+class SymbolIndex:
+    """
+    Persistent store of the parsed class model.
+
+    Usage:
+        with SymbolIndex(Path("symbols.db")) as index:
+            index.replace_headers(parsed_headers, classes)
+            for ci in index.classes():
+                ...
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._type_ids: Dict[CppType, int] = {}
+        self._types_by_id: Dict[int, CppType] = {}
+        self._ensure_schema()
+
+    # ---- Lifecycle ----
+
+    def _ensure_schema(self) -> None:
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            logger.info("Rebuilding symbol index %s (schema %d -> %d)", self.path, version, SCHEMA_VERSION)
+            with self._conn:
+                for table in _TABLES:
+                    self._conn.execute(f"DROP TABLE IF EXISTS {table}")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "SymbolIndex":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    # ---- Metadata ----
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        with self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    # ---- Writing ----
+
+    def _type_id(self, t: CppType) -> int:
+        tid = self._type_ids.get(t)
+        if tid is not None:
+            return tid
+        pointee_id = 0 if t.pointee is None else self._type_id(t.pointee)
+        row = (t.spelling, int(t.is_const), int(t.is_pointer), int(t.is_reference), t.kind, pointee_id, int(t.is_volatile), t.decl_usr)
+        self._conn.execute(
+            "INSERT OR IGNORE INTO types (spelling, is_const, is_pointer, is_reference, kind, pointee_id, is_volatile, decl_usr) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            row,
+        )
+        tid = self._conn.execute(
+            "SELECT id FROM types WHERE spelling = ? AND is_const = ? AND is_pointer = ? AND is_reference = ? AND kind = ? "
+            "AND pointee_id = ? AND is_volatile = ? AND decl_usr = ?",
+            row,
+        ).fetchone()[0]
+        self._type_ids[t] = tid
+        return tid
+
+    def _insert_class(self, ci: ClassInfo) -> None:
+        conn = self._conn
+        conn.execute("DELETE FROM classes WHERE key = ?", (_class_key(ci),))
+        cur = conn.execute(
+            "INSERT INTO classes (key, usr, name, namespaces, qualified_name, header, source, wrapper_prefix) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (_class_key(ci), ci.cursor_usr, ci.name, "::".join(ci.namespaces), ci.qualified_name, ci.header, _source_path(ci.header), ci.wrapper_prefix),
+        )
+        class_id = cur.lastrowid
+        conn.executemany(
+            "INSERT INTO bases (class_id, position, qualified_name, is_virtual, access) VALUES (?, ?, ?, ?, ?)",
+            [(class_id, i, b.qualified_name, int(b.is_virtual), b.access) for i, b in enumerate(ci.bases)],
+        )
+        for position, m in enumerate(ci.methods):
+            cur = conn.execute(
+                "INSERT INTO methods (class_id, position, usr, name, qualified_name, kind, is_const, is_virtual, is_pure_virtual, "
+                "is_explicit, is_noexcept, return_type_id, overload_index, explicit_exposed_name) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    class_id, position, m.usr, m.name, m.qualified_name, m.kind.name, int(m.is_const), int(m.is_virtual),
+                    int(m.is_pure_virtual), int(m.is_explicit), int(m.is_noexcept), self._type_id(m.return_type),
+                    m.overload_index, m._explicit_exposed_name,
+                ),
+            )
+            method_id = cur.lastrowid
+            conn.executemany(
+                "INSERT INTO parameters (method_id, position, name, type_id, default_value, is_variadic) VALUES (?, ?, ?, ?, ?, ?)",
+                [(method_id, i, p.name, self._type_id(p.cpp_type), p.default_value, int(p.is_variadic)) for i, p in enumerate(m.parameters)],
+            )
+
+    def store(self, classes: Iterable[ClassInfo]) -> int:
+        """
+        Insert or replace (by USR, or qualified name without one) the given classes.
+        Returns the number of classes written.
+        """
+        count = 0
+        with self._conn:
+            for ci in classes:
+                self._insert_class(ci)
+                count += 1
+        return count
+
+    def replace_headers(self, headers: Iterable[Path], classes: Iterable[ClassInfo]) -> int:
+        """
+        Incremental update after parsing `headers`: drop every class defined in one of them,
+        then store `classes`. Classes of other headers are left untouched (or replaced by
+        USR if `classes` contains them). Returns the number of classes written.
+        """
+        sources = sorted({_source_path(str(h)) for h in headers})
+        count = 0
+        with self._conn:
+            self._conn.executemany("DELETE FROM classes WHERE source = ?", [(h,) for h in sources])
+            for ci in classes:
+                self._insert_class(ci)
+                count += 1
+            # Types no longer referenced by any method or parameter, directly or as a pointee
+            self._conn.execute(
+                "WITH RECURSIVE live(id) AS ("
+                " SELECT return_type_id FROM methods UNION SELECT type_id FROM parameters"
+                " UNION SELECT t.pointee_id FROM types t JOIN live ON t.id = live.id WHERE t.pointee_id != 0"
+                ") DELETE FROM types WHERE id NOT IN (SELECT id FROM live)"
+            )
+        self._type_ids.clear()
+        self._types_by_id.clear()
+        return count
+
+    # ---- Reading ----
+
+    def _type(self, tid: int) -> CppType:
+        t = self._types_by_id.get(tid)
+        if t is None:
+            spelling, c, p, r, kind, pointee_id, v, decl_usr = self._conn.execute(
+                "SELECT spelling, is_const, is_pointer, is_reference, kind, pointee_id, is_volatile, decl_usr FROM types WHERE id = ?", (tid,)
+            ).fetchone()
+            pointee = self._type(pointee_id) if pointee_id else None
+            t = self._types_by_id[tid] = CppType.interned(spelling, bool(c), bool(p), bool(r), kind, pointee, bool(v), decl_usr)
+        return t
+
+    def _load_class(self, class_id: int) -> ClassInfo:
+        conn = self._conn
+        usr, name, namespaces, header, prefix = conn.execute(
+            "SELECT usr, name, namespaces, header, wrapper_prefix FROM classes WHERE id = ?", (class_id,)
+        ).fetchone()
+        bases = [
+            BaseClassRef(qualified_name=qn, is_virtual=bool(v), access=access)
+            for qn, v, access in conn.execute(
+                "SELECT qualified_name, is_virtual, access FROM bases WHERE class_id = ? ORDER BY position", (class_id,)
+            )
+        ]
+        params: Dict[int, List[ParameterInfo]] = {}
+        for method_id, pname, type_id, default, variadic in conn.execute(
+            "SELECT p.method_id, p.name, p.type_id, p.default_value, p.is_variadic FROM parameters p "
+            "JOIN methods m ON m.id = p.method_id WHERE m.class_id = ? ORDER BY p.method_id, p.position",
+            (class_id,),
+        ):
+            params.setdefault(method_id, []).append(
+                ParameterInfo(name=pname, cpp_type=self._type(type_id), default_value=default, is_variadic=bool(variadic))
+            )
+        methods = [
+            MethodInfo(
+                name=row[1],
+                return_type=self._type(row[10]),
+                parameters=params.get(row[0], []),
+                is_const=bool(row[5]),
+                is_virtual=bool(row[6]),
+                is_pure_virtual=bool(row[7]),
+                is_explicit=bool(row[8]),
+                is_noexcept=bool(row[9]),
+                kind=MethodKind[row[4]],
+                qualified_name=row[3],
+                usr=row[2],
+                overload_index=row[11],
+                _explicit_exposed_name=row[12],
+            )
+            for row in conn.execute(
+                "SELECT id, name, usr, qualified_name, kind, is_const, is_virtual, is_pure_virtual, is_explicit, is_noexcept, "
+                "return_type_id, overload_index, explicit_exposed_name FROM methods WHERE class_id = ? ORDER BY position",
+                (class_id,),
+            )
+        ]
+        return ClassInfo(
+            name=name,
+            namespaces=_split_namespaces(namespaces),
+            header=header,
+            cursor_usr=usr,
+            wrapper_prefix=prefix,
+            bases=bases,
+            methods=methods,
+        )
+
+    def classes(self) -> "ClassRows":
+        """
+        All classes, lazily loaded, in the same (namespaces, name) order as parser output.
+        """
+        return ClassRows(self)
+
+    def get(self, key: str) -> Optional[ClassInfo]:
+        """
+        Load a class by USR (or qualified name for classes without one).
+        """
+        row = self._conn.execute("SELECT id FROM classes WHERE key = ? OR qualified_name = ? ORDER BY key = ? DESC LIMIT 1", (key, key, key)).fetchone()
+        return self._load_class(row[0]) if row else None
+
+    def count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM classes").fetchone()[0]
+
+    def headers(self) -> List[str]:
+        return [h for (h,) in self._conn.execute("SELECT DISTINCT source FROM classes ORDER BY source")]
+
+    def methods_returning(self, spelling: str) -> List[Tuple[str, str]]:
+        """
+        (class qualified name, method name) of every method whose return type is `spelling`.
+        """
+        return list(self._conn.execute(
+            "SELECT c.qualified_name, m.name FROM methods m JOIN classes c ON c.id = m.class_id "
+            "JOIN types t ON t.id = m.return_type_id WHERE t.spelling = ? ORDER BY c.qualified_name, m.position",
+            (spelling,),
+        ))
+
+    def methods_using_declaration(self, decl_usr: str) -> List[Tuple[str, str]]:
+        """
+        (class qualified name, method name) of every method whose return or parameter type
+        refers to the record/enum declared as `decl_usr`, through any pointers/references.
+        """
+        return list(self._conn.execute(
+            "WITH RECURSIVE uses(id) AS ("
+            " SELECT id FROM types WHERE decl_usr = ?"
+            " UNION SELECT t.id FROM types t JOIN uses ON t.pointee_id = uses.id"
+            ") SELECT DISTINCT c.qualified_name, m.name FROM methods m JOIN classes c ON c.id = m.class_id"
+            " WHERE m.return_type_id IN (SELECT id FROM uses)"
+            " OR m.id IN (SELECT method_id FROM parameters WHERE type_id IN (SELECT id FROM uses))"
+            " ORDER BY c.qualified_name, m.name",
+            (decl_usr,),
+        ))
+
+    def subclasses_of(self, qualified_name: str, recursive: bool = True) -> List[str]:
+        """
+        Qualified names of classes deriving from `qualified_name` (transitively by default).
+        """
+        if not recursive:
+            return [qn for (qn,) in self._conn.execute(
+                "SELECT c.qualified_name FROM bases b JOIN classes c ON c.id = b.class_id WHERE b.qualified_name = ? ORDER BY c.qualified_name",
+                (qualified_name,),
+            )]
+        return [qn for (qn,) in self._conn.execute(
+            "WITH RECURSIVE sub(qn) AS ("
+            " SELECT c.qualified_name FROM bases b JOIN classes c ON c.id = b.class_id WHERE b.qualified_name = ?"
+            " UNION SELECT c.qualified_name FROM bases b JOIN classes c ON c.id = b.class_id JOIN sub ON b.qualified_name = sub.qn"
+            ") SELECT qn FROM sub ORDER BY qn",
+            (qualified_name,),
+        )]
+
+
+class ClassRows(SequenceABC):
+    """
+    Read-only sequence of the classes in a SymbolIndex. Only row ids are held; each
+    ClassInfo is loaded when iterated or indexed, so memory stays flat for large libraries.
+    """
+
+    def __init__(self, index: SymbolIndex) -> None:
+        self._index = index
+        rows = index._conn.execute("SELECT id, namespaces, name FROM classes").fetchall()
+        rows.sort(key=lambda r: (_split_namespaces(r[1]), r[2]))
+        self._ids = [r[0] for r in rows]
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, i):  # type: ignore[override]
+        if isinstance(i, slice):
+            return [self._index._load_class(cid) for cid in self._ids[i]]
+        return self._index._load_class(self._ids[i])
+
+    def __iter__(self) -> Iterator[ClassInfo]:
+        for cid in self._ids:
+            yield self._index._load_class(cid)
+
+    def known_wrappers(self) -> Dict[str, str]:
+        """
+        Native qualified name -> wrapper name for every class, without loading methods
+        (the input TypeMapper needs).
+        """
+        return {
+            qn: f"{prefix}{name}" if prefix else name
+            for qn, name, prefix in self._index._conn.execute("SELECT qualified_name, name, wrapper_prefix FROM classes")
+        }
+
+    def wrapper_names(self) -> List[str]:
+        """
+        Wrapper name of every class, without loading the classes.
+        """
+        return [
+            f"{prefix}{name}" if prefix else name
+            for name, prefix in self._index._conn.execute("SELECT name, wrapper_prefix FROM classes")
+        ]
+
+
+__all__ = [
+    "ClassRows",
+    "SCHEMA_VERSION",
+    "SymbolIndex",
+]
@@ -36,18 +36,34 @@ Design notes:
 - For OpenCASCADE, strings are frequently `const char *` or OCCT-specific types.
   We conservatively support `const char*` and `std::string` -> `godot::String`.
   You can extend `MappingConfig.custom_rules` for OCCT-specific string types
-  (e.g., TCollection_AsciiString) as needed.
+  (e.g., TCollection_AsciiString) as needed. Rules match a base identifier exactly or
+  by glob, regex or template pattern (e.g. `NCollection_Array1<*>`); TypeMapper compiles
+  them into one matcher (CompiledRules) and counts the hits of each rule.
+- Mappings are memoized per TypeMapper: each distinct CppType is classified once
+  per role (parameter/return), with the parameter name substituted into the cached
+  result afterwards, and each distinct method signature is mapped once. Cached
+  MappedType/MappedParameter objects are shared and must not be mutated. The inputs the
+  cache depends on cannot change under it: MappingConfig and MappingRule are frozen and
+  TypeMapper.known_wrapped is a read-only view; assigning a new config or known_wrapped
+  map to a mapper drops its cache.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
 from enum import Enum, auto
-from typing import Dict, List, Optional, Sequence, Tuple
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Pattern, Sequence, Tuple
+import fnmatch
+import logging
 import re
+import time
 
+from .fingerprint import fingerprint_parts
 from .models import ClassInfo, MethodInfo, MethodKind, CppType
 
+logger = logging.getLogger(__name__)
+
 
 # --------------------------
 # Helpers
@@ -105,46 +121,52 @@ def _absolute_qualified_name(qualified: str) -> str:
     return qualified if qualified.startswith("::") else f"::{qualified}"
 
 
+_INTEGRAL_TYPES = frozenset({
+    "bool",
+    "char",
+    "signed char",
+    "unsigned char",
+    "short",
+    "short int",
+    "unsigned short",
+    "unsigned short int",
+    "int",
+    "unsigned",
+    "unsigned int",
+    "long",
+    "long int",
+    "unsigned long",
+    "unsigned long int",
+    "long long",
+    "long long int",
+    "unsigned long long",
+    "unsigned long long int",
+    "size_t",
+    "ptrdiff_t",
+    "intptr_t",
+    "uintptr_t",
+    "int8_t",
+    "uint8_t",
+    "int16_t",
+    "uint16_t",
+    "int32_t",
+    "uint32_t",
+    "int64_t",
+    "uint64_t",
+})
+
+_FLOATING_TYPES = frozenset({"float", "double", "long double"})
+
+_OCCT_HANDLE_RE = re.compile(r"(?:^|::)(?:opencascade::)?handle<([^>]+)>", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 def _is_integral(t: str) -> bool:
-    ts = _strip_cv_and_class_kw(t)
-    return ts in {
-        "bool",
-        "char",
-        "signed char",
-        "unsigned char",
-        "short",
-        "short int",
-        "unsigned short",
-        "unsigned short int",
-        "int",
-        "unsigned",
-        "unsigned int",
-        "long",
-        "long int",
-        "unsigned long",
-        "unsigned long int",
-        "long long",
-        "long long int",
-        "unsigned long long",
-        "unsigned long long int",
-        "size_t",
-        "ptrdiff_t",
-        "intptr_t",
-        "uintptr_t",
-        "int8_t",
-        "uint8_t",
-        "int16_t",
-        "uint16_t",
-        "int32_t",
-        "uint32_t",
-        "int64_t",
-        "uint64_t",
-    }
+    return _strip_cv_and_class_kw(t) in _INTEGRAL_TYPES
 
 
 def _is_floating(t: str) -> bool:
-    ts = _strip_cv_and_class_kw(t)
-    return ts in {"float", "double", "long double"}
+    return _strip_cv_and_class_kw(t) in _FLOATING_TYPES
 
 
 def _normalize_spaces(s: str) -> str:
@@ -158,25 +180,6 @@ def _pointer_left_part(sp: str) -> str:
     idx = sp.find("*")
     return sp if idx < 0 else sp[:idx]
 
-def _is_c_char_ptr(t: CppType) -> bool:
-    """
-    Detect any char* (const or non-const) using pointer flag and base identifier.
-    """
-    return bool(t.is_pointer and _base_identifier(t.spelling) == "char")
-
-def _is_c_char_ptr_const(t: CppType) -> bool:
-    """
-    Detect char const* / const char* (pointer-to-const char), not const pointer to char.
-    """
-    if not _is_c_char_ptr(t):
-        return False
-    s = _normalize_spaces(_strip_cv_and_class_kw(t.spelling))
-    left = _pointer_left_part(s)
-    toks = left.split()
-    # If 'const' appears before the first '*', it's pointer-to-const
-    return "const" in toks
-
-
 def _is_std_string(spelling: str) -> bool:
     s = _strip_cv_and_class_kw(spelling)
     return (
@@ -192,22 +195,16 @@ def _is_primitive_base_type(name: str) -> bool:
     n = _strip_cv_and_class_kw(name)
     return _is_integral(n) or _is_floating(n) or n in {"bool", "char", "wchar_t"}
 
-def _is_pointer_to_primitive(t: CppType) -> bool:
-    """
-    True for pointers to primitive scalar types (e.g., double*, int*), which should not use opaque handles.
-    """
-    return bool(t.is_pointer and _is_primitive_base_type(_base_identifier(t.spelling)))
-
 def _match_occt_handle_type(spelling: str) -> Optional[str]:
     """
     Detect OCCT handle smart pointers, e.g. 'opencascade::handle<T>' or 'Handle<T>'.
     Returns the canonical handle type string if matched, else None.
     """
     s = _strip_cv_and_class_kw(spelling or "")
-    ss = re.sub(r"\s+", "", s)  # remove spaces
+    ss = _WHITESPACE_RE.sub("", s)  # remove spaces
     # Common patterns (case-insensitive for 'handle')
     # e.g., 'opencascade::handle<Geom_Curve>' or 'Handle<Geom_Curve>'
-    m = re.search(r"(?:^|::)(?:opencascade::)?handle<([^>]+)>", ss, re.IGNORECASE)
+    m = _OCCT_HANDLE_RE.search(ss)
     if m:
         # Reconstruct handle type using the original (non-space-stripped) substring
         inner = m.group(1)
@@ -217,6 +214,167 @@ def _match_occt_handle_type(spelling: str) -> Optional[str]:
     return None
 
 
+# --------------------------
+# Type classification
+# --------------------------
+
+class TypeCategory(Enum):
+    VOID = auto()
+    INTEGRAL = auto()
+    FLOATING = auto()
+    STD_STRING = auto()
+    OCCT_HANDLE = auto()
+    OTHER = auto()
+
+
+@dataclass(frozen=True)
+class TypeRecord:
+    """
+    Everything the mapper needs to know about one type spelling, computed once by
+    classify_spelling(). Pointer decisions read the CppType instead: its flags and,
+    through pointer_target(), the structured pointee chain.
+    """
+    spelling: str
+    stripped: str  # leading const/class/struct/enum removed, spacing around */& normalized
+    base: str  # base identifier without pointers, references and cv-qualifiers
+    category: TypeCategory
+    pointee_const: bool  # 'const' before the first '*' of the stripped spelling (e.g. 'char const*')
+    primitive_base: bool  # base is a Godot-supported scalar (for pointer-to-primitive)
+    handle_type: Optional[str]  # canonical opencascade::handle<T> if the spelling is one
+    primitive_default: Optional[str]  # default exposed value when mapped as a primitive
+
+
+_PRIMITIVE_CATEGORIES = (TypeCategory.INTEGRAL, TypeCategory.FLOATING)
+
+# Distinct spelling -> record; classification does not depend on the mapper config
+_CLASSIFICATION_TABLE: Dict[str, TypeRecord] = {}
+
+
+def _classify(spelling: str) -> TypeRecord:
+    stripped = _strip_cv_and_class_kw(spelling)
+    if stripped == "void":
+        category = TypeCategory.VOID
+    elif stripped in _INTEGRAL_TYPES:
+        category = TypeCategory.INTEGRAL
+    elif stripped in _FLOATING_TYPES:
+        category = TypeCategory.FLOATING
+    elif _is_std_string(spelling):
+        category = TypeCategory.STD_STRING
+    else:
+        category = TypeCategory.OTHER
+    handle_type = _match_occt_handle_type(spelling)
+    if category is TypeCategory.OTHER and handle_type:
+        category = TypeCategory.OCCT_HANDLE
+    if stripped == "bool":
+        primitive_default: Optional[str] = "false"
+    elif _is_integral(stripped):
+        primitive_default = "0"
+    elif _is_floating(stripped):
+        primitive_default = "0.0"
+    else:
+        primitive_default = None
+    base = _base_identifier(spelling)
+    return TypeRecord(
+        spelling=spelling,
+        stripped=stripped,
+        base=base,
+        category=category,
+        pointee_const="const" in _pointer_left_part(_normalize_spaces(stripped)).split(),
+        primitive_base=_is_primitive_base_type(base),
+        handle_type=handle_type,
+        primitive_default=primitive_default,
+    )
+
+
+def classify_spelling(spelling: str) -> TypeRecord:
+    """
+    The classification record of a type spelling, computed on first use.
+    """
+    record = _CLASSIFICATION_TABLE.get(spelling)
+    if record is None:
+        record = _CLASSIFICATION_TABLE[spelling] = _classify(spelling)
+    return record
+
+
+def classify_spellings(spellings: Iterable[str]) -> Dict[str, TypeRecord]:
+    """
+    Classify a batch of spellings (each distinct one once) and return their records.
+    """
+    out: Dict[str, TypeRecord] = {}
+    for spelling in spellings:
+        if spelling not in out:
+            out[spelling] = classify_spelling(spelling)
+    return out
+
+
+def classified_type_count() -> int:
+    return len(_CLASSIFICATION_TABLE)
+
+
+# Canonical clang TypeKinds of plain char and of the scalars a pointer to which is exposed as intptr_t
+_CHAR_KINDS = frozenset({"CHAR_S", "CHAR_U"})
+_PRIMITIVE_KINDS = frozenset({
+    "BOOL", "SCHAR", "UCHAR", "WCHAR", "SHORT", "USHORT", "INT", "UINT", "LONG", "ULONG",
+    "LONGLONG", "ULONGLONG", "FLOAT", "DOUBLE", "LONGDOUBLE",
+})
+
+
+class PointeeKind(Enum):
+    CHAR = auto()
+    VOID = auto()
+    PRIMITIVE = auto()
+    OTHER = auto()
+
+
+@dataclass(frozen=True)
+class PointerTarget:
+    """
+    What a single-level pointer (or a reference to one) points to.
+    """
+    kind: PointeeKind
+    is_const: bool
+    base: str  # base identifier of the pointee, for casts
+
+
+def pointer_target(t: CppType) -> Optional[PointerTarget]:
+    """
+    The target of `t` if it is a single-level pointer, else None. Types collected by the
+    parser are read from their clang pointee chain, so 'char**' is not a char pointer and
+    typedefs such as Standard_CString are seen through; types built from a spelling alone
+    fall back to its classification record.
+    """
+    if t.is_structured:
+        if t.pointer_depth != 1:
+            return None
+        node = t
+        while node.kind != "POINTER":
+            node = node.pointee  # type: ignore[assignment]
+        target = node.pointee
+        if target is None:
+            return None
+        if target.kind in _CHAR_KINDS:
+            kind = PointeeKind.CHAR
+        elif target.kind == "VOID":
+            kind = PointeeKind.VOID
+        elif target.kind in _PRIMITIVE_KINDS:
+            kind = PointeeKind.PRIMITIVE
+        else:
+            kind = PointeeKind.OTHER
+        return PointerTarget(kind, target.is_const, classify_spelling(target.spelling).base)
+    if not t.is_pointer:
+        return None
+    rec = classify_spelling(t.spelling)
+    if rec.base == "char":
+        kind = PointeeKind.CHAR
+    elif rec.base == "void":
+        kind = PointeeKind.VOID
+    elif rec.primitive_base:
+        kind = PointeeKind.PRIMITIVE
+    else:
+        kind = PointeeKind.OTHER
+    return PointerTarget(kind, rec.pointee_const, rec.base)
+
+
 # --------------------------
 # Mapping model
 # --------------------------
@@ -312,27 +470,180 @@ class MappedMethod:
 # Configuration
 # --------------------------
 
-@dataclass
+class RuleMatchKind(Enum):
+    EXACT = auto()  # normalized base identifier, e.g. "TCollection_AsciiString"
+    GLOB = auto()  # fnmatch-style, e.g. "TCollection_*String"
+    REGEX = auto()  # Python regular expression matched against the whole base identifier
+    TEMPLATE = auto()  # template pattern, e.g. "NCollection_Array1<*>"
+
+
+@dataclass(frozen=True)
 class MappingRule:
     """
     Rule for custom type mapping. Use either constant strings or simple templates.
     Placeholders:
       - In to_native_expr/from_native_expr use "{var}" or "{expr}" as explained in MappedType.
+
+    `match` is compared with the normalized base identifier of a type (no pointers,
+    references or cv-qualifiers) according to `match_kind`. In TEMPLATE patterns, a `*`
+    between angle brackets matches exactly one template argument (which may itself be a
+    template) and a `*` elsewhere matches any run of identifier characters; whitespace
+    around `<`, `>` and `,` is ignored.
+    Immutable; call lines given as lists are stored as tuples.
     """
-    match: str  # normalized base type identifier to match (e.g., "::opencascade::Foo" or "TCollection_AsciiString")
+    match: str  # normalized base type identifier or pattern (e.g., "TCollection_AsciiString", "NCollection_Array1<*>")
     exposed_spelling: str
     kind: MappedKind
     to_native_expr: Optional[str] = None
     from_native_expr: Optional[str] = None
-    pre_call_lines: List[str] = field(default_factory=list)
-    post_call_lines: List[str] = field(default_factory=list)
+    pre_call_lines: Tuple[str, ...] = ()
+    post_call_lines: Tuple[str, ...] = ()
     notes: Optional[str] = None
+    match_kind: RuleMatchKind = RuleMatchKind.EXACT
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "pre_call_lines", tuple(self.pre_call_lines))
+        object.__setattr__(self, "post_call_lines", tuple(self.post_call_lines))
 
-@dataclass
+    @property
+    def key(self) -> str:
+        """
+        Key of the rule in MappingConfig.custom_rules: the normalized base identifier for
+        exact rules, the pattern itself otherwise.
+        """
+        if self.match_kind is RuleMatchKind.EXACT:
+            return classify_spelling(self.match).base
+        return self.match
+
+
+def _template_argument_re(depth: int) -> str:
+    # One template argument with at most `depth` levels of nested angle brackets
+    if depth == 0:
+        return r"[^<>,]+"
+    inner = _template_argument_re(depth - 1)
+    return rf"(?:[^<>,]|<\s*{inner}(?:\s*,\s*{inner})*\s*>)+"
+
+
+_TEMPLATE_ARGUMENT = _template_argument_re(3)
+_TEMPLATE_TOKEN_RE = re.compile(r"\s*([<>,])\s*|(\*)|(\s+)")
+
+
+def _template_pattern_re(pattern: str) -> str:
+    out: List[str] = []
+    depth = 0
+    pos = 0
+    for m in _TEMPLATE_TOKEN_RE.finditer(pattern):
+        out.append(re.escape(pattern[pos:m.start()]))
+        pos = m.end()
+        punct, star, space = m.groups()
+        if punct:
+            depth += {"<": 1, ">": -1}.get(punct, 0)
+            out.append(rf"\s*{re.escape(punct)}\s*")
+        elif star:
+            out.append(_TEMPLATE_ARGUMENT if depth > 0 else r"[\w:]*")
+        elif space:
+            out.append(r"\s+")
+    out.append(re.escape(pattern[pos:]))
+    return "".join(out)
+
+
+def _rule_regex(rule: MappingRule) -> str:
+    """
+    Regular expression (matched with fullmatch) equivalent to a pattern rule.
+    """
+    if rule.match_kind is RuleMatchKind.GLOB:
+        return fnmatch.translate(rule.match)
+    if rule.match_kind is RuleMatchKind.TEMPLATE:
+        return _template_pattern_re(rule.match.strip())
+    return rule.match
+
+
+class CompiledRules:
+    """
+    Custom rules compiled for lookup by base identifier: exact rules through a dict,
+    pattern rules (glob, regex, template) through one combined regular expression whose
+    alternatives are tried in rule order. Exact rules take precedence; results are
+    memoized per base identifier.
+
+    hits counts, per rule key, the type classifications a rule resolved (the mapper
+    classifies each distinct type once per role), so rules left at 0 after a run never
+    matched anything.
+    """
+
+    def __init__(self, rules: Iterable[MappingRule]) -> None:
+        self._exact: Dict[str, MappingRule] = {}
+        self._patterns: List[Tuple[MappingRule, Pattern[str]]] = []
+        self.hits: Dict[str, int] = {}
+        for rule in rules:
+            key = rule.key
+            self.hits[key] = 0
+            if rule.match_kind is RuleMatchKind.EXACT:
+                self._exact[key] = rule
+                continue
+            try:
+                self._patterns.append((rule, re.compile(_rule_regex(rule))))
+            except re.error as ex:
+                raise ValueError(f"Invalid {rule.match_kind.name.lower()} mapping rule '{rule.match}': {ex}") from ex
+        self._combined = self._combine()
+        self._memo: Dict[str, Optional[MappingRule]] = {}
+
+    def _combine(self) -> Optional[Pattern[str]]:
+        # Backreferences and named groups do not survive being merged into one pattern;
+        # such rule sets are matched one pattern at a time instead
+        if not self._patterns or any(rx.groupindex or re.search(r"\\\d", rx.pattern) for _, rx in self._patterns):
+            return None
+        try:
+            return re.compile("|".join(f"(?P<r{i}>{rx.pattern})" for i, (_, rx) in enumerate(self._patterns)))
+        except re.error:
+            return None
+
+    def __len__(self) -> int:
+        return len(self.hits)
+
+    def _lookup(self, base: str) -> Optional[MappingRule]:
+        rule = self._exact.get(base)
+        if rule is not None or not self._patterns:
+            return rule
+        if self._combined is not None:
+            m = self._combined.fullmatch(base)
+            return self._patterns[int(m.lastgroup[1:])][0] if m else None
+        for rule, rx in self._patterns:
+            if rx.fullmatch(base):
+                return rule
+        return None
+
+    def match(self, base: str) -> Optional[MappingRule]:
+        """
+        The rule for a normalized base identifier, or None.
+        """
+        try:
+            rule = self._memo[base]
+        except KeyError:
+            rule = self._memo[base] = self._lookup(base)
+        if rule is not None:
+            self.hits[rule.key] += 1
+        return rule
+
+    def add_hits(self, hits: Dict[str, int]) -> None:
+        """
+        Add hit counts gathered elsewhere (e.g. by the mapper of a worker process).
+        """
+        for key, n in hits.items():
+            self.hits[key] = self.hits.get(key, 0) + n
+
+    def unused(self) -> List[str]:
+        """
+        Keys of the rules that have not matched anything yet.
+        """
+        return [key for key, n in self.hits.items() if n == 0]
+
+
+@dataclass(frozen=True)
 class MappingConfig:
     """
-    Settings and extensions for the type-mapper.
+    Settings and extensions for the type-mapper. Immutable (custom_rules is a read-only
+    view), so TypeMapper caches cannot go stale; derive variants with with_rule() or
+    dataclasses.replace().
     """
     # Prefix applied to wrapper class names (must match GenerationContext.prefix)
     prefix: str = ""
@@ -342,18 +653,106 @@ class MappingConfig:
     use_wrapped_param_bridge: bool = True
     # Enable std::string mapping to godot::String
     enable_std_string: bool = True
-    # Custom rules keyed by normalized base identifier (no pointers/refs, no const)
-    custom_rules: Dict[str, MappingRule] = field(default_factory=dict)
+    # Custom rules keyed by MappingRule.key (normalized base identifier for exact rules, pattern otherwise)
+    custom_rules: Mapping[str, MappingRule] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "custom_rules", MappingProxyType(dict(self.custom_rules)))
+
+    def __reduce__(self):
+        # mappingproxy cannot be pickled; rebuild from plain field values
+        values = [getattr(self, f.name) for f in fields(self)]
+        return type(self), tuple(dict(v) if isinstance(v, MappingProxyType) else v for v in values)
 
     def with_rule(self, rule: MappingRule) -> "MappingConfig":
-        self.custom_rules[_base_identifier(rule.match)] = rule
-        return self
+        """
+        Return a copy of this config with `rule` added under its key.
+        """
+        if rule.match_kind is not RuleMatchKind.EXACT:
+            try:
+                re.compile(_rule_regex(rule))
+            except re.error as ex:
+                raise ValueError(f"Invalid {rule.match_kind.name.lower()} mapping rule '{rule.match}': {ex}") from ex
+        return replace(self, custom_rules={**self.custom_rules, rule.key: rule})
+
+    def compile_rules(self) -> CompiledRules:
+        return CompiledRules(self.custom_rules.values())
 
 
 # --------------------------
 # Mapper
 # --------------------------
 
+# Stands in for the parameter name in cached parameter mappings
+_PNAME = "\0pname\0"
+
+# (exposed params, return mapping, supported, reason, pre-call lines, post-call lines)
+_SignatureMapping = Tuple[List[MappedParameter], MappedType, bool, Optional[str], List[str], List[str]]
+
+
+@dataclass
+class MappingStats:
+    """
+    Counters for TypeMapper's caches and the time spent mapping methods.
+    """
+    methods: int = 0
+    type_lookups: int = 0
+    type_hits: int = 0
+    signature_lookups: int = 0
+    signature_hits: int = 0
+    mapping_seconds: float = 0.0
+
+    @property
+    def type_hit_rate(self) -> float:
+        return self.type_hits / self.type_lookups if self.type_lookups else 0.0
+
+    @property
+    def signature_hit_rate(self) -> float:
+        return self.signature_hits / self.signature_lookups if self.signature_lookups else 0.0
+
+    def add(self, other: "MappingStats") -> None:
+        self.methods += other.methods
+        self.type_lookups += other.type_lookups
+        self.type_hits += other.type_hits
+        self.signature_lookups += other.signature_lookups
+        self.signature_hits += other.signature_hits
+        self.mapping_seconds += other.mapping_seconds
+
+    def to_dict(self) -> Dict:
+        return {
+            "methods": self.methods,
+            "type_lookups": self.type_lookups,
+            "type_hits": self.type_hits,
+            "signature_lookups": self.signature_lookups,
+            "signature_hits": self.signature_hits,
+            "mapping_seconds": self.mapping_seconds,
+        }
+
+    def summary(self) -> str:
+        return (
+            f"{self.methods} method(s) in {self.mapping_seconds:.3f}s; "
+            f"type cache {100.0 * self.type_hit_rate:.1f}% hits ({self.type_lookups} lookup(s)), "
+            f"signature cache {100.0 * self.signature_hit_rate:.1f}% hits ({self.signature_lookups} lookup(s))"
+        )
+
+
+def _uses_pname(mapping: MappedType) -> bool:
+    return (
+        _PNAME in (mapping.to_native_expr or "")
+        or any(_PNAME in line for line in mapping.pre_call_lines)
+        or any(_PNAME in line for line in mapping.post_call_lines)
+    )
+
+
+def _bind_pname(mapping: MappedType, pname: str) -> MappedType:
+    return replace(
+        mapping,
+        to_native_expr=mapping.to_native_expr.replace(_PNAME, pname) if mapping.to_native_expr else mapping.to_native_expr,
+        pre_call_lines=[line.replace(_PNAME, pname) for line in mapping.pre_call_lines],
+        post_call_lines=[line.replace(_PNAME, pname) for line in mapping.post_call_lines],
+    )
+
+
 class TypeMapper:
     """
     Orchestrates type mapping decisions using known wrapped classes and config.
@@ -363,9 +762,13 @@ class TypeMapper:
       - or TypeMapper(known_wrapped_map, config)
     """
 
-    def __init__(self, known_wrapped: Dict[str, str], config: Optional[MappingConfig] = None) -> None:
-        # Map absolute native qname -> wrapper name
-        self.known_wrapped: Dict[str, str] = { _absolute_qualified_name(k): v for k, v in known_wrapped.items() }
+    def __init__(self, known_wrapped: Mapping[str, str], config: Optional[MappingConfig] = None) -> None:
+        self.stats = MappingStats()
+        # (spelling, is_const, is_pointer, is_reference) -> (mapping, uses parameter name)
+        self._param_cache: Dict[CppType, Tuple[MappedType, bool]] = {}
+        self._return_cache: Dict[CppType, MappedType] = {}
+        self._signature_cache: Dict[Tuple, _SignatureMapping] = {}
+        self.known_wrapped = known_wrapped
         self.config = config or MappingConfig()
 
     @staticmethod
@@ -377,6 +780,51 @@ class TypeMapper:
             km[_absolute_qualified_name(q)] = wrapper
         return TypeMapper(km, config=config)
 
+    # ---- Inputs and caching ----
+
+    @property
+    def known_wrapped(self) -> Mapping[str, str]:
+        """
+        Read-only map of absolute native qualified name -> wrapper name.
+        """
+        return self._known_wrapped
+
+    @known_wrapped.setter
+    def known_wrapped(self, known_wrapped: Mapping[str, str]) -> None:
+        self._known_wrapped = MappingProxyType({_absolute_qualified_name(k): v for k, v in known_wrapped.items()})
+        self.clear_cache()
+
+    @property
+    def config(self) -> MappingConfig:
+        return self._config
+
+    @config.setter
+    def config(self, config: MappingConfig) -> None:
+        self._config = config
+        self.rules = config.compile_rules()
+        self.clear_cache()
+
+    def wrapped_dependency_key(self, cls: ClassInfo) -> str:
+        """
+        Digest of the known wrapped classes that the mapping of `cls` depends on: for the
+        base of every parameter and return type, whether it is wrapped and under which
+        wrapper name. With equal configs, two mappers map `cls` identically when the keys
+        agree, so adding or removing a class only changes the keys of classes that refer
+        to it. The config itself is not included.
+        """
+        spellings = {t.spelling for m in cls.methods for t in (m.return_type, *(p.cpp_type for p in m.parameters))}
+        bases = sorted({_absolute_qualified_name(classify_spelling(s).base) for s in spellings})
+        return fingerprint_parts(f"{b}\1{self.known_wrapped.get(b, '')}" for b in bases)
+
+    def clear_cache(self) -> None:
+        """
+        Drop memoized type and signature mappings (stats and rule hit counters are kept).
+        Assigning `config` or `known_wrapped` does this automatically.
+        """
+        self._param_cache.clear()
+        self._return_cache.clear()
+        self._signature_cache.clear()
+
     # ---- Public API ----
 
     def map_method(self, cls: ClassInfo, m: MethodInfo) -> MappedMethod:
@@ -384,7 +832,85 @@ class TypeMapper:
         Compute an exposed signature and conversion snippets for a single method.
         If unsupported, supported=False with 'reason'.
         """
-        is_static = m.kind == MethodKind.STATIC
+        start = time.perf_counter()
+        exposed_params, rmapping, supported, reason, pre_lines, post_lines = self._map_signature(m)
+        mapped = MappedMethod(
+            cls_native_qname=cls.qualified_name,
+            cls_wrapper_name=cls.wrapper_name,
+            method_name=m.name,
+            is_const=m.is_const,
+            is_static=m.kind == MethodKind.STATIC,
+            exposed_params=list(exposed_params),
+            exposed_return=MappedReturn(mapping=rmapping),
+            supported=supported,
+            reason=reason,
+            pre_call_lines=list(pre_lines),
+            post_call_lines=list(post_lines),
+            exposed_name=m.exposed_name,
+            overload_index=m.overload_index,
+        )
+        self.stats.methods += 1
+        self.stats.mapping_seconds += time.perf_counter() - start
+        return mapped
+
+    def map_class(self, cls: ClassInfo) -> List[MappedMethod]:
+        """
+        Map every method of `cls` except constructors and destructors, in order
+        (supported or not).
+        """
+        return [
+            self.map_method(cls, m)
+            for m in cls.methods
+            if m.kind not in (MethodKind.CONSTRUCTOR, MethodKind.DESTRUCTOR)
+        ]
+
+    def map_classes(self, classes: Sequence[ClassInfo]) -> List[List[MappedMethod]]:
+        """
+        Batch form of map_class: one list per class, in order. Each distinct method
+        signature (parameter names and types, return type) is mapped once across all
+        classes (and across calls on the same mapper); every distinct type spelling is
+        classified up front.
+        """
+        classify_spellings(
+            t.spelling
+            for ci in classes
+            for m in ci.methods
+            for t in (m.return_type, *(p.cpp_type for p in m.parameters))
+        )
+        return [self.map_class(ci) for ci in classes]
+
+    def log_rule_hits(self, partial: bool = False) -> None:
+        """
+        Log the custom rule hit counters (debug level); rules that never matched are
+        candidates for pruning.
+
+        Parameters:
+          - partial: only some of the classes were mapped (e.g. unchanged classes were
+            skipped by incremental emission); counts are labeled as partial and rules
+            are not reported as never matched
+        """
+        if not len(self.rules):
+            return
+        hits = ", ".join(f"{key}={n}" for key, n in self.rules.hits.items())
+        if partial:
+            logger.debug("Custom rule hits (partial, unchanged classes were not mapped): %s", hits)
+            return
+        logger.debug("Custom rule hits: %s", hits)
+        unused = self.rules.unused()
+        if unused:
+            logger.debug("%d of %d custom rule(s) never matched: %s", len(unused), len(self.rules), ", ".join(unused))
+
+    def _map_signature(self, m: MethodInfo) -> _SignatureMapping:
+        key = (tuple((p.name, p.cpp_type) for p in m.parameters), m.return_type)
+        self.stats.signature_lookups += 1
+        cached = self._signature_cache.get(key)
+        if cached is not None:
+            self.stats.signature_hits += 1
+            return cached
+        cached = self._signature_cache[key] = self._compute_signature(m)
+        return cached
+
+    def _compute_signature(self, m: MethodInfo) -> _SignatureMapping:
         exposed_params: List[MappedParameter] = []
         pre_lines: List[str] = []
         post_lines: List[str] = []
@@ -394,19 +920,8 @@ class TypeMapper:
             pname = p.name or f"arg{i}"
             pmapping = self._map_parameter(p.cpp_type, pname)
             if pmapping.kind == MappedKind.UNSUPPORTED:
-                return MappedMethod(
-                    cls_native_qname=cls.qualified_name,
-                    cls_wrapper_name=cls.wrapper_name,
-                    method_name=m.name,
-                    is_const=m.is_const,
-                    is_static=is_static,
-                    exposed_params=[],
-                    exposed_return=MappedReturn(mapping=self._void_mapping()),
-                    supported=False,
-                    reason=f"Unsupported parameter '{pname}' type '{p.cpp_type.spelling}'",
-                    exposed_name=m.exposed_name,
-                    overload_index=m.overload_index,
-                )
+                reason = f"Unsupported parameter '{pname}' type '{p.cpp_type.spelling}'"
+                return [], self._void_mapping(), False, reason, [], []
             exposed_params.append(MappedParameter(name=pname, mapping=pmapping))
             pre_lines.extend(pmapping.pre_call_lines)
             post_lines.extend(pmapping.post_call_lines)
@@ -414,37 +929,10 @@ class TypeMapper:
         # Return type
         rmapping = self._map_return(m.return_type)
         if rmapping.kind == MappedKind.UNSUPPORTED:
-            return MappedMethod(
-                cls_native_qname=cls.qualified_name,
-                cls_wrapper_name=cls.wrapper_name,
-                method_name=m.name,
-                is_const=m.is_const,
-                is_static=is_static,
-                exposed_params=exposed_params,
-                exposed_return=MappedReturn(mapping=rmapping),
-                supported=False,
-                reason=f"Unsupported return type '{m.return_type.spelling}'",
-                pre_call_lines=pre_lines,
-                post_call_lines=post_lines,
-                exposed_name=m.exposed_name,
-                overload_index=m.overload_index,
-            )
+            reason = f"Unsupported return type '{m.return_type.spelling}'"
+            return exposed_params, rmapping, False, reason, pre_lines, post_lines
 
-        return MappedMethod(
-            cls_native_qname=cls.qualified_name,
-            cls_wrapper_name=cls.wrapper_name,
-            method_name=m.name,
-            is_const=m.is_const,
-            is_static=is_static,
-            exposed_params=exposed_params,
-            exposed_return=MappedReturn(mapping=rmapping),
-            supported=True,
-            reason=None,
-            pre_call_lines=pre_lines + rmapping.pre_call_lines,
-            post_call_lines=post_lines + rmapping.post_call_lines,
-            exposed_name=m.exposed_name,
-            overload_index=m.overload_index,
-        )
+        return exposed_params, rmapping, True, None, pre_lines + rmapping.pre_call_lines, post_lines + rmapping.post_call_lines
 
     # ---- Primitive/string/wrapper/opaque rules ----
 
@@ -452,29 +940,22 @@ class TypeMapper:
         return MappedType(native_spelling="void", exposed_spelling="void", kind=MappedKind.VOID)
 
     def _primitive_mapping(self, t: CppType) -> MappedType:
-        s = _strip_cv_and_class_kw(t.spelling)
-        # Compute a reasonable default expression for exposed return values
-        default_expr: Optional[str] = None
-        if s == "bool":
-            default_expr = "false"
-        elif _is_integral(s):
-            default_expr = "0"
-        elif _is_floating(s):
-            default_expr = "0.0"
+        rec = classify_spelling(t.spelling)
         # Keep primitive as-is in wrapper signature (GDExtension supports these)
-        return MappedType(native_spelling=s, exposed_spelling=s, kind=MappedKind.PRIMITIVE, default_exposed_value=default_expr)
+        return MappedType(native_spelling=rec.stripped, exposed_spelling=rec.stripped, kind=MappedKind.PRIMITIVE, default_exposed_value=rec.primitive_default)
 
     def _string_param_mapping_c_char_ptr(self, t: CppType, pname: str) -> MappedType:
         """
         Map exposed `godot::String` to native `const char*`. Requires temporaries to keep
         the C string alive for the call duration.
         """
+        rec = classify_spelling(t.spelling)
         pre = [
             f"godot::CharString __{pname}_utf8 = {pname}.utf8();",
             f"const char* __{pname}_cstr = __{pname}_utf8.get_data();",
         ]
         return MappedType(
-            native_spelling=_strip_cv_and_class_kw(t.spelling),
+            native_spelling=rec.stripped,
             exposed_spelling="godot::String",
             kind=MappedKind.STRING,
             to_native_expr=f"__{pname}_cstr",
@@ -486,12 +967,13 @@ class TypeMapper:
         """
         Map exposed `godot::String` to native `std::string`. Use UTF-8 encoding.
         """
+        rec = classify_spelling(t.spelling)
         pre = [
             f"godot::CharString __{pname}_utf8 = {pname}.utf8();",
             f"std::string __{pname}_std(__{pname}_utf8.get_data());",
         ]
         return MappedType(
-            native_spelling=_strip_cv_and_class_kw(t.spelling),
+            native_spelling=rec.stripped,
             exposed_spelling="godot::String",
             kind=MappedKind.STRING,
             to_native_expr=f"__{pname}_std",
@@ -504,8 +986,9 @@ class TypeMapper:
         Map native `const char*` (or char*) to exposed `godot::String`.
         Assumes the returned pointer remains valid for the conversion expression.
         """
+        rec = classify_spelling(t.spelling)
         return MappedType(
-            native_spelling=_strip_cv_and_class_kw(t.spelling),
+            native_spelling=rec.stripped,
             exposed_spelling="godot::String",
             kind=MappedKind.STRING,
             from_native_expr='godot::String::utf8({expr})',
@@ -517,8 +1000,9 @@ class TypeMapper:
         """
         Map native `std::string` to exposed `godot::String`.
         """
+        rec = classify_spelling(t.spelling)
         return MappedType(
-            native_spelling=_strip_cv_and_class_kw(t.spelling),
+            native_spelling=rec.stripped,
             exposed_spelling="godot::String",
             kind=MappedKind.STRING,
             from_native_expr='godot::String::utf8({expr}.c_str())',
@@ -530,13 +1014,14 @@ class TypeMapper:
         """
         Expose `Ref<Wrapper>` while passing native pointer/reference to impl via __ocgd_get_impl().
         """
+        rec = classify_spelling(t.spelling)
         pre: List[str] = []
         if t.is_reference:
             expr = f"*reinterpret_cast<{native_base}*>(__ocgd_get_impl({{var}}.ptr()))"
         else:
             expr = f"reinterpret_cast<{native_base}*>(__ocgd_get_impl({{var}}.ptr()))"
         return MappedType(
-            native_spelling=_strip_cv_and_class_kw(t.spelling),
+            native_spelling=rec.stripped,
             exposed_spelling=f"godot::Ref<{wrapper_name}>",
             kind=MappedKind.WRAPPED_CLASS,
             to_native_expr=expr,
@@ -549,9 +1034,10 @@ class TypeMapper:
         Expose `Ref<Wrapper>` and wrap a returned `native*` with set_impl(ptr, false).
         Ownership is not taken by default to avoid double delete.
         """
+        rec = classify_spelling(t.spelling)
         expr = f"__ocgd_make_from_impl(reinterpret_cast<void*>({{expr}}))"
         return MappedType(
-            native_spelling=_strip_cv_and_class_kw(t.spelling),
+            native_spelling=rec.stripped,
             exposed_spelling=f"godot::Ref<{wrapper_name}>",
             kind=MappedKind.WRAPPED_CLASS,
             from_native_expr=expr,
@@ -572,9 +1058,10 @@ class TypeMapper:
               static void release(uint64_t handle);
           };
         """
-        base_norm = _base_identifier(t.spelling)
+        rec = classify_spelling(t.spelling)
+        base_norm = rec.base
         return MappedType(
-            native_spelling=_strip_cv_and_class_kw(t.spelling),
+            native_spelling=rec.stripped,
             exposed_spelling="uint64_t",
             kind=MappedKind.OPAQUE_HANDLE,
             from_native_expr=f"OpaqueHandleRegistry<{base_norm}>::put({{expr}})",
@@ -585,21 +1072,35 @@ class TypeMapper:
     # ---- Parameter mapping ----
 
     def _map_parameter(self, t: CppType, pname: str) -> MappedType:
+        # Structured types are interned, so the type itself (kind and pointee chain included) is the key
+        self.stats.type_lookups += 1
+        cached = self._param_cache.get(t)
+        if cached is None:
+            mapping = self._classify_parameter(t, _PNAME)
+            cached = self._param_cache[t] = (mapping, _uses_pname(mapping))
+        else:
+            self.stats.type_hits += 1
+        mapping, uses_pname = cached
+        return _bind_pname(mapping, pname) if uses_pname else mapping
+
+    def _classify_parameter(self, t: CppType, pname: str) -> MappedType:
+        rec = classify_spelling(t.spelling)
         # Void parameter: not expected
-        if _strip_cv_and_class_kw(t.spelling) == "void":
+        if rec.category is TypeCategory.VOID:
             return MappedType(native_spelling="void", exposed_spelling="void", kind=MappedKind.UNSUPPORTED, notes="void parameter is invalid")
 
         # Primitive scalars are directly supported by Godot
-        if _is_integral(t.spelling) or _is_floating(t.spelling):
+        if rec.category in _PRIMITIVE_CATEGORIES:
             return self._primitive_mapping(t)
 
+        target = pointer_target(t)
         # Godot String mapping only for const char* (pointer-to-const)
-        if _is_c_char_ptr_const(t):
+        if target is not None and target.kind is PointeeKind.CHAR and target.is_const:
             return self._string_param_mapping_c_char_ptr(t, pname)
         # Writable char* buffers should not be mapped to String; expose as intptr_t
-        if _is_c_char_ptr(t):
+        if target is not None and target.kind is PointeeKind.CHAR:
             return MappedType(
-                native_spelling=_strip_cv_and_class_kw(t.spelling),
+                native_spelling=rec.stripped,
                 exposed_spelling="intptr_t",
                 kind=MappedKind.PRIMITIVE,
                 to_native_expr="reinterpret_cast<char*>(static_cast<intptr_t>({var}))",
@@ -608,14 +1109,13 @@ class TypeMapper:
             )
 
         # std::string mapping if enabled
-        if self.config.enable_std_string and _is_std_string(t.spelling):
+        if self.config.enable_std_string and rec.category is TypeCategory.STD_STRING:
             return self._string_param_mapping_std_string(t, pname)
 
         # OCCT handle<T> parameter mapping disabled in simplified mode
-        handle_type = _match_occt_handle_type(t.spelling)
-        if handle_type:
+        if rec.handle_type:
             return MappedType(
-                native_spelling=_strip_cv_and_class_kw(t.spelling),
+                native_spelling=rec.stripped,
                 exposed_spelling="<unsupported>",
                 kind=MappedKind.UNSUPPORTED,
                 notes="OCCT handle<T> parameter not supported in simplified mode",
@@ -623,9 +1123,9 @@ class TypeMapper:
 
         # void* parameter mapping -> intptr_t exposed
         # Ensures typedef aliases like Standard_Address (void*) are exposed as intptr_t
-        if t.is_pointer and _base_identifier(t.spelling) == "void":
+        if target is not None and target.kind is PointeeKind.VOID:
             return MappedType(
-                native_spelling=_strip_cv_and_class_kw(t.spelling),
+                native_spelling=rec.stripped,
                 exposed_spelling="intptr_t",
                 kind=MappedKind.PRIMITIVE,
                 to_native_expr="reinterpret_cast<void*>(static_cast<intptr_t>({var}))",
@@ -637,7 +1137,7 @@ class TypeMapper:
         custom = self._match_custom_rule(t)
         if custom:
             return MappedType(
-                native_spelling=_strip_cv_and_class_kw(t.spelling),
+                native_spelling=rec.stripped,
                 exposed_spelling=custom.exposed_spelling,
                 kind=custom.kind,
                 to_native_expr=custom.to_native_expr,
@@ -648,34 +1148,39 @@ class TypeMapper:
             )
 
         # Wrapped class bridging (pointer/reference parameters)
-        base = _base_identifier(t.spelling)
+        base = rec.base
         base_abs = _absolute_qualified_name(base)
-        if (t.is_pointer or t.is_reference) and base_abs in self.known_wrapped and self.config.use_wrapped_param_bridge:
+        if (
+            (t.is_pointer or t.is_reference)
+            and t.pointer_depth <= 1
+            and base_abs in self.known_wrapped
+            and self.config.use_wrapped_param_bridge
+        ):
             wrapper = self.known_wrapped[base_abs]
             return self._wrapped_param_mapping_ptr(t, pname, base_abs, wrapper)
 
         # Unknown pointer/reference param: map pointers to opaque handles if enabled; references unsupported
         if t.is_pointer:
             # Avoid opaque handles for pointers to primitive scalars (e.g., double*, int*): use intptr_t instead
-            if _is_pointer_to_primitive(t):
+            if target is not None and target.kind is PointeeKind.PRIMITIVE:
                 return MappedType(
-                    native_spelling=_strip_cv_and_class_kw(t.spelling),
+                    native_spelling=rec.stripped,
                     exposed_spelling="intptr_t",
                     kind=MappedKind.PRIMITIVE,
-                    to_native_expr="reinterpret_cast<{}*>(static_cast<intptr_t>({{var}}))".format(_base_identifier(t.spelling)),
+                    to_native_expr="reinterpret_cast<{}*>(static_cast<intptr_t>({{var}}))".format(target.base),
                     default_exposed_value="0",
                     notes="Pointer to primitive mapped to intptr_t (no opaque handle needed)",
                 )
             # opaque handles disabled: fall through to unsupported
             return MappedType(
-                native_spelling=_strip_cv_and_class_kw(t.spelling),
+                native_spelling=rec.stripped,
                 exposed_spelling="<unsupported>",
                 kind=MappedKind.UNSUPPORTED,
                 notes="Pointer parameter to unknown type is not supported",
             )
         if t.is_reference:
             return MappedType(
-                native_spelling=_strip_cv_and_class_kw(t.spelling),
+                native_spelling=rec.stripped,
                 exposed_spelling="<unsupported>",
                 kind=MappedKind.UNSUPPORTED,
                 notes="Reference parameter to unknown type is not supported",
@@ -683,7 +1188,7 @@ class TypeMapper:
 
         # Fallback unsupported
         return MappedType(
-            native_spelling=_strip_cv_and_class_kw(t.spelling),
+            native_spelling=rec.stripped,
             exposed_spelling="<unsupported>",
             kind=MappedKind.UNSUPPORTED,
             notes="Type not recognized as Variant-compatible or convertible",
@@ -692,25 +1197,35 @@ class TypeMapper:
     # ---- Return mapping ----
 
     def _map_return(self, t: CppType) -> MappedType:
+        self.stats.type_lookups += 1
+        mapping = self._return_cache.get(t)
+        if mapping is None:
+            mapping = self._return_cache[t] = self._classify_return(t)
+        else:
+            self.stats.type_hits += 1
+        return mapping
+
+    def _classify_return(self, t: CppType) -> MappedType:
+        rec = classify_spelling(t.spelling)
         # void
-        if _strip_cv_and_class_kw(t.spelling) == "void":
+        if rec.category is TypeCategory.VOID:
             return self._void_mapping()
 
         # Primitive scalars: direct
-        if _is_integral(t.spelling) or _is_floating(t.spelling):
+        if rec.category in _PRIMITIVE_CATEGORIES:
             return self._primitive_mapping(t)
 
         # Strings
-        if _is_c_char_ptr(t):
+        target = pointer_target(t)
+        if target is not None and target.kind is PointeeKind.CHAR:
             return self._string_return_mapping_c_char_ptr(t)
-        if self.config.enable_std_string and _is_std_string(t.spelling):
+        if self.config.enable_std_string and rec.category is TypeCategory.STD_STRING:
             return self._string_return_mapping_std_string(t)
 
         # OCCT handle<T> return mapping disabled in simplified mode
-        handle_type = _match_occt_handle_type(t.spelling)
-        if handle_type:
+        if rec.handle_type:
             return MappedType(
-                native_spelling=_strip_cv_and_class_kw(t.spelling),
+                native_spelling=rec.stripped,
                 exposed_spelling="<unsupported>",
                 kind=MappedKind.UNSUPPORTED,
                 notes="OCCT handle<T> return not supported in simplified mode",
@@ -718,9 +1233,9 @@ class TypeMapper:
 
         # void* return mapping -> intptr_t exposed
         # Ensures typedef aliases like Standard_Address (void*) are exposed as intptr_t
-        if t.is_pointer and _base_identifier(t.spelling) == "void":
+        if target is not None and target.kind is PointeeKind.VOID:
             return MappedType(
-                native_spelling=_strip_cv_and_class_kw(t.spelling),
+                native_spelling=rec.stripped,
                 exposed_spelling="intptr_t",
                 kind=MappedKind.PRIMITIVE,
                 from_native_expr="reinterpret_cast<intptr_t>({expr})",
@@ -732,7 +1247,7 @@ class TypeMapper:
         custom = self._match_custom_rule(t)
         if custom:
             return MappedType(
-                native_spelling=_strip_cv_and_class_kw(t.spelling),
+                native_spelling=rec.stripped,
                 exposed_spelling=custom.exposed_spelling,
                 kind=custom.kind,
                 to_native_expr=custom.to_native_expr,
@@ -743,17 +1258,17 @@ class TypeMapper:
             )
 
         # Wrapped class pointer returns
-        base = _base_identifier(t.spelling)
+        base = rec.base
         base_abs = _absolute_qualified_name(base)
-        if t.is_pointer and base_abs in self.known_wrapped:
+        if t.is_pointer and t.pointer_depth <= 1 and base_abs in self.known_wrapped:
             wrapper = self.known_wrapped[base_abs]
             return self._wrapped_return_mapping_ptr(t, base_abs, wrapper)
 
         # Unknown pointer return -> unsupported (except primitive pointers mapped to intptr_t)
         if t.is_pointer:
-            if _is_pointer_to_primitive(t):
+            if target is not None and target.kind is PointeeKind.PRIMITIVE:
                 return MappedType(
-                    native_spelling=_strip_cv_and_class_kw(t.spelling),
+                    native_spelling=rec.stripped,
                     exposed_spelling="intptr_t",
                     kind=MappedKind.PRIMITIVE,
                     from_native_expr="reinterpret_cast<intptr_t>({expr})",
@@ -761,7 +1276,7 @@ class TypeMapper:
                     notes="Pointer to primitive mapped to intptr_t (opaque handles disabled)",
                 )
             return MappedType(
-                native_spelling=_strip_cv_and_class_kw(t.spelling),
+                native_spelling=rec.stripped,
                 exposed_spelling="<unsupported>",
                 kind=MappedKind.UNSUPPORTED,
                 notes="Pointer return to unknown type is not supported in simplified mode",
@@ -770,7 +1285,7 @@ class TypeMapper:
         # Unknown reference or value class return: not supported (copy/ownership unclear)
         if t.is_reference or ("::" in base and not t.is_pointer):
             return MappedType(
-                native_spelling=_strip_cv_and_class_kw(t.spelling),
+                native_spelling=rec.stripped,
                 exposed_spelling="<unsupported>",
                 kind=MappedKind.UNSUPPORTED,
                 notes="Returning complex class by value/reference is not supported without explicit mapping",
@@ -778,7 +1293,7 @@ class TypeMapper:
 
         # Fallback unsupported
         return MappedType(
-            native_spelling=_strip_cv_and_class_kw(t.spelling),
+            native_spelling=rec.stripped,
             exposed_spelling="<unsupported>",
             kind=MappedKind.UNSUPPORTED,
             notes="Return type not recognized as Variant-compatible or convertible",
@@ -787,8 +1302,7 @@ class TypeMapper:
     # ---- Custom rules matching ----
 
     def _match_custom_rule(self, t: CppType) -> Optional[MappingRule]:
-        base = _base_identifier(t.spelling)
-        return self.config.custom_rules.get(base)
+        return self.rules.match(classify_spelling(t.spelling).base)
 
 
 # --------------------------
@@ -799,14 +1313,7 @@ def supported_mapped_methods(mapper: TypeMapper, cls: ClassInfo) -> List[MappedM
     """
     Helper: get only supported mapped methods for a class, skipping constructors/destructors.
     """
-    out: List[MappedMethod] = []
-    for m in cls.methods:
-        if m.kind in (MethodKind.CONSTRUCTOR, MethodKind.DESTRUCTOR):
-            continue
-        mm = mapper.map_method(cls, m)
-        if mm.supported:
-            out.append(mm)
-    return out
+    return [mm for mm in mapper.map_class(cls) if mm.supported]
 
 
 def build_known_wrapped_map(classes: Sequence[ClassInfo]) -> Dict[str, str]:
@@ -831,7 +1338,8 @@ def default_occt_mapper(classes: Sequence[ClassInfo], prefix: str) -> TypeMapper
     - Wrapped class pointer bridging (Ref<Wrapper> <-> native*)
     - Opaque handle mapping for unknown pointer returns
 
-    Extend with config.with_rule(...) for project-specific types (e.g., TCollection_AsciiString).
+    Extend with mapper.config = mapper.config.with_rule(...) for project-specific types
+    (e.g., TCollection_AsciiString).
     """
     cfg = MappingConfig(
         prefix=prefix,
@@ -840,7 +1348,7 @@ def default_occt_mapper(classes: Sequence[ClassInfo], prefix: str) -> TypeMapper
         enable_std_string=True,
     )
     # Example: map OCCT Standard_CString (typedef const char*) explicitly (optional)
-    cfg.with_rule(MappingRule(
+    cfg = cfg.with_rule(MappingRule(
         match="Standard_CString",
         exposed_spelling="godot::String",
         kind=MappedKind.STRING,
@@ -861,7 +1369,18 @@ __all__ = [
     "MappedMethod",
     "MappingRule",
     "MappingConfig",
+    "RuleMatchKind",
+    "CompiledRules",
+    "MappingStats",
+    "PointeeKind",
+    "PointerTarget",
+    "TypeCategory",
     "TypeMapper",
+    "TypeRecord",
+    "classified_type_count",
+    "classify_spelling",
+    "classify_spellings",
+    "pointer_target",
     "supported_mapped_methods",
     "build_known_wrapped_map",
     "default_occt_mapper",
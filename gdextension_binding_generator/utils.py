@@ -4,9 +4,14 @@ Utilities for templating (Jinja2) and file I/O for the GDExtension binding gener
 
 This module provides:
 - Robust, layered Jinja2 environment creation with user templates, package templates,
-  and embedded templates as fallback.
+  and embedded templates as fallback, with an optional on-disk bytecode cache keyed by
+  template contents.
 - Helpful template filters and globals to make Jinja usage concise and safe.
 - Production-grade file writing helpers (atomic writes, newline normalization, idempotency).
+- OutputWriter: writes generated files with an OutputIndex (size, mtime and content digest
+  per file, so unchanged files are recognized without reading them back) and optional
+  per-file or batched fsync of files and directories. The index also records which files
+  the generator owns, so generated files a run no longer produces can be pruned.
 
 The goal is to keep the rest of the codebase clean and focused on parsing and emission logic.
 """
@@ -14,12 +19,14 @@ The goal is to keep the rest of the codebase clean and focused on parsing and em
 from __future__ import annotations
 
 import io
+import json
 import os
 import shutil
 import sys
 import tempfile
+from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union, TextIO
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple, Union, TextIO
 import logging
 
 logger = logging.getLogger(__name__)
@@ -84,7 +91,40 @@ def configure_logging(
     global logger
     logger = logging.getLogger(__name__)
 
+def get_generator_version() -> Optional[str]:
+    """
+    Resolve the installed generator version (distribution metadata, then a package-level
+    __version__). Returns None when neither is available, e.g. when running from a checkout.
+    """
+    try:
+        # Python 3.8+
+        from importlib import metadata as importlib_metadata  # type: ignore
+    except Exception:
+        importlib_metadata = None  # type: ignore
+    if importlib_metadata is not None:
+        for dist_name in (
+            "gdextension-binding-generator",
+            "gdextension_binding_generator",
+        ):
+            try:
+                version = importlib_metadata.version(dist_name)  # type: ignore[attr-defined]
+                if version:
+                    return version
+            except Exception:
+                pass
+    # Fallback: try package-level __version__
+    try:
+        import importlib
+        top_pkg = (__package__ or "").split(".")[0]
+        if top_pkg:
+            pkg_mod = importlib.import_module(top_pkg)
+            return getattr(pkg_mod, "__version__", None)
+    except Exception:
+        pass
+    return None
+
 try:
+    import jinja2
     from jinja2 import (
         ChoiceLoader,
         DictLoader,
@@ -94,7 +134,9 @@ try:
         StrictUndefined,
         TemplateNotFound,
     )
+    from jinja2.bccache import Bucket, FileSystemBytecodeCache
 except Exception as e:  # pragma: no cover
+    jinja2 = None  # type: ignore
     Environment = None  # type: ignore
     ChoiceLoader = None  # type: ignore
     DictLoader = None  # type: ignore
@@ -102,217 +144,51 @@ except Exception as e:  # pragma: no cover
     PackageLoader = None  # type: ignore
     StrictUndefined = None  # type: ignore
     TemplateNotFound = Exception  # type: ignore
+    Bucket = None  # type: ignore
+    FileSystemBytecodeCache = None  # type: ignore
 
-# Prefer importing helpers from models to keep logic consistent.
-try:
-    from .models import camel_to_snake, sanitize_identifier
-except Exception:
-    # Fallback minimal implementations (avoid circular deps if needed).
-    def camel_to_snake(name: str) -> str:
-        out: List[str] = []
-        prev_lower = False
-        prev_char = ""
-        for ch in name:
-            if ch.isupper() and (prev_lower or (prev_char and prev_char.isalpha() and prev_char != "_")):
-                out.append("_")
-            out.append(ch.lower())
-            prev_lower = ch.islower()
-            prev_char = ch
-        return "".join(out)
-
-    def sanitize_identifier(name: str) -> str:
-        snake = camel_to_snake(name)
-        reserved = {
-            "class",
-            "enum",
-            "struct",
-            "union",
-            "template",
-            "operator",
-            "signal",
-            "var",
-            "const",
-            "static",
-            "void",
-            "int",
-            "float",
-            "bool",
-            "true",
-            "false",
-            "self",
-            "super",
-            "_init",
-            "_ready",
-            "_process",
-            "_physics_process",
-        }
-        if snake in reserved:
-            return f"{snake}_"
-        return snake
+from .fingerprint import file_digest, fingerprint_bytes, fingerprint_parts, stable_signature_hash
+from .naming import camel_to_snake, sanitize_identifier
 
 # ----------------------------------------
 # Jinja environment helpers
 # ----------------------------------------
 
 
-# --------------------------
-# Utilities
-# --------------------------
-
-_GODOT_RESERVED_IDENTIFIERS = {
-    # Common C++/C/GDScript/godot-cpp sensitive identifiers to avoid exposing verbatim.
-    "class",
-    "enum",
-    "struct",
-    "union",
-    "template",
-    "operator",
-    "signal",
-    "var",
-    "const",
-    "static",
-    "void",
-    "int",
-    "float",
-    "bool",
-    "true",
-    "false",
-    "self",
-    "super",
-    "_init",
-    "_ready",
-    "_process",
-    "_physics_process",
-    # Additional C++ keywords that can appear as method names; disambiguate by suffixing underscore.
-    "throw",
-}
-
-def camel_to_snake(name: str) -> str:
-    """
-    Convert CamelCase or mixedCase to snake_case, leaving existing underscores intact.
-    """
-    out: List[str] = []
-    prev_lower = False
-    prev_char = ""
-    for ch in name:
-        if ch.isupper() and (prev_lower or (prev_char and prev_char.isalpha() and prev_char != "_")):
-            out.append("_")
-        out.append(ch.lower())
-        prev_lower = ch.islower()
-        prev_char = ch
-    return "".join(out)
-
-def sanitize_identifier(name: str) -> str:
-    """
-    Sanitize an identifier for exposure to Godot/C++:
-    - Convert to snake_case by convention.
-    - Replace non [A-Za-z0-9_] characters with underscores.
-    - Ensure it does not start with a digit (prefix with underscore if needed).
-    - If it collides with a reserved identifier, append a trailing underscore.
-    """
-    snake = camel_to_snake(name or "")
-
-    # Replace non-word characters with underscores
-    cleaned_chars: List[str] = []
-    for ch in snake:
-        if ch.isalnum() or ch == "_":
-            cleaned_chars.append(ch)
-        else:
-            cleaned_chars.append("_")
-    ident = "".join(cleaned_chars)
-
-    # Ensure non-empty identifier
-    if not ident:
-        ident = "_"
-
-    # Ensure it does not start with a digit
-    if ident[0].isdigit():
-        ident = f"_{ident}"
-
-    # Avoid reserved identifiers
-    if ident in _GODOT_RESERVED_IDENTIFIERS:
-        return f"{ident}_"
-    return ident
-
-def stable_signature_hash(text: str) -> str:
-    """
-    Produce a short, stable hash for disambiguation (deterministic, no randomness).
-    We avoid external deps; use a simple FNV-1a 32-bit variant and encode as base36.
-    """
-    fnv_prime = 0x01000193
-    hash_val = 0x811C9DC5
-    for b in text.encode("utf-8"):
-        hash_val ^= b
-        hash_val = (hash_val * fnv_prime) & 0xFFFFFFFF
-    # base36
-    alphabet = "0123456789abcdefghijklmnopqrstuvwxyz"
-    if hash_val == 0:
-        return "0"
-    chars = []
-    v = hash_val
-    while v > 0:
-        v, rem = divmod(v, 36)
-        chars.append(alphabet[rem])
-    return "".join(reversed(chars))
-
-
-def sanitize_identifier(name: str) -> str:
-    """
-    Sanitize an identifier for exposure to C++/Godot:
-    - Convert to snake_case (consistent with templates).
-    - Replace non [A-Za-z0-9_] characters with underscores.
-    - Ensure it does not start with a digit (prefix with underscore if needed).
-    - If it collides with a reserved identifier or C++ keyword, append a trailing underscore.
-    """
-    # Start from raw name; avoid calling any external sanitizer to prevent recursion
-    plain = name or "identifier"
-
-    # Normalize to snake_case using the project's function if available
-    try:
-        snake = camel_to_snake(plain)
-    except Exception:
-        snake = plain
-
-    cleaned_chars = []
-    for ch in snake:
-        if ch.isalnum() or ch == "_":
-            cleaned_chars.append(ch)
-        else:
-            cleaned_chars.append("_")
-    ident = "".join(cleaned_chars) or "_"
-
-    if ident[0].isdigit():
-        ident = f"_{ident}"
-
-    # C++ and Godot-sensitive reserved words that must not be used verbatim
-    cpp_reserved = [
-        # C++ keywords and common builtins
-        "alignas","alignof","and","and_eq","asm","auto","bitand","bitor","bool","break","case",
-        "catch","char","char8_t","char16_t","char32_t","class","compl","const","consteval",
-        "constexpr","constinit","const_cast","continue","co_await","co_return","co_yield",
-        "decltype","default","delete","do","double","dynamic_cast","else","enum","explicit",
-        "export","extern","false","float","for","friend","goto","if","inline","int","long",
-        "mutable","namespace","new","noexcept","not","not_eq","nullptr","operator","or","or_eq",
-        "private","protected","public","register","reinterpret_cast","return","short","signed",
-        "sizeof","static","static_assert","static_cast","struct","switch","template","this",
-        "thread_local","throw","true","try","typedef","typeid","typename","union","unsigned",
-        "using","virtual","void","volatile","wchar_t","while","xor","xor_eq",
-        # Common godot/c++ identifiers we avoid exposing
-        "signal","var","self","super","_init","_ready","_process","_physics_process",
-    ] + list(_GODOT_RESERVED_IDENTIFIERS)
-
-    if ident in cpp_reserved:
-        ident = f"{ident}_"
-    return ident
+# Environment options; part of the bytecode cache key since they change the compiled code
+_ENV_OPTIONS: Dict[str, Any] = {"trim_blocks": True, "lstrip_blocks": True, "autoescape": False}
+
+
+class _ContentBytecodeCache(FileSystemBytecodeCache if FileSystemBytecodeCache is not None else object):  # type: ignore[misc]
+    """
+    Jinja bytecode cache whose entries are keyed by template name and source, plus a salt
+    (environment options, Jinja, Python and generator versions), rather than by file
+    path. The same template served by any loader layer maps to one entry, and an edited
+    template never reuses stale bytecode. Entries are written atomically, so concurrent
+    runs and worker processes can share the directory.
+    """
+
+    def __init__(self, directory: Path, salt: str) -> None:
+        ensure_dir(directory)
+        super().__init__(str(directory), "%s.jinja")
+        self.salt = salt
+
+    def get_bucket(self, environment: Any, name: str, filename: Optional[str], source: str) -> Any:
+        bucket = Bucket(environment, fingerprint_parts((self.salt, name, source)), self.get_source_checksum(source))
+        self.load_bytecode(bucket)
+        return bucket
+
 
 class TemplateRenderer:
     """
     A thin wrapper over a Jinja2 Environment with layered loaders and useful filters.
     - templates_dir: user-provided templates directory (highest precedence)
     - package templates: gdextension_binding_generator/templates (if installed)
+    - bytecode_cache_dir: optional directory of compiled templates, reused across runs
+      and by emitter worker processes (see _ContentBytecodeCache)
     """
 
-    def __init__(self, templates_dir: Optional[Path]) -> None:
+    def __init__(self, templates_dir: Optional[Path], bytecode_cache_dir: Optional[Path] = None) -> None:
         if (
             Environment is None
             or ChoiceLoader is None
@@ -339,12 +215,23 @@ class TemplateRenderer:
             if pkg_templates_fs.is_dir():
                 loaders.append(FileSystemLoader(str(pkg_templates_fs)))
 
+        self.templates_dir = Path(templates_dir) if templates_dir else None
+        self.bytecode_cache_dir = Path(bytecode_cache_dir) if bytecode_cache_dir else None
+        bytecode_cache = None
+        if self.bytecode_cache_dir is not None:
+            salt = "|".join([
+                repr(sorted(_ENV_OPTIONS.items())),
+                getattr(jinja2, "__version__", ""),
+                sys.version,
+                get_generator_version() or "unknown",
+            ])
+            bytecode_cache = _ContentBytecodeCache(self.bytecode_cache_dir, salt)
+
         self.env = Environment(
             loader=ChoiceLoader(loaders),
             undefined=StrictUndefined,
-            trim_blocks=True,
-            lstrip_blocks=True,
-            autoescape=False,
+            bytecode_cache=bytecode_cache,
+            **_ENV_OPTIONS,
         )
 
         self._register_filters()
@@ -367,6 +254,38 @@ class TemplateRenderer:
 
     # ---- Rendering ----
 
+    def precompile(self, template_names: Iterable[str]) -> None:
+        """
+        Load (and compile, or read from the bytecode cache) the given templates now, so
+        their bytecode is in the cache before worker processes need it.
+        """
+        for name in template_names:
+            try:
+                self.env.get_template(name)
+            except TemplateNotFound as e:
+                raise RuntimeError(f"Template not found: {name}") from e
+
+    def template_digest(self, template_names: Iterable[str] = ()) -> str:
+        """
+        Digest of the name and source of every template the layered loaders provide (as
+        resolved through the layers), so templates pulled in with include/import/extends
+        are covered too. Loaders that cannot list their templates contribute only
+        `template_names`.
+        """
+        try:
+            names = set(self.env.list_templates())
+        except TypeError:
+            names = set()
+        names.update(template_names)
+        parts: List[str] = []
+        for name in sorted(names):
+            try:
+                source, _, _ = self.env.loader.get_source(self.env, name)
+            except TemplateNotFound:
+                source = ""
+            parts.extend((name, source))
+        return fingerprint_parts(parts)
+
     def render(self, template_name: str, context: Dict[str, Any]) -> str:
         try:
             template = self.env.get_template(template_name)
@@ -441,7 +360,7 @@ def _filter_d_method_args(method_like: Any) -> List[str]:
     m = _as_method_dict(method_like)
     names = []
     dnames = m.get("d_method_args")
-    if isinstance(dnames, list) and dnames:
+    if isinstance(dnames, (list, tuple)) and dnames:
         return list(dnames)
     # Fallback: derive from parameters
     params = _as_param_list(m.get("parameters"))
@@ -490,6 +409,22 @@ def _read_text_if_exists(path: Path, encoding: str = "utf-8") -> Optional[str]:
     except FileNotFoundError:
         return None
 
+def sync_directory(path: Path) -> None:
+    """
+    fsync a directory, making renames and new entries in it durable. A no-op on
+    platforms that cannot open directories (e.g. Windows).
+    """
+    try:
+        fd = os.open(str(path), os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
 def atomic_write_text(
     path: Path,
     content: str,
@@ -498,23 +433,37 @@ def atomic_write_text(
     mode: Optional[int] = 0o644,
     log: bool = True,
     only_if_changed: bool = True,
+    index: Optional["OutputIndex"] = None,
+    fsync: bool = False,
+    dir_sync: bool = False,
 ) -> bool:
     """
     Write text atomically to the given path:
-    - Optionally avoid writing if the content is unchanged.
+    - Optionally avoid writing if the content is unchanged. With an index, a file whose
+      size and mtime match its entry is compared by digest without being read back; the
+      entry is refreshed after every check that had to read the file and every write.
     - Write to a temp file in the same directory and os.replace to final path.
     - Set POSIX file mode if provided.
+    - fsync: flush the file to disk before the replace; dir_sync: fsync the directory
+      after it.
 
     Returns True if a write occurred, False if skipped due to idempotency.
     """
     content = normalize_newlines(content)
     if make_parents:
         ensure_dir(path.parent)
+    data = content.encode(encoding)
+    digest = fingerprint_bytes(data) if index is not None else None
 
     # Skip write if unchanged
     if only_if_changed:
-        old = _read_text_if_exists(path, encoding=encoding)
-        if old is not None and normalize_newlines(old) == content:
+        unchanged = index.unchanged(path, len(data), digest) if index is not None else None
+        if unchanged is None:
+            old = _read_text_if_exists(path, encoding=encoding)
+            unchanged = old is not None and normalize_newlines(old) == content
+            if unchanged and index is not None:
+                index.record(path, digest)
+        if unchanged:
             if log:
                 logger.debug(f"[skip] {path} (unchanged)")
             return False
@@ -524,11 +473,18 @@ def atomic_write_text(
     try:
         # Create tmp file in same directory for atomic replace
         fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", dir=str(path.parent))
-        with os.fdopen(fd, "w", encoding=encoding, newline="\n") as f:
-            f.write(content)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
         if mode is not None:
             os.chmod(tmp_path, mode)
         os.replace(tmp_path, path)
+        if dir_sync:
+            sync_directory(path.parent)
+        if index is not None:
+            index.record(path, digest)
         if log:
             logger.info(f"[write] {path}")
         return True
@@ -540,6 +496,24 @@ def atomic_write_text(
             except Exception:
                 pass
 
+def atomic_write_bytes(path: Path, data: bytes, make_parents: bool = True) -> None:
+    """
+    Write bytes atomically: a temp file in the same directory is os.replace'd onto `path`.
+    """
+    if make_parents:
+        ensure_dir(path.parent)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
 def write_text(
     path: Path,
     content: str,
@@ -557,12 +531,341 @@ def write_text(
     atomic_write_text(path, content, encoding=encoding, log=log)
 
 
+# ----------------------------------------
+# Output index and writer
+# ----------------------------------------
+
+OUTPUT_INDEX_FILENAME = ".gdext-output-index.json"
+
+# Directory under the output root that receives quarantined stale files
+QUARANTINE_DIRNAME = ".gdext-stale"
+
+# Bump when the layout of the output index changes
+OUTPUT_INDEX_FORMAT_VERSION = 1
+
+# (size, mtime in ns, digest of the normalized content)
+OutputEntry = Tuple[int, int, str]
+
+
+class OutputIndex:
+    """
+    Size, mtime and content digest of the files written into an output directory, stored
+    in <root>/.gdext-output-index.json. A file whose size and mtime still match its entry
+    has the recorded content, so comparing digests replaces reading it back; any other
+    file is compared by reading it, as without an index. As in git, entries whose mtime is
+    not older than the index file itself are not trusted (their mtime is loaded as -1): the
+    file may have changed again within the same mtime tick.
+
+    The keys of the index are the files the generator owns; prune() removes or
+    quarantines the owned files a run did not produce.
+
+    Entries of files written since the last drain() are kept apart, so worker processes
+    can send them to the parent's index (see update()).
+    """
+
+    def __init__(self, root: Path, entries: Optional[Dict[str, OutputEntry]] = None) -> None:
+        self.root = Path(root)
+        self.path = self.root / OUTPUT_INDEX_FILENAME
+        self.entries: Dict[str, OutputEntry] = dict(entries or {})
+        self._updates: Dict[str, OutputEntry] = {}
+
+    @classmethod
+    def load(cls, root: Path) -> "OutputIndex":
+        """
+        Load the index of `root`; a missing, unreadable or outdated index yields an empty one.
+        """
+        index = cls(root)
+        try:
+            with open(index.path, "r", encoding="utf-8") as f:
+                saved_ns = os.fstat(f.fileno()).st_mtime_ns
+                data = json.load(f)
+            if data.get("format") != OUTPUT_INDEX_FORMAT_VERSION:
+                return index
+            index.entries = {
+                key: (int(size), int(mtime) if int(mtime) < saved_ns else -1, str(digest))
+                for key, (size, mtime, digest) in data.get("files", {}).items()
+            }
+        except FileNotFoundError:
+            pass
+        except Exception as ex:
+            logger.debug("Ignoring unreadable output index %s: %s", index.path, ex)
+        return index
+
+    def _key(self, path: Path) -> str:
+        try:
+            return Path(path).relative_to(self.root).as_posix()
+        except ValueError:
+            return str(path)
+
+    def unchanged(self, path: Path, size: int, digest: str) -> Optional[bool]:
+        """
+        Whether `path` holds content of `size` bytes with `digest`, judged from its entry
+        without reading it: None when there is no trustworthy entry.
+        """
+        entry = self.entries.get(self._key(path))
+        if entry is None:
+            return None
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return False
+        if (st.st_size, st.st_mtime_ns) != entry[:2]:
+            return None
+        return entry[0] == size and entry[2] == digest
+
+    def record(self, path: Path, digest: str) -> None:
+        """
+        Record that `path` currently holds the content with `digest`.
+        """
+        st = os.stat(path)
+        key = self._key(path)
+        self.entries[key] = self._updates[key] = (st.st_size, st.st_mtime_ns, digest)
+
+    def drain(self) -> Dict[str, OutputEntry]:
+        """
+        Return and forget the entries recorded since the previous drain().
+        """
+        updates, self._updates = self._updates, {}
+        return updates
+
+    def is_pristine(self, key: str) -> bool:
+        """
+        Whether the owned file `key` still holds the content recorded for it: its size and
+        mtime match the entry, or else its digest does.
+        """
+        size, mtime, digest = self.entries[key]
+        path = self.root / key
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return False
+        if (st.st_size, st.st_mtime_ns) == (size, mtime):
+            return True
+        return st.st_size == size and file_digest(str(path)) == digest
+
+    def forget(self, key: str) -> None:
+        self.entries.pop(key, None)
+        self._updates.pop(key, None)
+
+    def update(self, entries: Mapping[str, OutputEntry]) -> None:
+        self.entries.update(entries)
+
+    def save(self) -> None:
+        data = {"format": OUTPUT_INDEX_FORMAT_VERSION, "files": self.entries}
+        try:
+            atomic_write_bytes(self.path, json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+        except Exception as ex:
+            logger.warning("Failed to write output index %s: %s", self.path, ex)
+
+
+class SyncPolicy(Enum):
+    """
+    When written files (or their directories) are flushed to disk with fsync.
+    """
+    NONE = "none"  # never; the OS writes them back on its own schedule
+    EACH = "each"  # after every write
+    BATCH = "batch"  # once per file (or directory) when the writer is flushed
+
+
+class PruneMode(Enum):
+    """
+    What happens at the end of a run to owned files (see OutputIndex) that it did not produce.
+    """
+    KEEP = "keep"  # nothing
+    REPORT = "report"  # list them only (dry run)
+    DELETE = "delete"  # delete them, unless modified since they were generated
+    QUARANTINE = "quarantine"  # move them under <root>/.gdext-stale/
+
+
+class OutputWriter:
+    """
+    Writes generated files atomically, recording them in an optional OutputIndex, and
+    syncs them according to separate policies for files and directories. BATCH defers
+    the syncs to flush(), so a large run does not wait on the disk for every file and each
+    directory is synced once. flush() also saves the index.
+
+    Every file written, or found unchanged, counts as produced by the run, as do files
+    passed to keep(). With an index, close() applies the prune mode to the owned files
+    the run did not produce, then flushes. Files the index does not list, i.e. files the
+    generator never wrote, are never touched.
+
+    Worker processes use their own writer (with a copy of the index) and hand what they
+    wrote to the parent's writer with drain() and merge().
+    """
+
+    def __init__(
+        self,
+        index: Optional[OutputIndex] = None,
+        fsync: SyncPolicy = SyncPolicy.NONE,
+        dir_sync: SyncPolicy = SyncPolicy.NONE,
+        prune: PruneMode = PruneMode.KEEP,
+    ) -> None:
+        self.index = index
+        self.fsync = fsync
+        self.dir_sync = dir_sync
+        self.prune = prune
+        self._pending_files: List[Path] = []
+        self._pending_dirs: Dict[Path, None] = {}
+        self._produced: Set[str] = set()
+
+    def write_text(self, path: Path, content: str, dry_run: bool = False, log: bool = True) -> bool:
+        """
+        Like write_text(); returns True if the file was written.
+        """
+        if dry_run:
+            if log:
+                logger.info(f"[dry-run] write {path}")
+            return False
+        written = atomic_write_text(
+            path,
+            content,
+            log=log,
+            index=self.index,
+            fsync=self.fsync is SyncPolicy.EACH,
+            dir_sync=self.dir_sync is SyncPolicy.EACH,
+        )
+        self.keep((path,))
+        if written:
+            if self.fsync is SyncPolicy.BATCH:
+                self._pending_files.append(Path(path))
+            if self.dir_sync is SyncPolicy.BATCH:
+                self._pending_dirs[Path(path).parent] = None
+        return written
+
+    def keep(self, paths: Iterable[Path]) -> None:
+        """
+        Count `paths` as produced by this run, e.g. files left in place by incremental
+        emission.
+        """
+        if self.index is not None:
+            self._produced.update(self.index._key(p) for p in paths)
+
+    def drain(self) -> Tuple[Dict[str, OutputEntry], List[Path], List[Path], List[str]]:
+        """
+        Return and forget the index entries, pending syncs and produced files since the
+        previous drain().
+        """
+        files, self._pending_files = self._pending_files, []
+        dirs, self._pending_dirs = list(self._pending_dirs), {}
+        produced, self._produced = sorted(self._produced), set()
+        return (self.index.drain() if self.index is not None else {}), files, dirs, produced
+
+    def merge(
+        self,
+        entries: Mapping[str, OutputEntry],
+        files: Iterable[Path],
+        dirs: Iterable[Path],
+        produced: Iterable[str] = (),
+    ) -> None:
+        """
+        Take over what another writer drained.
+        """
+        if self.index is not None:
+            self.index.update(entries)
+        self._pending_files.extend(files)
+        self._pending_dirs.update(dict.fromkeys(dirs))
+        self._produced.update(produced)
+
+    def stale_files(self) -> List[Path]:
+        """
+        Owned files (inside the index root) that this run has not produced so far. Keys
+        that are absolute or climb out of the root with '..' are never returned, whatever
+        the index file says.
+        """
+        if self.index is None:
+            return []
+        return [
+            self.index.root / key
+            for key in sorted(self.index.entries)
+            if key not in self._produced and not Path(key).is_absolute() and ".." not in Path(key).parts
+        ]
+
+    def close(self) -> None:
+        """
+        End of a run: apply the prune mode to the stale files, then flush().
+        """
+        if self.prune is not PruneMode.KEEP:
+            self._prune()
+        self.flush()
+
+    def _prune(self) -> None:
+        index = self.index
+        stale = self.stale_files()
+        if index is None or not stale:
+            return
+        if self.prune is PruneMode.REPORT:
+            for path in stale:
+                logger.info(f"[stale] {path}")
+            logger.info("%d stale generated file(s) left in place", len(stale))
+            return
+        removed = 0
+        for path in stale:
+            key = index._key(path)
+            if not path.exists():
+                index.forget(key)
+                continue
+            try:
+                if self.prune is PruneMode.QUARANTINE:
+                    target = index.root / QUARANTINE_DIRNAME / key
+                    ensure_dir(target.parent)
+                    os.replace(path, target)
+                    logger.info(f"[quarantine] {path} -> {target}")
+                elif index.is_pristine(key):
+                    os.remove(path)
+                    logger.info(f"[delete] {path}")
+                else:
+                    # Edited by hand: no longer the generator's to delete
+                    logger.warning("Keeping stale output %s: modified since it was generated", path)
+                    index.forget(key)
+                    continue
+            except OSError as ex:
+                logger.warning("Failed to prune stale output %s: %s", path, ex)
+                continue
+            index.forget(key)
+            removed += 1
+            if self.dir_sync is not SyncPolicy.NONE:
+                self._pending_dirs[path.parent] = None
+        if removed:
+            logger.info("Pruned %d stale generated file(s) (%s)", removed, self.prune.value)
+
+    def flush(self) -> None:
+        """
+        Perform the batched syncs and save the index.
+        """
+        files, dirs = self._pending_files, list(self._pending_dirs)
+        self._pending_files, self._pending_dirs = [], {}
+        for path in files:
+            try:
+                fd = os.open(str(path), os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        for d in dirs:
+            sync_directory(d)
+        if files or dirs:
+            logger.debug("Synced %d file(s) and %d directory(ies)", len(files), len(dirs))
+        if self.index is not None:
+            self.index.save()
+
+
 __all__ = [
+    "OUTPUT_INDEX_FILENAME",
+    "OutputIndex",
+    "OutputWriter",
+    "PruneMode",
+    "QUARANTINE_DIRNAME",
+    "SyncPolicy",
     "TemplateRenderer",
     "configure_logging",
+    "get_generator_version",
     "ensure_dir",
     "normalize_newlines",
     "atomic_write_text",
+    "atomic_write_bytes",
+    "sync_directory",
     "write_text",
     # Export sanitizers for direct imports
     "sanitize_identifier",
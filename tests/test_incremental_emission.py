@@ -0,0 +1,61 @@
+"""
+Incremental emission must produce the same files as a clean run.
+"""
+
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from gdextension_binding_generator.emitters.godot_variant_emitter import GodotVariantEmitter
+from gdextension_binding_generator.models import ClassInfo, CppType, GenerationContext, MethodInfo
+from gdextension_binding_generator.type_mapping import MappingConfig, TypeMapper
+from gdextension_binding_generator.utils import OutputIndex, OutputWriter, TemplateRenderer
+
+PREFIX = "OCC_"
+
+
+def _iterator(outer: str, value_type: str) -> ClassInfo:
+    # Nested classes keep their plain name, so E1::Iterator and E2::Iterator both wrap as OCC_Iterator
+    return ClassInfo(
+        name="Iterator",
+        header="E.hxx",
+        cursor_usr=f"c:@S@{outer}@S@Iterator",
+        wrapper_prefix=PREFIX,
+        methods=[MethodInfo(name="Value", return_type=CppType.from_spelling(value_type), is_const=True)],
+    )
+
+
+def _corpus(first_value_type: str) -> List[ClassInfo]:
+    return [
+        ClassInfo(name="E1", header="E.hxx", cursor_usr="c:@S@E1", wrapper_prefix=PREFIX),
+        _iterator("E1", first_value_type),
+        ClassInfo(name="E2", header="E.hxx", cursor_usr="c:@S@E2", wrapper_prefix=PREFIX),
+        _iterator("E2", "double"),
+    ]
+
+
+def _emit(out: Path, classes: List[ClassInfo], incremental: bool, jobs: int = 1) -> None:
+    ctx = GenerationContext(output_dir=out, classes_dir=out / "classes", templates_dir=None, godot_includes=[], prefix=PREFIX)
+    mapper = TypeMapper.from_classes(classes, config=MappingConfig(prefix=PREFIX))
+    writer = OutputWriter(OutputIndex.load(out))
+    GodotVariantEmitter(ctx, TemplateRenderer(None), mapper=mapper, jobs=jobs, incremental=incremental, writer=writer).emit(classes)
+
+
+def _sources(out: Path) -> Dict[str, bytes]:
+    return {p.name: p.read_bytes() for p in sorted((out / "classes").iterdir())}
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+@pytest.mark.parametrize("first_value_type", ["int", "long"])
+def test_incremental_rerun_matches_clean_run_with_shared_wrapper_names(tmp_path: Path, jobs: int, first_value_type: str) -> None:
+    incremental = tmp_path / "incremental"
+    _emit(incremental, _corpus("int"), incremental=True, jobs=jobs)
+    _emit(incremental, _corpus(first_value_type), incremental=True, jobs=jobs)
+
+    clean = tmp_path / "clean"
+    _emit(clean, _corpus(first_value_type), incremental=False, jobs=jobs)
+
+    assert _sources(incremental) == _sources(clean)
+    # The last class of a shared wrapper name wins, as in a serial run
+    assert b"double value() const" in _sources(clean)["OCC_Iterator.h"]
@@ -0,0 +1,102 @@
+"""
+The binary IR format must round-trip the parsed model and reject damaged files.
+"""
+
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from gdextension_binding_generator.ir import IR_COMPRESSIONS, IRError, decode_ir, encode_ir, read_ir, write_ir
+from gdextension_binding_generator.models import BaseClassRef, ClassInfo, CppType, MethodInfo, MethodKind, ParameterInfo
+
+
+def _classes() -> List[ClassInfo]:
+    shape = CppType(spelling="const TopoDS_Shape &", is_const=True, is_reference=True)
+    return [
+        ClassInfo(
+            name="Builder",
+            namespaces=["BRep", "Détail"],
+            header="/inc/BRep_Builder.hxx",
+            cursor_usr="c:@N@BRep@S@Builder",
+            wrapper_prefix="OCC_",
+            bases=[BaseClassRef(qualified_name="TopoDS_Builder", is_virtual=True, access="public")],
+            methods=[
+                MethodInfo(name="Builder", return_type=CppType.from_spelling("void"), kind=MethodKind.CONSTRUCTOR, is_explicit=True),
+                MethodInfo(
+                    name="Add",
+                    return_type=CppType(spelling="char *", is_pointer=True),
+                    parameters=[
+                        ParameterInfo(name="shape", cpp_type=shape),
+                        ParameterInfo(name="tolerance", cpp_type=CppType.from_spelling("double"), default_value="1.0e-7"),
+                        ParameterInfo(name="", cpp_type=CppType.from_spelling("..."), is_variadic=True),
+                    ],
+                    is_const=True,
+                    is_virtual=True,
+                    is_pure_virtual=True,
+                    is_noexcept=True,
+                    qualified_name="BRep::Builder::Add",
+                    usr="c:@N@BRep@S@Builder@F@Add#",
+                    overload_index=1,
+                    _explicit_exposed_name="add_shape",
+                ),
+                MethodInfo(name="Make", return_type=shape, parameters=[ParameterInfo(name="shape", cpp_type=shape)], kind=MethodKind.STATIC, overload_index=0),
+            ],
+        ),
+        ClassInfo(name="Empty", header="/inc/Empty.hxx"),
+    ]
+
+
+@pytest.mark.parametrize("compression", IR_COMPRESSIONS)
+def test_round_trip(compression: str) -> None:
+    classes, meta = decode_ir(encode_ir(_classes(), {"prefix": "OCC_", "shard": [1, 2]}, compression))
+
+    assert [c.to_dict() for c in classes] == [c.to_dict() for c in _classes()]
+    assert meta["prefix"] == "OCC_" and meta["shard"] == [1, 2]
+
+
+def test_round_trip_keeps_nested_pointee_types() -> None:
+    char = CppType.interned("const char", is_const=True, kind="CHAR_S")
+    char_p = CppType.interned("const char *", is_const=True, is_pointer=True, kind="POINTER", pointee=char)
+    char_pp_ref = CppType.interned(
+        "const char **&",
+        is_const=True,
+        is_pointer=True,
+        is_reference=True,
+        kind="LVALUEREFERENCE",
+        pointee=CppType.interned("const char **", is_const=True, is_pointer=True, kind="POINTER", pointee=char_p),
+    )
+    holder = ClassInfo(name="Names", methods=[MethodInfo(name="Get", return_type=char_p, parameters=[ParameterInfo(name="out", cpp_type=char_pp_ref)])])
+
+    (decoded,), _ = decode_ir(encode_ir([holder]))
+
+    param = decoded.methods[0].parameters[0].cpp_type
+    assert param is char_pp_ref  # types rejoin the intern table
+    assert param.pointer_depth == 2 and param.base_type is char
+    assert decoded.methods[0].return_type.pointee is char
+
+
+def test_round_trip_through_file(tmp_path: Path) -> None:
+    write_ir(tmp_path / "run.ir", _classes())
+    classes, _ = read_ir(tmp_path / "run.ir")
+    assert [c.to_dict() for c in classes] == [c.to_dict() for c in _classes()]
+
+
+@pytest.mark.parametrize("compression", IR_COMPRESSIONS)
+def test_truncated_input_raises_ir_error(compression: str) -> None:
+    data = encode_ir(_classes(), compression=compression)
+    for size in range(len(data)):
+        with pytest.raises(IRError):
+            decode_ir(data[:size])
+
+
+def test_foreign_and_future_files_are_rejected(tmp_path: Path) -> None:
+    data = encode_ir(_classes())
+    with pytest.raises(IRError, match="not a binding generator IR file"):
+        decode_ir(b"{}" + data)
+    with pytest.raises(IRError, match="IR version"):
+        decode_ir(data[:5] + bytes((data[5] + 1,)) + data[6:])
+    with pytest.raises(IRError, match="trailing"):
+        decode_ir(encode_ir(_classes(), compression="none") + b"\0")
+    with pytest.raises(IRError, match="Cannot read"):
+        read_ir(tmp_path / "missing.ir")
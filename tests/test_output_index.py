@@ -0,0 +1,71 @@
+"""
+OutputIndex: files whose size and mtime match their entry are compared by digest, except
+entries taken within the mtime tick of the index file itself.
+"""
+
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from gdextension_binding_generator import utils
+from gdextension_binding_generator.fingerprint import fingerprint_bytes
+from gdextension_binding_generator.utils import OutputIndex, OutputWriter
+
+CONTENT = "int a;\n"
+SECOND = 1_000_000_000
+
+
+def _set_mtime(path: Path, mtime_ns: int) -> None:
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def _write_indexed(root: Path) -> Path:
+    out = root / "a.h"
+    writer = OutputWriter(OutputIndex(root))
+    assert writer.write_text(out, CONTENT)
+    writer.flush()
+    return out
+
+
+def _no_read(*args: Any, **kwargs: Any) -> None:
+    raise AssertionError("file was read back")
+
+
+def test_trusted_entry_replaces_reading_the_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    out = _write_indexed(tmp_path)
+    _set_mtime(tmp_path / utils.OUTPUT_INDEX_FILENAME, out.stat().st_mtime_ns + SECOND)
+    index = OutputIndex.load(tmp_path)
+
+    assert index.unchanged(out, len(CONTENT), fingerprint_bytes(CONTENT.encode())) is True
+    assert index.unchanged(out, len(CONTENT), fingerprint_bytes(b"int b;\n")) is False
+    monkeypatch.setattr(utils, "_read_text_if_exists", _no_read)
+    assert not OutputWriter(index).write_text(out, CONTENT)
+
+
+def test_changed_or_missing_files_are_not_judged_from_the_entry(tmp_path: Path) -> None:
+    out = _write_indexed(tmp_path)
+    _set_mtime(tmp_path / utils.OUTPUT_INDEX_FILENAME, out.stat().st_mtime_ns + SECOND)
+    index = OutputIndex.load(tmp_path)
+    digest = fingerprint_bytes(CONTENT.encode())
+
+    _set_mtime(out, out.stat().st_mtime_ns - SECOND)
+    assert index.unchanged(out, len(CONTENT), digest) is None
+    out.unlink()
+    assert index.unchanged(out, len(CONTENT), digest) is False
+
+
+def test_racy_entry_is_not_trusted(tmp_path: Path) -> None:
+    out = _write_indexed(tmp_path)
+    tick = out.stat().st_mtime_ns
+    # The index was saved within the mtime tick of the file: a same-size edit in that
+    # tick would leave size and mtime unchanged
+    _set_mtime(tmp_path / utils.OUTPUT_INDEX_FILENAME, tick)
+    out.write_text("int b;\n", encoding="utf-8")
+    _set_mtime(out, tick)
+
+    index = OutputIndex.load(tmp_path)
+    assert index.unchanged(out, len(CONTENT), fingerprint_bytes(CONTENT.encode())) is None
+    assert OutputWriter(index).write_text(out, CONTENT)
+    assert out.read_text(encoding="utf-8") == CONTENT
@@ -0,0 +1,88 @@
+"""
+The parse cache must miss whenever any file of a unit's include closure changes, and
+classes skipped by a cached unit must still be extracted when no other unit provides them.
+"""
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List, Sequence, Tuple
+
+import pytest
+
+from gdextension_binding_generator.models import ClassInfo
+from gdextension_binding_generator.parsing import clang_parser
+from gdextension_binding_generator.parsing.clang_parser import ParseStats, _ClassRegistry, _collect_classes, _tu_dependencies
+from gdextension_binding_generator.parsing.parse_cache import ParseCache, ParseResult
+
+CONTEXT = {"clang_args": ["-std=c++17"], "prefix": "OCC_"}
+
+
+def _write(path: Path, text: str) -> Path:
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def _tree(tmp_path: Path) -> List[Path]:
+    # a.hxx includes b.hxx, which includes c.hxx; only a.hxx is parsed
+    c = _write(tmp_path / "c.hxx", "struct C {};\n")
+    b = _write(tmp_path / "b.hxx", '#include "c.hxx"\n')
+    a = _write(tmp_path / "a.hxx", '#include "b.hxx"\nclass A {};\n')
+    return [a, b, c]
+
+
+def _fake_tu(*included: Path) -> SimpleNamespace:
+    return SimpleNamespace(get_includes=lambda: [SimpleNamespace(include=SimpleNamespace(name=str(p))) for p in included])
+
+
+def test_tu_dependencies_lists_the_include_closure(tmp_path: Path) -> None:
+    _, b, c = _tree(tmp_path)
+    assert _tu_dependencies(_fake_tu(b, c)) == [str(b.resolve()), str(c.resolve())]
+
+
+def test_transitively_included_header_change_invalidates_entry(tmp_path: Path) -> None:
+    a, b, c = _tree(tmp_path)
+    other = _write(tmp_path / "other.hxx", "class Other {};\n")
+    cache_dir = tmp_path / "cache"
+
+    cache = ParseCache(cache_dir, CONTEXT)
+    cache.store((a,), _tu_dependencies(_fake_tu(b, c)), ([ClassInfo(name="A", header=str(a))], [], []))
+    cache.store((other,), [], ([ClassInfo(name="Other", header=str(other))], [], []))
+
+    hit = ParseCache(cache_dir, CONTEXT).load((a,))
+    assert hit is not None and [ci.name for ci in hit[0]] == ["A"]
+
+    _write(c, "struct C { int x; };\n")
+    # Digests are memoized per instance, so a new run sees the change
+    rerun = ParseCache(cache_dir, CONTEXT)
+    assert rerun.load((a,)) is None
+    assert rerun.load((other,)) is not None
+
+
+def test_context_change_misses(tmp_path: Path) -> None:
+    a = _tree(tmp_path)[0]
+    ParseCache(tmp_path / "cache", CONTEXT).store((a,), [], ([ClassInfo(name="A", header=str(a))], [], []))
+    assert ParseCache(tmp_path / "cache", {**CONTEXT, "prefix": "X_"}).load((a,)) is None
+
+
+def test_cached_unit_with_orphaned_skipped_class_is_reparsed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    a = _write(tmp_path / "a.hxx", '#include "shared.hxx"\n')
+    b = _write(tmp_path / "b.hxx", "class B {};\n")
+    cache = ParseCache(tmp_path / "cache", CONTEXT)
+    # a.hxx skipped Shared when the previous run parsed it, because b.hxx claimed it first;
+    # b.hxx has since stopped including shared.hxx
+    cache.store((a,), [], ([], [], ["c:@S@Shared"]))
+    cache.store((b,), [], ([ClassInfo(name="B", header=str(b), cursor_usr="c:@S@B")], [], []))
+
+    calls: List[Tuple[Path, ...]] = []
+
+    def fake_parse(batch: Sequence[Path], registry: _ClassRegistry, **kwargs: Any) -> ParseResult:
+        calls.append(tuple(batch))
+        assert registry.claim("c:@S@Shared")
+        return [ClassInfo(name="Shared", header=str(tmp_path / "shared.hxx"), cursor_usr="c:@S@Shared")], [], []
+
+    monkeypatch.setattr(clang_parser, "_parse_batch_classes", fake_parse)
+    worker_kwargs: Dict[str, Any] = dict(include_filters=None, exclude_class_regex=None, prefix="", emit_diagnostics=False)
+    classes = _collect_classes([a, b], [], worker_kwargs, 1, "thread", 1, 2048, lambda: None, cache, ParseStats(), None)
+
+    assert calls == [(a,)]
+    assert sorted(ci.name for ci in classes) == ["B", "Shared"]
@@ -0,0 +1,83 @@
+"""
+Pruning: stale generated files are handled according to the PruneMode, and files the
+output index does not own are never touched.
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from gdextension_binding_generator.fingerprint import fingerprint_bytes
+from gdextension_binding_generator.utils import QUARANTINE_DIRNAME, OutputIndex, OutputWriter, PruneMode
+
+FIRST_RUN = {"a.h": "int a;\n", "b.h": "int b;\n", "sub/c.h": "int c;\n"}
+
+
+def _run(root: Path, files: Dict[str, str], prune: PruneMode = PruneMode.KEEP) -> None:
+    writer = OutputWriter(OutputIndex.load(root), prune=prune)
+    for name, text in files.items():
+        writer.write_text(root / name, text)
+    writer.close()
+
+
+def _tree(root: Path) -> Dict[str, str]:
+    return {p.relative_to(root).as_posix(): p.read_text(encoding="utf-8") for p in sorted(root.rglob("*")) if p.is_file() and p.suffix != ".json"}
+
+
+@pytest.fixture
+def out(tmp_path: Path) -> Path:
+    root = tmp_path / "out"
+    _run(root, FIRST_RUN)
+    (root / "notes.txt").write_text("kept by hand\n", encoding="utf-8")
+    return root
+
+
+@pytest.mark.parametrize("mode", [PruneMode.KEEP, PruneMode.REPORT])
+def test_keep_and_report_leave_stale_files(out: Path, mode: PruneMode, caplog: pytest.LogCaptureFixture) -> None:
+    with caplog.at_level(logging.INFO):
+        _run(out, {"a.h": "int a;\n"}, mode)
+
+    assert _tree(out) == {**FIRST_RUN, "notes.txt": "kept by hand\n"}
+    assert ("[stale]" in caplog.text) == (mode is PruneMode.REPORT)
+    assert "b.h" in OutputIndex.load(out).entries
+
+
+def test_delete_removes_only_pristine_owned_files(out: Path) -> None:
+    (out / "sub" / "c.h").write_text("int c; // edited\n", encoding="utf-8")
+
+    _run(out, {"a.h": "int a;\n"}, PruneMode.DELETE)
+
+    assert _tree(out) == {"a.h": "int a;\n", "sub/c.h": "int c; // edited\n", "notes.txt": "kept by hand\n"}
+    # The edited file is no longer owned, so later runs leave it alone too
+    assert sorted(OutputIndex.load(out).entries) == ["a.h"]
+
+
+def test_quarantine_moves_stale_files(out: Path) -> None:
+    _run(out, {"a.h": "int a;\n"}, PruneMode.QUARANTINE)
+
+    assert _tree(out) == {
+        "a.h": "int a;\n",
+        "notes.txt": "kept by hand\n",
+        f"{QUARANTINE_DIRNAME}/b.h": "int b;\n",
+        f"{QUARANTINE_DIRNAME}/sub/c.h": "int c;\n",
+    }
+
+
+@pytest.mark.parametrize("mode", [PruneMode.DELETE, PruneMode.QUARANTINE])
+def test_keys_outside_the_root_are_never_pruned(out: Path, mode: PruneMode) -> None:
+    victim = out.parent / "victim.txt"
+    victim.write_text("not generated\n", encoding="utf-8")
+    index = OutputIndex.load(out)
+    st = victim.stat()
+    entry = (st.st_size, st.st_mtime_ns, fingerprint_bytes(victim.read_bytes()))
+    # A tampered index claiming files outside the output directory
+    index.entries.update({"../victim.txt": entry, "sub/../../victim.txt": entry, str(victim): entry})
+    index.save()
+
+    _run(out, dict(FIRST_RUN), mode)
+
+    assert victim.read_text(encoding="utf-8") == "not generated\n"
+    assert not (out / QUARANTINE_DIRNAME).exists()
+    assert _tree(out) == {**FIRST_RUN, "notes.txt": "kept by hand\n"}
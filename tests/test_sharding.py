@@ -0,0 +1,103 @@
+"""
+Sharded runs: header partitioning, shard set validation and the merge subcommand.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from gdextension_binding_generator.generate_bindings import _check_shards, merge_main, parse_shard_spec, select_shard
+from gdextension_binding_generator.ir import write_ir
+from gdextension_binding_generator.models import ClassInfo, CppType, MethodInfo, ParameterInfo
+
+PREFIX = "OCC_"
+
+
+def _headers(root: Path, count: int = 40) -> List[Path]:
+    return [root / "inc" / f"pkg{i % 3}" / f"Header_{i}.hxx" for i in range(count)]
+
+
+def _meta(index: int, count: int, total: int = 40) -> Dict[str, Any]:
+    return {"prefix": PREFIX, "shard": [index, count], "headers": 0, "total_headers": total}
+
+
+def test_parse_shard_spec() -> None:
+    assert parse_shard_spec("2/4") == (2, 4)
+    for bad in ("0/4", "5/4", "1/0", "x/4", "4"):
+        with pytest.raises(ValueError):
+            parse_shard_spec(bad)
+
+
+def test_select_shard_partitions_headers(tmp_path: Path) -> None:
+    headers = _headers(tmp_path)
+    shards = [select_shard(headers, i, 4) for i in range(1, 5)]
+
+    assert sorted(h for shard in shards for h in shard) == sorted(headers)
+    assert sum(len(shard) for shard in shards) == len(headers)
+    for shard in shards:
+        assert shard == [h for h in headers if h in shard]  # header order is kept
+
+
+def test_select_shard_does_not_depend_on_checkout_location(tmp_path: Path) -> None:
+    here = [h.relative_to(tmp_path / "a") for h in select_shard(_headers(tmp_path / "a"), 2, 3)]
+    there = [h.relative_to(tmp_path / "b" / "c") for h in select_shard(_headers(tmp_path / "b" / "c"), 2, 3)]
+    assert here == there
+
+
+def test_check_shards_accepts_complete_set() -> None:
+    assert _check_shards(["s1", "s2", "s3"], [_meta(3, 3), _meta(1, 3), _meta(2, 3)]) is None
+    # Unsharded IR files are not checked
+    assert _check_shards(["full"], [{"prefix": PREFIX, "shard": None}]) is None
+
+
+@pytest.mark.parametrize(
+    "metas, message",
+    [
+        ([_meta(1, 3), _meta(3, 3)], "Missing shard(s) 2/3"),
+        ([_meta(1, 2), _meta(1, 2), _meta(2, 2)], "Shard 1/2 given twice"),
+        ([_meta(1, 2), _meta(2, 3)], "different shard counts"),
+        ([_meta(1, 2), _meta(2, 2, total=41)], "different header sets"),
+    ],
+)
+def test_check_shards_rejects_inconsistent_sets(metas: List[Dict[str, Any]], message: str) -> None:
+    error: Optional[str] = _check_shards([f"s{i}" for i in range(len(metas))], metas)
+    assert error is not None and message in error
+
+
+def _method(name: str, param_type: str) -> MethodInfo:
+    return MethodInfo(
+        name=name,
+        return_type=CppType.from_spelling("void"),
+        parameters=[ParameterInfo(name="value", cpp_type=CppType.from_spelling(param_type))],
+        usr=f"c:@S@Shape@F@{name}#{param_type}#",
+    )
+
+
+def _shape(*methods: MethodInfo) -> ClassInfo:
+    return ClassInfo(name="Shape", header="Shape.hxx", cursor_usr="c:@S@Shape", wrapper_prefix=PREFIX, methods=list(methods))
+
+
+def test_merge_combines_shards(tmp_path: Path) -> None:
+    # Both shards saw Shape (through an include); each contributed one overload
+    write_ir(tmp_path / "shard-1.ir", [_shape(_method("SetValue", "int"))], _meta(1, 2))
+    write_ir(
+        tmp_path / "shard-2.ir",
+        [_shape(_method("SetValue", "int"), _method("SetValue", "double")), ClassInfo(name="Box", header="Box.hxx", cursor_usr="c:@S@Box", wrapper_prefix=PREFIX)],
+        _meta(2, 2),
+    )
+    out = tmp_path / "out"
+
+    assert merge_main([str(tmp_path / "shard-1.ir"), str(tmp_path / "shard-2.ir"), "--output-dir", str(out), "--no-manifest"]) == 0
+
+    assert sorted(p.name for p in (out / "classes").iterdir()) == ["OCC_Box.cpp", "OCC_Box.h", "OCC_Shape.cpp", "OCC_Shape.h"]
+    shape = (out / "classes" / "OCC_Shape.h").read_text(encoding="utf-8")
+    assert "set_value(" in shape and "set_value_1(" in shape and "set_value_2(" not in shape
+
+
+def test_merge_refuses_incomplete_shard_set(tmp_path: Path) -> None:
+    write_ir(tmp_path / "shard-1.ir", [_shape(_method("SetValue", "int"))], _meta(1, 2))
+    out = tmp_path / "out"
+
+    assert merge_main([str(tmp_path / "shard-1.ir"), "--output-dir", str(out)]) == 2
+    assert not out.exists()
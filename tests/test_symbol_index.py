@@ -0,0 +1,103 @@
+"""
+SymbolIndex: incremental updates per header, shared type rows and lazy class access.
+"""
+
+from pathlib import Path
+from typing import List, Set
+
+from gdextension_binding_generator.models import BaseClassRef, ClassInfo, CppType, MethodInfo, ParameterInfo
+from gdextension_binding_generator.symbol_index import SymbolIndex
+
+
+def _method(name: str, return_type: str, *param_types: str) -> MethodInfo:
+    return MethodInfo(
+        name=name,
+        return_type=CppType.from_spelling(return_type),
+        parameters=[ParameterInfo(name=f"p{i}", cpp_type=CppType.from_spelling(t)) for i, t in enumerate(param_types)],
+    )
+
+
+def _class(name: str, header: Path, *methods: MethodInfo, base: str = "") -> ClassInfo:
+    return ClassInfo(
+        name=name,
+        header=str(header),
+        cursor_usr=f"c:@S@{name}",
+        wrapper_prefix="OCC_",
+        bases=[BaseClassRef(qualified_name=base)] if base else [],
+        methods=list(methods),
+    )
+
+
+def _type_spellings(index: SymbolIndex) -> Set[str]:
+    return {s for (s,) in index._conn.execute("SELECT spelling FROM types")}
+
+
+def _names(index: SymbolIndex) -> List[str]:
+    return [ci.name for ci in index.classes()]
+
+
+def test_replace_headers_only_touches_the_parsed_headers(tmp_path: Path) -> None:
+    a, b = tmp_path / "A.hxx", tmp_path / "B.hxx"
+    with SymbolIndex(tmp_path / "symbols.db") as index:
+        index.replace_headers([a, b], [
+            _class("Shape", a, _method("Volume", "double")),
+            _class("Edge", a, _method("Length", "double"), base="Shape"),
+            _class("Box", b, _method("Size", "int", "const Shape &"), base="Shape"),
+        ])
+        assert _names(index) == ["Box", "Edge", "Shape"]
+
+        # A.hxx no longer defines Edge, and Shape gained a method
+        assert index.replace_headers([a], [_class("Shape", a, _method("Volume", "double"), _method("Area", "float"))]) == 1
+
+        assert _names(index) == ["Box", "Shape"]
+        assert [m.name for m in index.get("c:@S@Shape").methods] == ["Volume", "Area"]
+        assert [m.name for m in index.get("Box").methods] == ["Size"]
+        assert index.subclasses_of("Shape") == ["Box"]
+        assert index.methods_returning("float") == [("Shape", "Area")]
+        assert index.headers() == sorted([str(a.resolve()), str(b.resolve())])
+
+
+def test_unreferenced_types_are_collected(tmp_path: Path) -> None:
+    a, b = tmp_path / "A.hxx", tmp_path / "B.hxx"
+    with SymbolIndex(tmp_path / "symbols.db") as index:
+        index.replace_headers([a, b], [
+            _class("Curve", a, _method("Eval", "gp_Pnt", "double"), _method("Period", "double")),
+            _class("Box", b, _method("Size", "int", "double")),
+        ])
+        assert _type_spellings(index) == {"gp_Pnt", "double", "int"}
+
+        index.replace_headers([a], [_class("Curve", a, _method("Period", "double"))])
+        # gp_Pnt was only used by Curve::Eval; double is still used by both classes
+        assert _type_spellings(index) == {"double", "int"}
+
+        index.replace_headers([b], [])
+        assert _type_spellings(index) == {"double"}
+
+
+def test_index_persists_across_runs(tmp_path: Path) -> None:
+    a = tmp_path / "A.hxx"
+    with SymbolIndex(tmp_path / "symbols.db") as index:
+        index.replace_headers([a], [_class("Shape", a, _method("Volume", "double"))])
+        index.set_meta("prefix", "OCC_")
+
+    with SymbolIndex(tmp_path / "symbols.db") as index:
+        rows = index.classes()
+        assert len(rows) == 1 and index.get_meta("prefix") == "OCC_"
+        assert rows.known_wrappers() == {"Shape": "OCC_Shape"}
+        assert rows[0].methods[0].return_type == CppType.from_spelling("double")
+
+
+def test_pointee_rows_are_collected_with_their_pointers(tmp_path: Path) -> None:
+    a = tmp_path / "A.hxx"
+    pnt = CppType.interned("gp_Pnt", kind="RECORD", decl_usr="c:@S@gp_Pnt")
+    const_pnt = CppType.interned("const gp_Pnt", is_const=True, kind="RECORD", decl_usr="c:@S@gp_Pnt")
+    pnt_ref = CppType.interned("const gp_Pnt &", is_const=True, is_reference=True, kind="LVALUEREFERENCE", pointee=const_pnt)
+    pnt_ptr = CppType.interned("gp_Pnt *", is_pointer=True, kind="POINTER", pointee=pnt)
+    method = MethodInfo(name="Move", return_type=pnt_ptr, parameters=[ParameterInfo(name="to", cpp_type=pnt_ref)])
+    with SymbolIndex(tmp_path / "symbols.db") as index:
+        index.replace_headers([a], [_class("Curve", a, method)])
+        assert _type_spellings(index) == {"gp_Pnt", "gp_Pnt *", "const gp_Pnt", "const gp_Pnt &"}
+        assert index.get("Curve").methods[0].parameters[0].cpp_type is pnt_ref
+
+        index.replace_headers([a], [_class("Curve", a, _method("Period", "double"))])
+        assert _type_spellings(index) == {"double"}
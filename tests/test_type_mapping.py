@@ -0,0 +1,98 @@
+"""
+TypeMapper caches must never outlive the config and known wrapped classes they came from,
+and pointer decisions on parsed types follow their clang pointee chain.
+"""
+
+import dataclasses
+import pickle
+from typing import Union
+
+import pytest
+
+from gdextension_binding_generator.models import ClassInfo, CppType, MethodInfo, ParameterInfo
+from gdextension_binding_generator.type_mapping import MappedKind, MappingConfig, MappingRule, PointeeKind, TypeMapper, pointer_target
+
+RULE = MappingRule(match="TCollection_AsciiString", exposed_spelling="godot::String", kind=MappedKind.STRING, pre_call_lines=["// convert"])
+
+
+def _method(param_type: Union[str, CppType]) -> MethodInfo:
+    if isinstance(param_type, str):
+        param_type = CppType.from_spelling(param_type)
+    return MethodInfo(name="Set", return_type=CppType.from_spelling("void"), parameters=[ParameterInfo(name="value", cpp_type=param_type)])
+
+
+def _pointer(spelling: str, pointee: CppType, is_const: bool = False) -> CppType:
+    # A structured pointer type the way the parser builds it from the canonical clang type
+    return CppType.interned(spelling, is_const=is_const or pointee.is_const, is_pointer=True, kind="POINTER", pointee=pointee)
+
+
+CHAR = CppType.interned("char", kind="CHAR_S")
+CONST_CHAR = CppType.interned("const char", is_const=True, kind="CHAR_S")
+GP_PNT = CppType.interned("gp_Pnt", kind="RECORD", decl_usr="c:@S@gp_Pnt")
+
+
+def test_replacing_config_drops_cached_mappings() -> None:
+    holder = ClassInfo(name="Holder")
+    mapper = TypeMapper({}, config=MappingConfig(prefix="OCC_"))
+    assert not mapper.map_method(holder, _method("const TCollection_AsciiString &")).supported
+
+    mapper.config = mapper.config.with_rule(RULE)
+
+    mapped = mapper.map_method(holder, _method("const TCollection_AsciiString &"))
+    assert mapped.supported and mapped.exposed_params[0].mapping.exposed_spelling == "godot::String"
+
+
+def test_replacing_known_wrapped_drops_cached_mappings() -> None:
+    holder = ClassInfo(name="Holder")
+    mapper = TypeMapper({}, config=MappingConfig(prefix="OCC_"))
+    assert not mapper.map_method(holder, _method("gp_Pnt *")).supported
+
+    mapper.known_wrapped = {"gp_Pnt": "OCC_gp_Pnt"}
+
+    assert mapper.map_method(holder, _method("gp_Pnt *")).exposed_params[0].mapping.kind == MappedKind.WRAPPED_CLASS
+
+
+def test_inputs_cannot_change_in_place() -> None:
+    config = MappingConfig(prefix="OCC_").with_rule(RULE)
+    mapper = TypeMapper({"gp_Pnt": "OCC_gp_Pnt"}, config=config)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.prefix = "X_"  # type: ignore[misc]
+    with pytest.raises(TypeError):
+        config.custom_rules["Other"] = RULE  # type: ignore[index]
+    with pytest.raises(TypeError):
+        mapper.known_wrapped["::Other"] = "OCC_Other"  # type: ignore[index]
+    assert RULE.pre_call_lines == ("// convert",)
+
+
+def test_config_pickles() -> None:
+    config = MappingConfig(prefix="OCC_", enable_std_string=False).with_rule(RULE)
+    assert pickle.loads(pickle.dumps(config)) == config
+
+
+def test_typedef_of_const_char_pointer_maps_to_string() -> None:
+    cstring = _pointer("Standard_CString", CONST_CHAR)
+    assert pointer_target(cstring).kind is PointeeKind.CHAR and pointer_target(cstring).is_const
+
+    mapped = TypeMapper({}, config=MappingConfig(prefix="OCC_")).map_method(ClassInfo(name="Holder"), _method(cstring))
+    assert mapped.exposed_params[0].mapping.exposed_spelling == "godot::String"
+
+
+def test_pointers_to_pointers_are_not_bridged() -> None:
+    holder = ClassInfo(name="Holder")
+    mapper = TypeMapper({"gp_Pnt": "OCC_gp_Pnt"}, config=MappingConfig(prefix="OCC_"))
+    char_pp = _pointer("char **", _pointer("char *", CHAR))
+    int_pp = _pointer("int **", _pointer("int *", CppType.interned("int", kind="INT")))
+    pnt_pp = _pointer("gp_Pnt **", _pointer("gp_Pnt *", GP_PNT))
+
+    assert pointer_target(char_pp) is None
+    for t in (char_pp, int_pp, pnt_pp):
+        assert not mapper.map_method(holder, _method(t)).supported, t.spelling
+    # The single-level forms are still mapped
+    assert mapper.map_method(holder, _method(_pointer("gp_Pnt *", GP_PNT))).exposed_params[0].mapping.kind == MappedKind.WRAPPED_CLASS
+    assert mapper.map_method(holder, _method(_pointer("char *", CHAR))).exposed_params[0].mapping.exposed_spelling == "intptr_t"
+
+
+def test_unstructured_types_fall_back_to_the_spelling() -> None:
+    assert pointer_target(CppType.from_spelling("char const *")).kind is PointeeKind.CHAR
+    assert pointer_target(CppType.from_spelling("double *")).kind is PointeeKind.PRIMITIVE
+    assert pointer_target(CppType.from_spelling("gp_Pnt &")) is None